@@ -42,9 +42,18 @@ Some modules may have dependencies on external libraries.
 Refer to the module documentation for details.
 """
 
+# Include built-in packages and modules.
+from argparse import ArgumentParser, Namespace
+from multiprocessing import freeze_support
+
+# Include internal typings.
+from typing import Any
+
 # Include custom packages and modules.
-from src.app.home._class.oojda_control_panel.oojda_control_panel import OojdaControlPanel
-from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+# Only the startup profiler (standard library only) is imported at module level,
+# every other src.app module is imported inside start_engine_oojda_main(),
+# so --profile-startup can record all of them.
+from src.app.utility.handler._class.startup_profiler.startup_profiler import StartupProfiler
 
 # Include Metadata.
 __author__ = "Reginald Sahil Chand"
@@ -59,6 +68,153 @@ __copyright__ = "Copyright 2024, Reginald Sahil Chand"
 __status__ = "Development"
 
 
+def _parse_launch_arguments() -> Namespace:
+    """Parse the optional command line arguments.
+
+    Returns:
+        - Namespace: The parsed launch arguments.
+    """
+
+    argument_parser: ArgumentParser = ArgumentParser(
+        description="Orbital Orion Julie Desktop Assistant")
+
+    argument_parser.add_argument(
+        "--profile-startup", action="store_true",
+        help="Record the wall time and allocations of every src.app import and launch "
+        "sequence constructor, and write them as a table and as JSON once Julie is online.")
+    argument_parser.add_argument(
+        "--replay", default="", metavar="WAV_FILE",
+        help="Run headless from a recorded 16 or 32 bit WAV file instead of the microphone. "
+        "Use - to read raw 16 bit mono PCM from the standard input. Julie's answers are printed.")
+    argument_parser.add_argument(
+        "--replay-sample-rate", default=16000, type=int, metavar="HERTZ",
+        help="The sample rate of the raw PCM read by --replay -.")
+    argument_parser.add_argument(
+        "--replay-realtime", action="store_true",
+        help="Replay the WAV file at the speed it was recorded, instead of as fast as possible.")
+    argument_parser.add_argument(
+        "--hedge-recognizer", action="append", default=[], metavar="SPEECH_RECOGNIZER",
+        help="Race this speech recognizer (such as sphinx_speech_recognizer) against the Google "
+        "one, the first non-empty result wins. Can be given more than once.")
+    argument_parser.add_argument(
+        "--hedge-delay", default=0.75, type=float, metavar="SECONDS",
+        help="How long a speech recognizer may take before the next hedge recognizer fires.")
+    argument_parser.add_argument(
+        "--stream-partials", action="store_true",
+        help="Recognize commands while they are being spoken, and act on them as soon as "
+        "they are unambiguous. Sends the growing utterance to Google every 0.4 seconds.")
+    argument_parser.add_argument(
+        "--stream-transcript", default="", metavar="TRANSCRIPT_FILE",
+        help="Stream the partial hypotheses of the commands from a text file instead, one line "
+        "per command, revealed at speaking speed. For timing the early dispatch with --replay.")
+    argument_parser.add_argument(
+        "--no-wake-gate", action="store_true",
+        help="Send every utterance of the wake word loop to the speech recognizer, without "
+        "checking it against the enrolled wake word templates first.")
+    argument_parser.add_argument(
+        "--reset-wake-gate", action="store_true",
+        help="Forget the enrolled wake word templates, they are learned again from the next "
+        "wake words. Use it after changing the microphone or the user.")
+    argument_parser.add_argument(
+        "--offline-commands", action="store_true",
+        help="Recognize the fixed commands (wake words, \"who are you\", \"open <app>\") "
+        "offline once Julie has learned them, and everything else with Google.")
+    argument_parser.add_argument(
+        "--half-duplex-tail", default=0.3, type=float, metavar="SECONDS",
+        help="How long after Julie stops speaking the captured audio is still treated as "
+        "her own voice, and is not sent to the speech recognizer.")
+    argument_parser.add_argument(
+        "--echo-suppression", action="store_true",
+        help="Subtract Julie's own voice (the audio she plays) from the microphone audio "
+        "captured while she speaks. Helps with loudspeakers, and talking over Julie.")
+    argument_parser.add_argument(
+        "--warm-tts-cache", action="store_true",
+        help="Render Julie's fixed prompts and apologies into the speech audio cache and exit, "
+        "so they play from PCM from the first launch on. Run it once after installing.")
+    argument_parser.add_argument(
+        "--profile-compare", default="", metavar="PREVIOUS_PROFILE_JSON",
+        help="Compare the startup profile against the JSON profile of a previous version.")
+
+    return argument_parser.parse_args()
+
+def _create_set_speech_recognizer(launch_arguments: Namespace) -> Any:
+    """Create the speech recognizer the launch arguments ask for.
+
+    - --replay captures from a recording instead of the microphone, and prints Julie's answers.
+    - --hedge-recognizer races more speech recognizers against the Google one.
+    - --stream-partials and --stream-transcript act on commands while they are being spoken.
+    - --half-duplex-tail and --echo-suppression keep Julie from hearing her own voice.
+
+    Args:
+        - launch_arguments (Namespace): The parsed launch arguments.
+
+    Returns:
+        - Any: The configured SetSpeechRecognizer.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from src.app.home._class.start.sr_ware_house._internals.set_speech_recognizer\
+        import SetSpeechRecognizer
+    from src.app.utility.handler._class.text_to_speech.text_to_speech import TextToSpeech
+    from src.app.utility.handler._class.half_duplex_gate.half_duplex_gate import HalfDuplexGate
+    from src.app.utility.handler._class.audio_source.audio_source import\
+        (MicrophoneAudioSource, PcmStreamAudioSource, WaveFileAudioSource, )
+    from src.app.utility.handler._class.streaming_speech_recognizer\
+        .streaming_speech_recognizer import\
+        (PrefixStreamingSpeechRecognizer, ScriptedStreamingSpeechRecognizer, )
+
+    audio_source: Any = MicrophoneAudioSource()
+
+    if launch_arguments.replay == "-":
+        audio_source = PcmStreamAudioSource(pcm_sample_rate=launch_arguments.replay_sample_rate)
+
+    elif launch_arguments.replay:
+        audio_source = WaveFileAudioSource(file_path=launch_arguments.replay,
+                                           is_realtime=launch_arguments.replay_realtime)
+
+    streaming_speech_recognizer: Any = None
+
+    if launch_arguments.stream_transcript:
+        with open(launch_arguments.stream_transcript, "r", encoding="utf-8") as transcript_file:
+            streaming_speech_recognizer = ScriptedStreamingSpeechRecognizer(
+                transcripts=[line.strip() for line in transcript_file if line.strip()])
+
+    elif launch_arguments.stream_partials:
+        streaming_speech_recognizer = PrefixStreamingSpeechRecognizer()
+
+    TextToSpeech.is_headless = bool(launch_arguments.replay)
+    HalfDuplexGate.tail_seconds = launch_arguments.half_duplex_tail
+    HalfDuplexGate.is_echo_suppression_enabled = launch_arguments.echo_suppression
+    SetSpeechRecognizer.hedge_delay_seconds = launch_arguments.hedge_delay
+
+    return SetSpeechRecognizer(
+        _audio_source=audio_source,
+        _hedge_speech_recognizers=tuple(launch_arguments.hedge_recognizer),
+        _streaming_speech_recognizer=streaming_speech_recognizer)
+
+def _configure_wake_word_gate(launch_arguments: Namespace) -> None:
+    """Disable or reset the local wake word gate, if the launch arguments ask for it."""
+
+    # pylint: disable=import-outside-toplevel
+    from src.app.home._class.start.sr_ware_house._internals.wake_word_gate import WakeWordGate
+
+    WakeWordGate.is_enabled = not launch_arguments.no_wake_gate
+
+    if launch_arguments.reset_wake_gate:
+        WakeWordGate().reset_wake_word_templates()
+
+def _warm_speech_audio_cache() -> None:
+    """Render the fixed prompt phrases into the speech audio cache, and report how it went."""
+
+    # pylint: disable=import-outside-toplevel
+    from src.app.utility.handler._class.text_to_speech.text_to_speech import TextToSpeech
+    from src.app.utility.data._module.prompt_phrases import prompt_phrases_to_prerender
+
+    failed_renders: int = TextToSpeech().prerender_speech(texts=prompt_phrases_to_prerender)
+
+    print(f"Speech audio cache warmed: {len(prompt_phrases_to_prerender) - failed_renders} of "
+          f"{len(prompt_phrases_to_prerender)} prompt phrases rendered.")
+
 def start_engine_oojda_main() -> None:
     """Start the main program flow.
 
@@ -69,13 +225,46 @@ def start_engine_oojda_main() -> None:
 
     Note:
     - This function does not and must not take any arguments.
+    - Optional command line arguments are parsed from sys.argv instead.
     - This function must also not return any value.
     
     Returns None
     """
 
+    launch_arguments: Namespace = _parse_launch_arguments()
+
+    if launch_arguments.warm_tts_cache:
+        _warm_speech_audio_cache()
+
+        return
+
+    # Instantiate StartupProfiler.
+    startup_profiler: StartupProfiler = StartupProfiler(_version=__version__)
+
+    if launch_arguments.profile_startup:
+        startup_profiler.start_profiling()
+
+    # pylint: disable=import-outside-toplevel
+    # The startup timer is imported first, so the module imports are part of the startup report.
+    from src.app.utility.handler._class.startup_timer.startup_timer import STARTUP_TIMER
+    from src.app.home._class.oojda_control_panel import oojda_control_panel
+    from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+
+    if launch_arguments.profile_startup:
+        startup_profiler.profile_constructors(classes=(
+            oojda_control_panel.NotificationHandler,
+            oojda_control_panel.WelcomeScreen,
+            oojda_control_panel.UserInformation,
+            oojda_control_panel.SetSpeechRecognizer,
+            oojda_control_panel.SRWareHouse))
+
+        STARTUP_TIMER.add_ready_callback(lambda: print(startup_profiler.create_profile_report(
+            phase_durations=STARTUP_TIMER.get_phase_durations(),
+            previous_profile_path=launch_arguments.profile_compare)))
+
     # Instantiate OojdaControlPanel.
-    oojda_controller: OojdaControlPanel = OojdaControlPanel()
+    oojda_controller: oojda_control_panel.OojdaControlPanel = (
+        oojda_control_panel.OojdaControlPanel())
 
     # Instantiate LogHandler.
     log_handler: LogHandler = LogHandler()
@@ -88,8 +277,24 @@ Julie Has Been Terminated.
 """
 
     try:
-        oojda_controller.initiate_oojda_launch_sequence()
-        oojda_controller.initiate_oojda_launch_service()
+        _configure_wake_word_gate(launch_arguments=launch_arguments)
+
+        set_speech_recognizer: Any = _create_set_speech_recognizer(
+            launch_arguments=launch_arguments)
+
+        speech_recognizer: str = ("offline_command_speech_recognizer"
+                                  if launch_arguments.offline_commands
+                                  else "google_speech_recognizer")
+
+        if launch_arguments.replay:
+            oojda_controller.initiate_oojda_replay(set_speech_recognizer=set_speech_recognizer,
+                                                   speech_recognizer=speech_recognizer)
+
+        else:
+            oojda_controller.initiate_oojda_launch_sequence(
+                set_speech_recognizer=set_speech_recognizer,
+                speech_recognizer=speech_recognizer)
+            oojda_controller.initiate_oojda_launch_service()
 
     except SystemError as system_error:
         print(_system_error_message, system_error)
@@ -105,4 +310,6 @@ Julie Has Been Terminated.
 
 
 if __name__ == "__main__":
+    # The recognition worker processes are spawned from the packaged executable too.
+    freeze_support()
     start_engine_oojda_main()
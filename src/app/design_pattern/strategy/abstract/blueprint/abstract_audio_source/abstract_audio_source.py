@@ -0,0 +1,102 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+abstract_audio_source.py:
+=========================
+Acts as a blueprint for the audio sources the listening pipeline captures from.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+# Include internal typings.
+from typing import Any
+
+
+@dataclass
+class AbstractAudioSource(ABC):
+    """An abstract base class for mono PCM audio sources.
+
+    - An audio source is opened and closed with a with statement, like a Microphone.
+    - read_chunk returns an empty chunk once the source has ended.
+    """
+
+    @property
+    @abstractmethod
+    def source_name(self) -> str:
+        """A name that tells the sources apart, such as: microphone."""
+
+    @property
+    @abstractmethod
+    def sample_rate(self) -> int:
+        """The number of samples per second."""
+
+    @property
+    @abstractmethod
+    def sample_width(self) -> int:
+        """The number of bytes per sample."""
+
+    @property
+    @abstractmethod
+    def is_live(self) -> bool:
+        """True if the audio arrives in real time and cannot wait for the consumers.
+
+        - Live audio is calibrated and may be dropped when the consumers fall behind,
+        recorded audio is replayed as fast as the consumers can keep up, without dropping any.
+        """
+
+    @abstractmethod
+    def open_audio_source(self) -> None:
+        """Open the audio source, before the first chunk is read.
+
+        Returns:
+            - None.
+        """
+
+    @abstractmethod
+    def read_chunk(self) -> bytes:
+        """Read the next chunk of PCM frames.
+
+        Returns:
+            - bytes: The PCM frames, empty once the source has ended.
+        """
+
+    @abstractmethod
+    def close_audio_source(self) -> None:
+        """Close the audio source.
+
+        Returns:
+            - None.
+        """
+
+    def __enter__(self) -> "AbstractAudioSource":
+        self.open_audio_source()
+
+        return self
+
+    def __exit__(self, *exception_info: Any) -> None:
+        self.close_audio_source()
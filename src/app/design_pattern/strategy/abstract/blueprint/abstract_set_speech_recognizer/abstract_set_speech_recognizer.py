@@ -10,6 +10,13 @@ abstract_set_speech_recognizer.py:
 Acts as a blueprint for the SetSpeechRecognizer class.
 sr equals Speech Recognition.
 
+Overview:
+=========
+- create_speech_recognizer runs a single speech recognizer, synchronously.
+- create_hedged_speech_recognizer races several speech recognizers on the same audio,
+the next one only fires if the previous one is slow (or failed), the first non-empty
+result wins and the others are abandoned. This cuts the tail latency of the cloud recognizer.
+
 Guidelines:
 ===========
 Import Statement Guidelines:
@@ -33,12 +40,33 @@ Refer to the module documentation for details.
 # Include built-in packages and modules.
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import perf_counter
 
 # Include internal typings.
-from typing import Dict, Any, Callable, List
+from typing import Dict, Any, Callable, List, Set, Tuple
 
 # Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
 from src.app.utility.helper._module.speech_recognizer.google import google_speech_recognizer
+from src.app.utility.helper._module.speech_recognizer.sphinx import sphinx_speech_recognizer
+from src.app.utility.helper._module.speech_recognizer.offline_command\
+    import offline_command_speech_recognizer
+
+
+@dataclass
+class _DeferredTextToSpeech:
+    """Collects the error messages of a hedged speech recognizer, instead of speaking them.
+
+    - Only if every hedged speech recognizer fails, the collected messages are spoken.
+    """
+
+    messages: List[str] = field(default_factory=lambda: [])
+
+    def create_text_to_speech(self, text_to_produce_speech: str) -> None:
+        """Collect the message instead of speaking it."""
+
+        self.messages.append(text_to_produce_speech)
 
 
 @dataclass
@@ -48,8 +76,18 @@ class AbstractSetSpeechRecognizer(ABC):
     _supported_speech_recognizer: Dict[str, Callable[..., (str | Any)]] =  field(
         default_factory=lambda: {
         "google_speech_recognizer": google_speech_recognizer.google_speech_recognizer,
+        "sphinx_speech_recognizer": sphinx_speech_recognizer.sphinx_speech_recognizer,
+        "offline_command_speech_recognizer":
+            offline_command_speech_recognizer.offline_command_speech_recognizer,
     })
 
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Runs the hedged speech recognizers, the threads are only started when first needed.
+    _hedge_executor: ThreadPoolExecutor = field(default_factory=lambda: ThreadPoolExecutor(
+        max_workers=4, thread_name_prefix="oojda-speech-recognizer"))
+
     def __post_init__(self):
         self._supported_speech_recognizer_types: List[str] = (
             list(k for k in self._supported_speech_recognizer))
@@ -114,3 +152,157 @@ class AbstractSetSpeechRecognizer(ABC):
             return query
 
         return None
+
+    def create_hedged_speech_recognizer(self, **kwargs) -> str:
+        """Races several speech recognizers on the same audio, the first non-empty result wins.
+
+        - The first speech recognizer fires right away, every next one only fires if none of
+        the earlier ones has answered within hedge_delay seconds, or if they all failed.
+        - Speech recognizers that lose the race are abandoned, a running request cannot be
+        interrupted, but its result and its error messages are ignored.
+
+        KwArgs:
+            - speech_recognizers (Tuple[str, ...]): The speech recognizer names, in order.
+            - hedge_delay (float): How many seconds to wait before firing the next one.
+            - recognition_timeout (float): How many seconds to wait for any result at all.
+            - recognizer (Any): The recognizer object used for speech recognition.
+            - audio (Any): The audio input to be recognized.
+            - text_to_speech_handler (Any): The handler for converting text to speech.
+            - should_announce_error_message (bool): Announce if every speech recognizer failed.
+
+        Returns:
+            - str: The first non-empty recognized voice input, empty if every one failed.
+
+        Raises:
+            - TypeError: if a speech recognizer is not supported.
+        """
+
+        speech_recognizers: Tuple[str, ...] = kwargs.get("speech_recognizers", ())
+        text_to_speech_handler: Any = kwargs.get("text_to_speech_handler", None)
+
+        for speech_recognizer in speech_recognizers:
+            if speech_recognizer not in self._supported_speech_recognizer:
+                raise TypeError(
+                    f"Alert: The type {speech_recognizer} is not supported.\n"
+                    f"Supported types are {self._supported_speech_recognizer_types}")
+
+        deferred_text_to_speech: List[_DeferredTextToSpeech] = [
+            _DeferredTextToSpeech() for _ in speech_recognizers]
+
+        query: str = self._race_hedged_speech_recognizers(
+            deferred_text_to_speech=deferred_text_to_speech, **kwargs)
+
+        if query:
+            return query
+
+        # Every speech recognizer failed, announce why once, in the words of the first one.
+        if kwargs.get("should_announce_error_message", False) and text_to_speech_handler:
+            for deferred in deferred_text_to_speech:
+                if deferred.messages:
+                    text_to_speech_handler.create_text_to_speech(
+                        text_to_produce_speech=deferred.messages[0])
+                    break
+
+        return ""
+
+    def _race_hedged_speech_recognizers(
+            self, deferred_text_to_speech: List[_DeferredTextToSpeech], **kwargs) -> str:
+        """Fire the speech recognizers one hedge delay apart, until one returns a query.
+
+        Returns:
+            - str: The first non-empty query, empty if every one failed or timed out.
+        """
+
+        speech_recognizers: Tuple[str, ...] = kwargs.get("speech_recognizers", ())
+        hedge_delay: float = kwargs.get("hedge_delay", 0.75)
+        recognition_timeout: float = kwargs.get("recognition_timeout", 10.0)
+
+        # Every running speech recognizer, and its name.
+        pending_futures: Dict[Future, str] = {}
+
+        started_at: float = perf_counter()
+        deadline: float = started_at + recognition_timeout
+        next_index: int = 0
+
+        while next_index < len(speech_recognizers) or pending_futures:
+            if next_index < len(speech_recognizers):
+                future: Future = self._hedge_executor.submit(
+                    self._supported_speech_recognizer[speech_recognizers[next_index]],
+                    recognizer=kwargs.get("recognizer", None),
+                    audio=kwargs.get("audio", None),
+                    text_to_speech_handler=deferred_text_to_speech[next_index],
+                    should_announce_error_message=True)
+
+                pending_futures[future] = speech_recognizers[next_index]
+                next_index += 1
+
+            wait_timeout: float = deadline - perf_counter()
+
+            if next_index < len(speech_recognizers):
+                wait_timeout = min(wait_timeout, hedge_delay)
+
+            done_futures, _ = wait(tuple(pending_futures), timeout=max(0.0, wait_timeout),
+                                   return_when=FIRST_COMPLETED)
+
+            query: str = self._select_hedged_query(done_futures=done_futures,
+                                                   pending_futures=pending_futures,
+                                                   started_at=started_at)
+
+            if query:
+                self._cancel_hedged_futures(pending_futures=pending_futures)
+
+                return query
+
+            if perf_counter() >= deadline:
+                self._cancel_hedged_futures(pending_futures=pending_futures)
+                self._log_handler.create_log(
+                    log_type="warning",
+                    log_message=(f"Hedged speech recognition timed out after "
+                                 f"{recognition_timeout} seconds."))
+                break
+
+        return ""
+
+    def _select_hedged_query(self, done_futures: Set[Future],
+                             pending_futures: Dict[Future, str], started_at: float) -> str:
+        """Take the finished speech recognizers out of the race, and return the first query.
+
+        Returns:
+            - str: The first non-empty query, empty if none of them returned one.
+        """
+
+        for done_future in done_futures:
+            speech_recognizer: str = pending_futures.pop(done_future)
+            query: str = self._get_hedged_query(future=done_future,
+                                                speech_recognizer=speech_recognizer)
+
+            if query.strip():
+                self._log_handler.create_log(
+                    log_type="info",
+                    log_message=(f"Hedged speech recognition won by {speech_recognizer} in "
+                                 f"{(perf_counter() - started_at) * 1000:.0f} ms."))
+
+                return query
+
+        return ""
+
+    def _cancel_hedged_futures(self, pending_futures: Dict[Future, str]) -> None:
+        """Abandon the speech recognizers that lost the race, the queued ones never start."""
+
+        for pending_future in pending_futures:
+            pending_future.cancel()
+
+        pending_futures.clear()
+
+    def _get_hedged_query(self, future: Future, speech_recognizer: str) -> str:
+        """Return the result of a finished hedged speech recognizer, empty if it raised."""
+
+        try:
+            return future.result() or ""
+
+        except Exception as err: # pylint: disable=broad-exception-caught
+            self._log_handler.create_log(
+                log_type="warning",
+                log_message=f"Hedged speech recognizer {speech_recognizer} failed. {err}")
+
+            return ""
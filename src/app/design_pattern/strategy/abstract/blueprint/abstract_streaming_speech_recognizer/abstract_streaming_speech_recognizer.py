@@ -0,0 +1,76 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+abstract_streaming_speech_recognizer.py:
+========================================
+Acts as a blueprint for the speech recognizers that guess the words while they are being spoken.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass
+class AbstractStreamingSpeechRecognizer(ABC):
+    """An abstract base class for streaming speech recognizers.
+
+    - A stream is started for every utterance, and updated with the audio spoken so far.
+    - Updates must never block the caller, they return the newest partial hypothesis.
+    - The final transcript still comes from the chosen (batch) speech recognizer.
+    """
+
+    @abstractmethod
+    def start_stream(self, sample_rate: int, sample_width: int) -> None:
+        """Start the stream of a new utterance, the previous stream is stopped.
+
+        Args:
+            - sample_rate (int): The sample rate of the audio that follows.
+            - sample_width (int): The number of bytes per sample.
+
+        Returns:
+            - None.
+        """
+
+    @abstractmethod
+    def update_stream(self, frame_data: memoryview) -> str:
+        """Update the stream with the audio spoken so far, without blocking.
+
+        Args:
+            - frame_data (memoryview): All the PCM frames of the utterance so far,
+            it is only valid during the call.
+
+        Returns:
+            - str: The newest partial hypothesis, empty if there is none yet.
+        """
+
+    @abstractmethod
+    def stop_stream(self) -> None:
+        """Stop the stream, pending partial hypotheses are dropped.
+
+        Returns:
+            - None.
+        """
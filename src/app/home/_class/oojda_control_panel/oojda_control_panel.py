@@ -54,27 +54,41 @@ from src.app.utility.handler._class.notification_handler.notification_handler\
 from src.app.home._class.screen.welcome_screen.welcome_screen import WelcomeScreen
 from src.app.home._class.user_information.user_information import UserInformation
 from src.app.home._class.start.sr_ware_house.sr_ware_house import SRWareHouse
+from src.app.home._class.start.sr_ware_house._internals.set_speech_recognizer\
+    import SetSpeechRecognizer
+from src.app.utility.handler._class.startup_timer.startup_timer import STARTUP_TIMER
 
 
 @dataclass
 class OojdaControlPanel:
     """Class to control the launch initiation for oojda_launch_sequence and oojda_launch_service.
     
-    - This class houses 2 static methods:
+    - This class houses 3 static methods:
     - initiate_oojda_launch_sequence.
     - initiate_oojda_launch_service.
+    - initiate_oojda_replay.
     - Which are responsible to initiate the required packages and services.
     """
 
     @staticmethod
-    def initiate_oojda_launch_sequence() -> None:
+    def initiate_oojda_launch_sequence(
+            set_speech_recognizer: (SetSpeechRecognizer | None) = None,
+            speech_recognizer: str = "google_speech_recognizer") -> None:
         """Initiate the launch sequence for all required packages, modules, and methods
         in sequence.
 
         - The sequence must not be changed to avoid unwanted behavior.
         - Remember do not play with the space shuttle launch sequencer in the middle of launch.
+
+        Args:
+            - set_speech_recognizer (SetSpeechRecognizer | None): A configured speech recognizer,
+            such as one with hedge speech recognizers, defaults to the microphone with Google.
+            - speech_recognizer (str): The speech recognizer name, defaults to Google.
         """
 
+        # Everything imported before the launch sequence starts.
+        STARTUP_TIMER.mark_phase("module_imports")
+
         # Instantiate classes.
         notification_handler: NotificationHandler =  NotificationHandler()
         notification_handler.create_notification(
@@ -83,16 +97,44 @@ class OojdaControlPanel:
             app_name="Orbital Orion Julie Desktop Assistant",
             timeout=10)
 
+        STARTUP_TIMER.mark_phase("notification")
+
         welcome_screen: WelcomeScreen = WelcomeScreen()
         welcome_screen.create_welcome_screen()
 
+        STARTUP_TIMER.mark_phase("welcome_screen")
+
         user_information: UserInformation = UserInformation()
         user_information.create_user_information()
 
-        initiate_speech_recognition: SRWareHouse = SRWareHouse()
+        STARTUP_TIMER.mark_phase("user_information")
+
+        # The remaining phases are marked by SRWareHouse, up until Julie is online.
+        initiate_speech_recognition: SRWareHouse = SRWareHouse(
+            _set_speech_recognizer=set_speech_recognizer or SetSpeechRecognizer())
         initiate_speech_recognition.initiate_speech_recognition(
-            speech_recognizer="google_speech_recognizer")
+            speech_recognizer=speech_recognizer)
 
     @staticmethod
     def initiate_oojda_launch_service() -> None:
         """Currently no launch services are identified."""
+
+    @staticmethod
+    def initiate_oojda_replay(set_speech_recognizer: SetSpeechRecognizer,
+                              speech_recognizer: str = "google_speech_recognizer") -> None:
+        """Run the wake word, command and response loop headless, from recorded audio.
+
+        - The notification, welcome screen and user information are skipped,
+        they need a desktop and a keyboard.
+        - Returns once the recorded audio has ended.
+
+        Args:
+            - set_speech_recognizer (SetSpeechRecognizer): The speech recognizer that captures
+            from the recorded audio source.
+            - speech_recognizer (str): The speech recognizer name, defaults to Google.
+        """
+
+        initiate_speech_recognition: SRWareHouse = SRWareHouse(
+            _set_speech_recognizer=set_speech_recognizer)
+        initiate_speech_recognition.initiate_speech_recognition(
+            speech_recognizer=speech_recognizer)
@@ -9,6 +9,15 @@ initiate_julie.py:
 ==================
 This file contains a function to initiate julie.
 
+Overview:
+=========
+- Every query is routed by the IntentRouter, compiled once from the declared intents,
+and handed to the handler of its intent. Queries without an intent go to Gemini.
+- The local skills (time, date, arithmetic, unit conversion and timers) are intents too,
+they are answered on this machine before anything reaches Gemini.
+- A query a character or two off a fixed command phrase ("good by") is corrected first.
+Mission control knows where every call goes.
+
 Guidelines:
 ===========
 Import Statement Guidelines:
@@ -29,20 +38,78 @@ Some modules may have dependencies on external libraries.
 Refer to the module documentation for details.
 """
 
-# Include built-in packages and modules.
-import sys
-from time import sleep
-
 # Include internal typings.
-from typing import Any
+from typing import Any, Tuple
 
 # Include custom packages and modules.
-from src.app.utility.data._module.wake_words import wake_words_to_self_describe,\
-    wake_words_to_exit_program
-from src.app.utility.helper._module.app_opener.app_opener import open_application
-from src.app.utility.helper._module.artificial_intelligence.googles_gemini_ai.gemini_ai\
-    import initiate_gemini_ai
+from src.app.utility.data._module.plugin_catalogue import PLUGIN_CATALOGUE
+from src.app.utility.data._module.prompt_phrases import CANNOT_HELP_APOLOGY
+from src.app.utility.handler._class.intent_router.intent_router import IntentMatch
+from src.app.utility.handler._class.plugin_registry.plugin_registry import PluginRegistry
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# A partial application name must be at least this long to be resolved early.
+_MIN_PARTIAL_APPLICATION_NAME_LENGTH: int = 3
+
+
+def _create_plugin_registry() -> PluginRegistry:
+    """Register every plugin of the catalogue, only their phrases are compiled."""
+
+    plugin_registry: PluginRegistry = PluginRegistry()
+
+    for plugin in PLUGIN_CATALOGUE:
+        plugin_registry.register_plugin(plugin=plugin)
+
+    return plugin_registry
+
+SERVICE_LOADER.register_service("plugin_registry", _create_plugin_registry)
+
+
+def resolve_partial_query(partial_query: str) -> (str | None):
+    """Resolve a partial hypothesis into the full query, once it can only mean one thing.
+
+    - "bye" or "exit" are complete exit phrases, and every longer phrase they start
+    ("exit program") exits too.
+    - "open spot" is resolved to "open spotify" if it is the only installed application
+    whose name starts with "spot".
+
+    Args:
+        - partial_query (str): The lower case partial hypothesis, possibly ending mid word.
+
+    Returns:
+        - str | None: The full query, None while the partial hypothesis is still ambiguous.
+    """
 
+    partial_query = partial_query.strip()
+    plugin_registry: PluginRegistry = SERVICE_LOADER.get_service("plugin_registry")
+
+    if plugin_registry.intent_router.match_unambiguous_phrase(query=partial_query) is not None:
+        return partial_query
+
+    intent_match: (IntentMatch | None) = plugin_registry.intent_router.match_intent(
+        query=partial_query, should_validate_slots=False)
+
+    if intent_match is None or intent_match.intent_name != "open_application":
+        return None
+
+    partial_application_name: str = intent_match.slots["application_name"]
+
+    if len(partial_application_name) < _MIN_PARTIAL_APPLICATION_NAME_LENGTH:
+        return None
+
+    # pylint: disable=import-outside-toplevel
+    from src.app.utility.helper._module.app_opener.app_opener import\
+        get_installed_application_names
+
+    matching_application_names: Tuple[str, ...] = tuple(
+        application_name for application_name in get_installed_application_names()
+        if application_name.startswith(partial_application_name))
+
+    if len(matching_application_names) == 1:
+        return f"open {matching_application_names[0]}"
+
+    return None
 
 def initiate_julie(speech_recognizer: str,
                    set_speech_recognizer: Any,
@@ -61,34 +128,17 @@ def initiate_julie(speech_recognizer: str,
     """
 
     _use_ai: bool = True
+    plugin_registry: PluginRegistry = SERVICE_LOADER.get_service("plugin_registry")
 
     while True:
+        # While streaming, a command is acted on as soon as it is unambiguous.
         query = set_speech_recognizer.initiate_speech_recognition(
-            speech_recognizer=speech_recognizer)
-
-        sleep(1)
+            speech_recognizer=speech_recognizer,
+            resolve_partial_query=resolve_partial_query)
 
         if query.strip():
-            if (query in f"open {query[5::]}" or query in f"go to {query[6::]}"):
-                open_application(query=query,
-                text_to_speech_handler=text_to_speech_handler)
-
-            elif query in wake_words_to_self_describe:
-                text_to_speech_handler.create_text_to_speech(
-                    text_to_produce_speech=(
-                        "I'm Julie, a desktop assistant created by Reginald Chand!"
-                        "He created me as a personal project."))
-
-            elif query in wake_words_to_exit_program:
-                text_to_speech_handler.create_text_to_speech(
-                    text_to_produce_speech=(
-                        "Thank you for using my service. Exiting Program. Take Care!"))
-                sys.exit(0)
-
-            elif _use_ai:
-                initiate_gemini_ai(prompt=query, text_to_speech_handler=text_to_speech_handler)
-
-            else:
+            if not plugin_registry.handle_query(query=query,
+                                                text_to_speech_handler=text_to_speech_handler,
+                                                should_use_fallback=_use_ai):
                 text_to_speech_handler.create_text_to_speech(
-                text_to_produce_speech=(
-                    "Sorry! I cant help you with this. Please try something else!"))
+                text_to_produce_speech=CANNOT_HELP_APOLOGY)
@@ -0,0 +1,599 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+listening_pipeline.py:
+======================
+This file contains a class that keeps one audio source open in a background capture thread
+and pushes every captured utterance into a bounded queue.
+
+Overview:
+=========
+- The capture thread opens the audio source once and keeps reading PCM chunks into a
+preallocated AudioRingBuffer, also while the consumers are busy recognizing or speaking.
+- Live audio (the microphone) never waits for the consumers, recorded audio is replayed
+one utterance ahead of the consumers, so nothing is dropped and the replay ends cleanly.
+- Speech is found and utterances are closed by the VoiceActivityDetector, utterances are
+cut out of the ring buffer as zero copy slices, including a short pre-roll before the speech.
+- Consumers block on the queue and react the moment an utterance arrives, there is no
+fixed sleep anywhere in the loop.
+- Every utterance logs its endpoint latency (the pause until it was closed) and every
+turn records its latency from that moment until the query is ready to be acted upon,
+so the dead time can be verified from the logs.
+- While Julie speaks, every chunk also goes to the BargeInDetector. If the user talks over
+her she is interrupted, and the utterance she was interrupted by is kept as the next query.
+- Chunks captured while Julie speaks (and for a short tail after) are gated by the
+HalfDuplexGate, which can also subtract her echo from them. An utterance captured mostly
+while gated is Julie's own voice, it is dropped before it reaches the speech recognizer.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from collections import deque
+from dataclasses import dataclass, field
+from queue import Empty, Full, Queue
+from threading import Event, Thread
+from time import perf_counter
+
+# Include internal typings.
+from typing import ClassVar, Deque, List
+
+# Include external packages and modules.
+from speech_recognition import AudioData # type: ignore
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.audio_ring_buffer.audio_ring_buffer import AudioRingBuffer
+from src.app.utility.handler._class.barge_in_detector.barge_in_detector import BargeInDetector
+from src.app.utility.handler._class.half_duplex_gate.half_duplex_gate import HalfDuplexGate
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.handler._class.voice_activity_detector.voice_activity_detector import\
+    (SpeechSegment, VoiceActivityDetector, )
+from src.app.design_pattern.strategy.abstract.blueprint.abstract_audio_source\
+    .abstract_audio_source import AbstractAudioSource
+
+
+@dataclass(frozen=True)
+class Utterance:
+    """A single captured utterance and the moments it started and ended."""
+
+    # Zero copy view into the capture ring buffer.
+    frame_data: memoryview
+    sample_rate: int
+    sample_width: int
+
+    # Absolute ring buffer position of the utterance.
+    start_position: int
+    ring_buffer: AudioRingBuffer
+
+    started_at: float
+    captured_at: float
+
+    @property
+    def end_position(self) -> int:
+        """The absolute ring buffer position right after the utterance."""
+
+        return self.start_position + len(self.frame_data)
+
+    @property
+    def audio(self) -> AudioData:
+        """The utterance as AudioData, the frames are copied out of the ring buffer here."""
+
+        return AudioData(bytes(self.frame_data), self.sample_rate, self.sample_width)
+
+    @property
+    def duration(self) -> float:
+        """The utterance duration in seconds."""
+
+        return len(self.frame_data) / (self.sample_rate * self.sample_width)
+
+    def is_available(self) -> bool:
+        """Check if the ring buffer has not overwritten the utterance yet."""
+
+        return self.ring_buffer.is_available(start_position=self.start_position,
+                                             end_position=self.end_position)
+
+
+@dataclass
+class _CaptureState:
+    """The capture thread, and what it has found out about the audio source."""
+
+    thread: (Thread | None) = None
+    stop_event: Event = field(default_factory=Event)
+    ring_buffer: (AudioRingBuffer | None) = None
+    voice_activity_detector: (VoiceActivityDetector | None) = None
+
+    # Set by the capture thread from the audio source it captures from.
+    is_live: bool = True
+    has_ended: bool = False
+    bytes_per_second: int = 32000
+
+
+@dataclass
+class _DiscardState:
+    """Which utterances are stale, and which of them are the user's anyway."""
+
+    # Utterances that started before this moment are stale. (Such as Julie's own prompts.)
+    started_before: float = 0.0
+
+    # Utterances that start at or before this stream position have already been handled.
+    through_position: int = -1
+
+    # The stream position the user last started talking over Julie at, and the one that is
+    # kept by the current discard. The utterance around it is the user's, not Julie's.
+    barge_in_position: (int | None) = None
+    kept_barge_in_position: (int | None) = None
+
+    # [Start, end) stream positions of the audio captured while Julie was speaking.
+    gated_ranges: Deque[List[int]] = field(default_factory=lambda: deque(maxlen=256))
+
+
+@dataclass
+class ListeningPipeline:
+    """Class to capture utterances in the background and hand them to the consumers."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # At most this many live utterances wait to be recognized, the oldest one is dropped
+    # first. Recorded audio waits for the consumers, one utterance at a time.
+    _max_pending_utterances: ClassVar[int] = 8
+    _utterance_queue: "Queue[Utterance]" = field(init=False)
+
+    # How many seconds of audio the capture ring buffer holds.
+    _ring_buffer_seconds: ClassVar[float] = 60.0
+
+    # How long a consumer (or the replay) blocks on the queue before it checks for
+    # Ctrl + C or a stop again.
+    _queue_wait_timeout: ClassVar[float] = 0.5
+
+    # Only this much of Julie's voice is kept before the moment the user barged in.
+    _barge_in_pre_roll_seconds: ClassVar[float] = 0.3
+
+    # The share of an utterance that may be gated before it is dropped as Julie's own voice.
+    _max_gated_share: ClassVar[float] = 0.5
+
+    _capture: _CaptureState = field(default_factory=_CaptureState)
+    _discard: _DiscardState = field(default_factory=_DiscardState)
+
+    # Instantiate BargeInDetector.
+    _barge_in_detector: BargeInDetector = field(default_factory=BargeInDetector)
+
+    # The speech output worker shares the gate, it tells when Julie speaks.
+    _half_duplex_gate: HalfDuplexGate = field(
+        default_factory=lambda: SERVICE_LOADER.get_service("half_duplex_gate"))
+
+    # Latency (in seconds) of the most recent turns.
+    _turn_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
+
+    def __post_init__(self):
+        self._utterance_queue = Queue(maxsize=self._max_pending_utterances)
+
+    def start_capture(self, audio_source: AbstractAudioSource,
+                      voice_activity_detector: VoiceActivityDetector) -> None:
+        """Start the background capture thread, if it is not running already.
+
+        Args:
+            - audio_source (AbstractAudioSource): The audio source to capture from.
+            - voice_activity_detector (VoiceActivityDetector): Finds and closes the utterances.
+
+        Returns:
+            - None.
+        """
+
+        if self.is_capturing:
+            return
+
+        if self._capture.has_ended:
+            return
+
+        self._capture.stop_event.clear()
+        self._capture.is_live = audio_source.is_live
+        self._capture.voice_activity_detector = voice_activity_detector
+
+        if not self._capture.is_live and self._utterance_queue.empty():
+            # A full queue blocks the replay until the consumers have caught up, so the ring
+            # buffer never overwrites an utterance that has not been recognized yet.
+            self._utterance_queue = Queue(maxsize=1)
+
+        self._capture.thread = Thread(target=self._capture_utterances,
+                                      args=(audio_source, voice_activity_detector),
+                                      name="oojda-audio-capture",
+                                      daemon=True)
+        self._capture.thread.start()
+
+    @property
+    def is_capturing(self) -> bool:
+        """True while the background capture thread is running."""
+
+        return self._capture.thread is not None and self._capture.thread.is_alive()
+
+    def stop_capture(self) -> None:
+        """Ask the background capture thread to stop after the current chunk.
+
+        Returns:
+            - None.
+        """
+
+        self._capture.stop_event.set()
+
+    def get_next_utterance(self) -> Utterance:
+        """Block until the next fresh utterance has been captured.
+
+        Returns:
+            - Utterance: The oldest pending utterance that is not stale.
+
+        Raises:
+            - EOFError: if the audio source has ended and every utterance has been consumed.
+            - SystemError: if the capture thread has stopped for any other reason.
+        """
+
+        while True:
+            # The timeout only keeps Ctrl + C responsive.
+            utterance: (Utterance | None) = self.poll_next_utterance(
+                timeout=self._queue_wait_timeout)
+
+            if utterance is not None:
+                return utterance
+
+    def poll_next_utterance(self, timeout: float) -> (Utterance | None):
+        """Wait at most timeout seconds for the next fresh utterance.
+
+        Args:
+            - timeout (float): How long to wait, in seconds.
+
+        Returns:
+            - Utterance | None: The oldest pending utterance that is not stale,
+            None if none was captured in time.
+
+        Raises:
+            - EOFError: if the audio source has ended and every utterance has been consumed.
+            - SystemError: if the capture thread has stopped for any other reason.
+        """
+
+        try:
+            utterance: Utterance = self._utterance_queue.get(timeout=timeout)
+
+        except Empty:
+            if not self.is_capturing and self._capture.has_ended:
+                raise EOFError("Audio source has ended.") from None
+
+            if not self.is_capturing:
+                raise SystemError("Audio capture has stopped.") from None
+
+            return None
+
+        is_barge_in: bool = self._is_barge_in_utterance(start_position=utterance.start_position,
+                                                        end_position=utterance.end_position)
+
+        if ((utterance.started_at < self._discard.started_before and not is_barge_in)
+                or utterance.start_position <= self._discard.through_position):
+            return None
+
+        if not utterance.is_available():
+            self._log_handler.create_log(
+                log_type="warning",
+                log_message="Utterance was overwritten in the ring buffer before its turn.")
+            return None
+
+        return utterance
+
+    def get_open_utterance(self) -> (Utterance | None):
+        """Return the utterance that is still being spoken, cut at the frames captured so far.
+
+        Returns:
+            - Utterance | None: The utterance, captured now, with a zero copy view of its
+            frames so far. None if nobody is speaking.
+        """
+
+        ring_buffer: (AudioRingBuffer | None) = self._capture.ring_buffer
+        voice_activity_detector: (VoiceActivityDetector | None) = (
+            self._capture.voice_activity_detector)
+
+        if ring_buffer is None or voice_activity_detector is None:
+            return None
+
+        # Read once, the capture thread may close the utterance at any moment.
+        start_position: (int | None) = voice_activity_detector.utterance_start_position
+        end_position: int = ring_buffer.write_position
+
+        if start_position is None:
+            return None
+
+        start_position = max(start_position, ring_buffer.oldest_position)
+        captured_at: float = perf_counter()
+        sample_rate: int = voice_activity_detector.sample_rate
+        sample_width: int = voice_activity_detector.sample_width
+
+        try:
+            return Utterance(
+                frame_data=ring_buffer.read_frames(start_position=start_position,
+                                                   end_position=end_position),
+                sample_rate=sample_rate,
+                sample_width=sample_width,
+                start_position=start_position,
+                ring_buffer=ring_buffer,
+                started_at=captured_at - ((end_position - start_position)
+                                          / (sample_rate * sample_width)),
+                captured_at=captured_at)
+
+        except ValueError:
+            return None
+
+    def discard_open_utterance(self, start_position: int) -> None:
+        """Mark the utterance that is still being spoken (and any before it) as stale.
+
+        - Used once a partial result has already been acted on, so the closed utterance
+        is not handled a second time. Unlike discard_pending_utterances this also applies
+        to recorded audio, the utterance is found by its stream position.
+
+        Args:
+            - start_position (int): The start position from get_open_utterance.
+
+        Returns:
+            - None.
+        """
+
+        self._discard.through_position = max(self._discard.through_position, start_position)
+
+    def discard_pending_utterances(self) -> None:
+        """Mark every utterance that started until now as stale.
+
+        - Used after Julie has spoken, so her own voice is not treated as a query.
+        - If the user has talked over Julie since the previous discard, the utterance
+        they interrupted her with is kept.
+        - Recorded audio never contains Julie's voice, nothing is discarded.
+
+        Returns:
+            - None.
+        """
+
+        if self._capture.is_live:
+            self._discard.started_before = perf_counter()
+            self._discard.kept_barge_in_position = self._discard.barge_in_position
+            self._discard.barge_in_position = None
+
+    def record_turn_latency(self, utterance: Utterance) -> float:
+        """Record the latency of a turn, from the moment the utterance was closed until now.
+
+        Args:
+            - utterance (Utterance): The utterance the turn was started by.
+
+        Returns:
+            - float: The turn latency in seconds.
+        """
+
+        turn_latency: float = perf_counter() - utterance.captured_at
+        self._turn_latencies.append(turn_latency)
+
+        self._log_handler.create_log(
+            log_type="info",
+            log_message=(f"Turn latency: {turn_latency * 1000:.0f} ms "
+                         f"(average {self.get_average_turn_latency() * 1000:.0f} ms "
+                         f"over {len(self._turn_latencies)} turns)."))
+
+        return turn_latency
+
+    def get_barge_in_detector(self) -> BargeInDetector:
+        """Return the barge-in detector, such as to read its latencies.
+
+        Returns:
+            - BargeInDetector: The detector that interrupts Julie's speech.
+        """
+
+        return self._barge_in_detector
+
+    def get_average_turn_latency(self) -> float:
+        """Return the average latency (in seconds) of the most recent turns."""
+
+        if not self._turn_latencies:
+            return 0.0
+
+        return sum(self._turn_latencies) / len(self._turn_latencies)
+
+    def _capture_utterances(self, audio_source: AbstractAudioSource,
+                            voice_activity_detector: VoiceActivityDetector) -> None:
+        """Capture thread, reads the open source continuously and cuts out the utterances."""
+
+        try:
+            with audio_source:
+                self._read_stream(audio_source=audio_source,
+                                  voice_activity_detector=voice_activity_detector)
+
+        except (OSError, ValueError) as err:
+            self._log_handler.create_log(
+                log_type="error",
+                log_message=f"Audio capture has stopped, the audio source failed. {err}")
+
+    def _read_stream(self, audio_source: AbstractAudioSource,
+                     voice_activity_detector: VoiceActivityDetector) -> None:
+        """Read the open audio source into the ring buffer until it ends or a stop is requested."""
+
+        sample_rate: int = audio_source.sample_rate
+        sample_width: int = audio_source.sample_width
+
+        ring_buffer: AudioRingBuffer = AudioRingBuffer(
+            capacity=int(self._ring_buffer_seconds * sample_rate) * sample_width)
+        self._capture.ring_buffer = ring_buffer
+
+        voice_activity_detector.sample_rate = sample_rate
+        voice_activity_detector.sample_width = sample_width
+
+        self._capture.bytes_per_second = sample_rate * sample_width
+        self._half_duplex_gate.set_capture_sample_rate(sample_rate=sample_rate)
+
+        while not self._capture.stop_event.is_set():
+            chunk: bytes = audio_source.read_chunk()
+
+            if not chunk:
+                # Whatever was still being said when the source ended is an utterance too.
+                self._push_speech_segment(
+                    speech_segment=voice_activity_detector.flush_utterance(
+                        end_position=ring_buffer.write_position),
+                    voice_activity_detector=voice_activity_detector)
+
+                self._capture.has_ended = True
+                return
+
+            is_gated: bool = self._half_duplex_gate.is_gated()
+
+            if is_gated:
+                chunk = self._half_duplex_gate.suppress_echo(chunk=chunk,
+                                                             sample_width=sample_width)
+
+            end_position: int = ring_buffer.write_frames(frames=chunk)
+
+            if is_gated:
+                self._tag_gated_audio(start_position=end_position - len(chunk),
+                                      end_position=end_position)
+
+            self._push_speech_segment(
+                speech_segment=voice_activity_detector.process_chunk(
+                    chunk=chunk, end_position=end_position),
+                voice_activity_detector=voice_activity_detector)
+
+            barge_in_started_at: (float | None) = self._barge_in_detector.process_chunk(
+                chunk=chunk, sample_rate=sample_rate, sample_width=sample_width,
+                energy_threshold=voice_activity_detector.energy_threshold)
+
+            if barge_in_started_at is not None:
+                self._discard.barge_in_position = end_position - int(
+                    (perf_counter() - barge_in_started_at) * sample_rate) * sample_width
+
+    def _push_speech_segment(self, speech_segment: (SpeechSegment | None),
+                             voice_activity_detector: VoiceActivityDetector) -> None:
+        """Cut a closed speech segment out of the ring buffer and push it as an utterance."""
+
+        ring_buffer: (AudioRingBuffer | None) = self._capture.ring_buffer
+
+        if speech_segment is None or ring_buffer is None:
+            return
+
+        captured_at: float = perf_counter()
+        sample_rate: int = voice_activity_detector.sample_rate
+        sample_width: int = voice_activity_detector.sample_width
+        start_position: int = max(ring_buffer.oldest_position,
+                                  speech_segment.start_position)
+
+        if self._is_barge_in_utterance(start_position=start_position,
+                                       end_position=speech_segment.end_position):
+            # Only the user's part of the utterance (and a short pre-roll) is recognized.
+            barge_in_position: int = max(position for position in (
+                self._discard.barge_in_position, self._discard.kept_barge_in_position)
+                if position is not None)
+            start_position = max(start_position, barge_in_position - int(
+                self._barge_in_pre_roll_seconds * sample_rate) * sample_width)
+
+        elif self._get_gated_share(start_position=start_position,
+                                   end_position=speech_segment.end_position
+                                   ) >= self._max_gated_share:
+            self._half_duplex_gate.count_avoided_recognition()
+            self._log_handler.create_log(
+                log_type="info",
+                log_message="Utterance captured while Julie was speaking, it was not recognized.")
+
+            return
+
+        self._log_handler.create_log(
+            log_type="info",
+            log_message=(
+                f"Endpoint latency: {speech_segment.endpoint_latency * 1000:.0f} ms "
+                f"(average {voice_activity_detector.get_average_endpoint_latency() * 1000:.0f}"
+                f" ms, pause {voice_activity_detector.hangover_seconds * 1000:.0f} ms, "
+                f"threshold {voice_activity_detector.energy_threshold:.0f})."))
+
+        self._push_utterance(Utterance(
+            frame_data=ring_buffer.read_frames(
+                start_position=start_position, end_position=speech_segment.end_position),
+            sample_rate=sample_rate,
+            sample_width=sample_width,
+            start_position=start_position,
+            ring_buffer=ring_buffer,
+            started_at=captured_at - ((ring_buffer.write_position - start_position)
+                                      / (sample_rate * sample_width)),
+            captured_at=captured_at))
+
+    def _tag_gated_audio(self, start_position: int, end_position: int) -> None:
+        """Remember that the audio between the stream positions was captured while gated."""
+
+        gated_ranges: Deque[List[int]] = self._discard.gated_ranges
+
+        if gated_ranges and gated_ranges[-1][1] == start_position:
+            gated_ranges[-1][1] = end_position
+
+        else:
+            gated_ranges.append([start_position, end_position])
+
+    def _get_gated_share(self, start_position: int, end_position: int) -> float:
+        """Return the share of the audio between the stream positions that was gated."""
+
+        if end_position <= start_position:
+            return 0.0
+
+        gated_length: int = sum(
+            max(0, min(end_position, gated_end) - max(start_position, gated_start))
+            for gated_start, gated_end in self._discard.gated_ranges)
+
+        return gated_length / (end_position - start_position)
+
+    def _is_barge_in_utterance(self, start_position: int, end_position: int) -> bool:
+        """Check if the user started talking over Julie during the utterance."""
+
+        # The VoiceActivityDetector may start the utterance a little after the detector.
+        tolerance: int = int(self._barge_in_pre_roll_seconds * self._capture.bytes_per_second)
+
+        return any(start_position - tolerance <= barge_in_position <= end_position
+                   for barge_in_position in (self._discard.barge_in_position,
+                                             self._discard.kept_barge_in_position)
+                   if barge_in_position is not None)
+
+    def _push_utterance(self, utterance: Utterance) -> None:
+        """Push an utterance into the queue, dropping the oldest one if the queue is full."""
+
+        if not self._capture.is_live:
+            # Recorded audio blocks until the consumer has taken the previous utterance.
+            while not self._capture.stop_event.is_set():
+                try:
+                    self._utterance_queue.put(utterance, timeout=self._queue_wait_timeout)
+                    return
+
+                except Full:
+                    pass
+
+            return
+
+        while True:
+            try:
+                self._utterance_queue.put_nowait(utterance)
+                return
+
+            except Full:
+                try:
+                    self._utterance_queue.get_nowait()
+                    self._log_handler.create_log(
+                        log_type="warning",
+                        log_message="Utterance queue is full, the oldest utterance was dropped.")
+
+                except Empty:
+                    pass
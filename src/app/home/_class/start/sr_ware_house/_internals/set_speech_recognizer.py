@@ -33,14 +33,63 @@ Refer to the module documentation for details.
 # Include built-in packages and modules.
 from dataclasses import dataclass, field
 
+# Include internal typings.
+from typing import Callable, ClassVar, Dict, List, Tuple
+
 # Include external packages and modules.
-from speech_recognition import Recognizer, Microphone, AudioData # type: ignore
+from speech_recognition import AudioData, Recognizer # type: ignore
 
 # Include custom packages and modules.
 from src.app.design_pattern.strategy.abstract.blueprint.abstract_set_speech_recognizer\
     .abstract_set_speech_recognizer import AbstractSetSpeechRecognizer
 from src.app.utility.handler._class.text_to_speech.text_to_speech\
     import TextToSpeech
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.handler._class.voice_activity_detector.voice_activity_detector\
+    import VoiceActivityDetector
+from src.app.utility.handler._class.noise_calibration.noise_calibration import NoiseCalibration
+from src.app.utility.handler._class.audio_source.audio_source import MicrophoneAudioSource
+from src.app.utility.handler._class.recognition_cache.recognition_cache import\
+    (AudioFingerprint, RecognitionCache, )
+from src.app.utility.handler._class.audio_preprocessor.audio_preprocessor\
+    import AudioPreprocessor
+from src.app.design_pattern.strategy.abstract.blueprint.abstract_audio_source\
+    .abstract_audio_source import AbstractAudioSource
+from src.app.design_pattern.strategy.abstract.blueprint.abstract_streaming_speech_recognizer\
+    .abstract_streaming_speech_recognizer import AbstractStreamingSpeechRecognizer
+from src.app.home._class.start.sr_ware_house._internals.listening_pipeline\
+    import ListeningPipeline, Utterance
+from src.app.utility.handler._class.barge_in_detector.barge_in_detector import BargeInDetector
+from src.app.utility.data._module.prompt_phrases import ASSIST_PROMPT, PLEASE_WAIT_PROMPT
+
+# The Recognizer is only created the first time a query is recognized.
+SERVICE_LOADER.register_service("speech_recognizer_recognizer", Recognizer)
+
+
+@dataclass
+class _AudioStages:
+    """The stages the captured audio passes through, from endpointing to the recognition cache."""
+
+    # Instantiate VoiceActivityDetector, it replaces the energy only endpointing of
+    # Recognizer.listen.
+    voice_activity_detector: VoiceActivityDetector = field(default_factory=VoiceActivityDetector)
+
+    # Instantiate NoiseCalibration.
+    noise_calibration: NoiseCalibration = field(default_factory=NoiseCalibration)
+
+    # Instantiate AudioPreprocessor.
+    audio_preprocessor: AudioPreprocessor = field(default_factory=AudioPreprocessor)
+
+    # Instantiate RecognitionCache.
+    recognition_cache: RecognitionCache = field(default_factory=RecognitionCache)
+
+
+@dataclass
+class _LastRecognition:
+    """The most recent voice query, and the utterance it was recognized from."""
+
+    voice_query: str = ""
+    utterance: (Utterance | None) = None
 
 
 @dataclass
@@ -50,13 +99,42 @@ class SetSpeechRecognizer(AbstractSetSpeechRecognizer):
     # Instantiate TextToSpeechHandler.
     _text_to_speech_handler: TextToSpeech = field(default_factory=TextToSpeech)
 
-    # Instantiate Recognizer and Microphone.
-    _recognizer: Recognizer = Recognizer()
-    _microphone: Microphone = Microphone()
+    # Instantiate MicrophoneAudioSource, replaced by a recorded source for headless replays.
+    _audio_source: AbstractAudioSource = field(default_factory=MicrophoneAudioSource)
+
+    # Instantiate ListeningPipeline.
+    _listening_pipeline: ListeningPipeline = field(default_factory=ListeningPipeline)
+
+    # Instantiate _AudioStages.
+    _audio_stages: _AudioStages = field(default_factory=_AudioStages)
+
+    # How much audio the ambient noise calibration measures, same as adjust_for_ambient_noise.
+    _calibration_seconds: ClassVar[float] = 1.0
 
-    _voice_query: str = ""
+    # Speech recognizers raced against the chosen one, each only fires if the ones before it
+    # have not answered within the hedge delay. Empty means no hedging.
+    _hedge_speech_recognizers: Tuple[str, ...] = ()
+    hedge_delay_seconds: ClassVar[float] = 0.75
+    _recognition_timeout_seconds: ClassVar[float] = 10.0
 
-    def initiate_speech_recognition(self, speech_recognizer: str) -> str:
+    # Guesses the words of a query while it is being spoken, None turns streaming off.
+    _streaming_speech_recognizer: (AbstractStreamingSpeechRecognizer | None) = None
+
+    # How often the utterance that is being spoken is passed to the streaming recognizer.
+    _stream_update_seconds: ClassVar[float] = 0.1
+
+    # Instantiate _LastRecognition.
+    _last_recognition: _LastRecognition = field(default_factory=_LastRecognition)
+
+    @property
+    def _recognizer(self) -> Recognizer:
+        """The shared Recognizer, created by the service loader on first use."""
+
+        return SERVICE_LOADER.get_service("speech_recognizer_recognizer")
+
+    def initiate_speech_recognition(
+            self, speech_recognizer: str,
+            resolve_partial_query: (Callable[[str], (str | None)] | None) = None) -> str:
         """This method initiates the create_speech_recognizer method.
 
         Summary:
@@ -67,31 +145,49 @@ class SetSpeechRecognizer(AbstractSetSpeechRecognizer):
         Args:
             - speech_recognizer (str): The speech recognizer name that will be used,
             to distinguish between the supported speech recognizer's.
+            - resolve_partial_query (Callable[[str], (str | None)] | None): Optional check of
+            the partial hypotheses while streaming. As soon as it resolves one into a full query
+            that query is returned, without waiting for the user to finish.
         
         Returns: 
             - str: The voice query.
         """
 
         self._text_to_speech_handler.create_text_to_speech(
-            text_to_produce_speech="How can I assist you today?")
+            text_to_produce_speech=ASSIST_PROMPT)
+
+        # Julie's own prompt (and anything before it) is not a query.
+        self._listening_pipeline.discard_pending_utterances()
+
+        if self._streaming_speech_recognizer is not None and resolve_partial_query is not None:
+            utterance, resolved_query = self._stream_next_utterance(
+                resolve_partial_query=resolve_partial_query)
+
+            if resolved_query is not None:
+                self._last_recognition.voice_query = resolved_query
+                self._listening_pipeline.record_turn_latency(utterance=utterance)
 
-        with self._microphone as source:
-            audio: AudioData = self._recognizer.listen(source) # type: ignore
+                return self._last_recognition.voice_query.lower()
 
-        self._voice_query = self.create_speech_recognizer(
+        else:
+            utterance = self._get_next_utterance()
+
+        self._last_recognition.voice_query = self._recognize_utterance(
             speech_recognizer=speech_recognizer,
-            recognizer=self._recognizer,
-            audio=audio,
-            text_to_speech_handler=self._text_to_speech_handler,
+            utterance=utterance,
             should_announce_error_message=True)
 
-        if self._voice_query.strip():
+        self._listening_pipeline.record_turn_latency(utterance=utterance)
+
+        if self._last_recognition.voice_query.strip():
             self._text_to_speech_handler.create_text_to_speech(
-            text_to_produce_speech="Please wait!")
+            text_to_produce_speech=PLEASE_WAIT_PROMPT)
 
-        return self._voice_query.lower()
+        return self._last_recognition.voice_query.lower()
 
-    def initiate_speech_recognition_once(self, speech_recognizer: str) -> str:
+    def initiate_speech_recognition_once(
+            self, speech_recognizer: str,
+            utterance_gate: (Callable[[Utterance], bool] | None) = None) -> str:
         """This method initiates the create_speech_recognizer method.
 
         Summary:
@@ -102,20 +198,316 @@ class SetSpeechRecognizer(AbstractSetSpeechRecognizer):
         Args:
             - speech_recognizer (str): The speech recognizer name that will be used,
             to distinguish between the supported speech recognizer's.
+            - utterance_gate (Callable[[Utterance], bool] | None): Optional local check,
+            utterances it rejects are never sent to the speech recognizer.
         
         Returns: 
-            - str: The voice query.
+            - str: The voice query, empty if the utterance gate rejected the utterance.
 
         Note: Only use this method if your are to initiate voice recognition once,
         """
 
-        with self._microphone as source:
-            audio: AudioData = self._recognizer.listen(source) # type: ignore
+        utterance: Utterance = self._get_next_utterance()
+
+        if utterance_gate is not None and not utterance_gate(utterance):
+            return ""
+
+        self._last_recognition.voice_query = self._recognize_utterance(
+            speech_recognizer=speech_recognizer,
+            utterance=utterance,
+            should_announce_error_message=False)
+
+        self._listening_pipeline.record_turn_latency(utterance=utterance)
+
+        return self._last_recognition.voice_query.lower()
+
+    @property
+    def is_live_audio_source(self) -> bool:
+        """True if the audio source is live, such as the microphone, instead of a recording."""
+
+        return self._audio_source.is_live
+
+    def load_noise_calibration(self) -> bool:
+        """Apply the noise floor saved by a previous launch, if there is one.
+
+        Returns:
+            - bool: True if a saved calibration was applied, False if calibration is needed.
+        """
+
+        noise_floor: (float | None) = self._audio_stages.noise_calibration.load_noise_floor(
+            source_name=self._audio_source.source_name,
+            sample_rate=self._audio_source.sample_rate)
+
+        if noise_floor is None:
+            return False
+
+        self._audio_stages.voice_activity_detector.set_noise_floor(noise_floor=noise_floor)
+
+        return True
+
+    def calibrate_ambient_noise(self) -> None:
+        """Measure the ambient noise from about a second of audio, and save it.
+
+        Returns:
+            - None.
+        """
+
+        voice_activity_detector: VoiceActivityDetector = self._audio_stages.voice_activity_detector
+        with self._audio_source as audio_source:
+            calibration_length: int = int(
+                self._calibration_seconds * audio_source.sample_rate) * audio_source.sample_width
+            calibration_chunks: List[bytes] = []
+
+            while sum(map(len, calibration_chunks)) < calibration_length:
+                chunk: bytes = audio_source.read_chunk()
+
+                if not chunk:
+                    break
+
+                calibration_chunks.append(chunk)
+
+            voice_activity_detector.sample_rate = audio_source.sample_rate
+            voice_activity_detector.sample_width = audio_source.sample_width
+
+        noise_floor: float = voice_activity_detector.calibrate_noise_floor(
+            frame_data=b"".join(calibration_chunks))
+
+        self._audio_stages.noise_calibration.save_noise_floor(
+            noise_floor=noise_floor,
+            source_name=self._audio_source.source_name,
+            sample_rate=voice_activity_detector.sample_rate)
+
+    def save_noise_calibration(self) -> None:
+        """Save the noise floor the voice activity detector has refined during this session.
+
+        Returns:
+            - None.
+        """
+
+        voice_activity_detector: VoiceActivityDetector = self._audio_stages.voice_activity_detector
+        # Before the capture has started the detector has not measured anything yet,
+        # and a recording must not replace the calibration of the microphone.
+        if not self._listening_pipeline.is_capturing or not self._audio_source.is_live:
+            return
+
+        self._audio_stages.noise_calibration.save_noise_floor(
+            noise_floor=voice_activity_detector.noise_floor,
+            source_name=self._audio_source.source_name,
+            sample_rate=voice_activity_detector.sample_rate)
+
+    def create_latency_summary(self) -> str:
+        """Summarize the endpoint, turn and barge-in latencies, and the upload sizes.
+
+        Returns:
+            - str: The latency summary.
+        """
+
+        byte_counts: Dict[str, int] = self._audio_stages.audio_preprocessor.get_byte_counts()
+        voice_activity_detector: VoiceActivityDetector = self._audio_stages.voice_activity_detector
+        barge_in_detector: BargeInDetector = self._listening_pipeline.get_barge_in_detector()
+        barge_ins: int = barge_in_detector.get_barge_in_counts()["barge_ins"]
+
+        latency_summary: str = (
+            f"Average endpoint latency "
+            f"{voice_activity_detector.get_average_endpoint_latency() * 1000:.0f} ms, "
+            f"average turn latency "
+            f"{self._listening_pipeline.get_average_turn_latency() * 1000:.0f} ms, "
+            f"{byte_counts['uploaded_bytes']} of {byte_counts['captured_bytes']} captured "
+            f"bytes uploaded over {byte_counts['utterances']} utterances.")
+
+        if barge_ins:
+            latency_summary += (
+                f" Average barge-in latency "
+                f"{barge_in_detector.get_average_barge_in_latency() * 1000:.0f} ms "
+                f"over {barge_ins} barge-ins.")
+
+        avoided_recognitions: int = SERVICE_LOADER.get_service(
+            "half_duplex_gate").get_gate_counts()["avoided_recognitions"]
+
+        if avoided_recognitions:
+            latency_summary += (f" {avoided_recognitions} recognizer calls avoided, "
+                                f"the utterances were Julie's own voice.")
+
+        return latency_summary
+
+    @property
+    def last_utterance(self) -> (Utterance | None):
+        """The utterance the most recent query was recognized from."""
+
+        return self._last_recognition.utterance
+
+    def _get_next_utterance(self) -> Utterance:
+        """Start the background capture on first use, then wait for the next utterance.
+
+        Returns:
+            - Utterance: The next captured utterance.
+        """
+
+        self._listening_pipeline.start_capture(
+            audio_source=self._audio_source,
+            voice_activity_detector=self._audio_stages.voice_activity_detector)
+
+        return self._accept_utterance(utterance=self._listening_pipeline.get_next_utterance())
+
+    def _accept_utterance(self, utterance: Utterance) -> Utterance:
+        """Remember the utterance as the most recent one, and keep the saved noise floor current.
+
+        Args:
+            - utterance (Utterance): The captured utterance.
+
+        Returns:
+            - Utterance: The same utterance.
+        """
+
+        self._last_recognition.utterance = utterance
+
+        # The detector refines the noise floor during silence, keep the saved one current.
+        if self._audio_source.is_live:
+            self._audio_stages.noise_calibration.refresh_noise_floor(
+                noise_floor=self._audio_stages.voice_activity_detector.noise_floor,
+                source_name=self._audio_source.source_name,
+                sample_rate=utterance.sample_rate)
+
+        return utterance
+
+    def _stream_next_utterance(
+            self, resolve_partial_query: Callable[[str], (str | None)]
+            ) -> Tuple[Utterance, (str | None)]:
+        """Stream the partial hypotheses of the next utterance until one can be resolved.
+
+        Args:
+            - resolve_partial_query (Callable[[str], (str | None)]): Resolves a partial
+            hypothesis into a full query, or returns None while it is still ambiguous.
+
+        Returns:
+            - Tuple[Utterance, (str | None)]: The closed utterance and None if it was closed
+            first, otherwise the open utterance cut at the resolved partial hypothesis,
+            and the query resolved from it.
+        """
+
+        voice_activity_detector: VoiceActivityDetector = self._audio_stages.voice_activity_detector
+        streaming_speech_recognizer: AbstractStreamingSpeechRecognizer = (
+            self._streaming_speech_recognizer) # type: ignore
+        stream_start_position: (int | None) = None
+        partial_query: str = ""
+
+        self._listening_pipeline.start_capture(
+            audio_source=self._audio_source,
+            voice_activity_detector=voice_activity_detector)
+
+        try:
+            while True:
+                utterance: (Utterance | None) = self._listening_pipeline.poll_next_utterance(
+                    timeout=self._stream_update_seconds)
+
+                if utterance is not None:
+                    return self._accept_utterance(utterance=utterance), None
 
-        self._voice_query = self.create_speech_recognizer(
+                utterance = self._listening_pipeline.get_open_utterance()
+
+                if utterance is None:
+                    continue
+
+                if utterance.start_position != stream_start_position:
+                    streaming_speech_recognizer.start_stream(
+                        sample_rate=utterance.sample_rate,
+                        sample_width=utterance.sample_width)
+                    stream_start_position = utterance.start_position
+
+                next_partial_query: str = streaming_speech_recognizer.update_stream(
+                    frame_data=utterance.frame_data).lower()
+
+                if not next_partial_query or next_partial_query == partial_query:
+                    continue
+
+                partial_query = next_partial_query
+                resolved_query: (str | None) = resolve_partial_query(partial_query)
+
+                if resolved_query is not None:
+                    # The rest of the utterance has already been answered.
+                    self._listening_pipeline.discard_open_utterance(
+                        start_position=utterance.start_position)
+
+                    self._log_handler.create_log(
+                        log_type="info",
+                        log_message=(f"Partial query \"{partial_query}\" resolved to "
+                                     f"\"{resolved_query}\" while it was still being spoken."))
+
+                    return self._accept_utterance(utterance=utterance), resolved_query
+
+        finally:
+            streaming_speech_recognizer.stop_stream()
+
+    def _recognize_utterance(self, speech_recognizer: str, utterance: Utterance,
+                             should_announce_error_message: bool) -> str:
+        """Recognize the utterance, unless a near identical one has been recognized before.
+
+        Args:
+            - speech_recognizer (str): The speech recognizer name to try first.
+            - utterance (Utterance): The utterance to recognize.
+            - should_announce_error_message (bool): To control the flow of error messages.
+
+        Returns:
+            - str: The voice query, empty if it could not be recognized.
+        """
+
+        recognition_cache: RecognitionCache = self._audio_stages.recognition_cache
+        fingerprint: (AudioFingerprint | None) = recognition_cache.compute_fingerprint(
+            frame_data=utterance.frame_data,
+            sample_rate=utterance.sample_rate,
+            sample_width=utterance.sample_width)
+
+        if fingerprint is not None:
+            cached_query: (str | None) = recognition_cache.get_query(
+                fingerprint=fingerprint)
+
+            if cached_query is not None:
+                return cached_query
+
+        query: str = self._recognize_utterance_audio(
             speech_recognizer=speech_recognizer,
+            utterance=utterance,
+            should_announce_error_message=should_announce_error_message)
+
+        if fingerprint is not None:
+            recognition_cache.put_query(fingerprint=fingerprint, query=query)
+
+        return query
+
+    def _recognize_utterance_audio(self, speech_recognizer: str, utterance: Utterance,
+                                   should_announce_error_message: bool) -> str:
+        """Recognize the utterance, hedged against the hedge speech recognizers if there are any.
+
+        Args:
+            - speech_recognizer (str): The speech recognizer name to try first.
+            - utterance (Utterance): The utterance to recognize.
+            - should_announce_error_message (bool): To control the flow of error messages.
+
+        Returns:
+            - str: The voice query, empty if it could not be recognized.
+        """
+
+        # Trimmed, 16 kHz and normalized, so there is less to encode and upload.
+        audio: AudioData = self._audio_stages.audio_preprocessor.preprocess_audio(
+            frame_data=utterance.frame_data,
+            sample_rate=utterance.sample_rate,
+            sample_width=utterance.sample_width)
+
+        if not self._hedge_speech_recognizers:
+            return self.create_speech_recognizer(
+                speech_recognizer=speech_recognizer,
+                recognizer=self._recognizer,
+                audio=audio,
+                text_to_speech_handler=self._text_to_speech_handler,
+                should_announce_error_message=should_announce_error_message) or ""
+
+        return self.create_hedged_speech_recognizer(
+            speech_recognizers=(speech_recognizer, *(
+                hedge_speech_recognizer for hedge_speech_recognizer
+                in self._hedge_speech_recognizers if hedge_speech_recognizer != speech_recognizer)),
+            hedge_delay=self.hedge_delay_seconds,
+            recognition_timeout=self._recognition_timeout_seconds,
             recognizer=self._recognizer,
             audio=audio,
-            text_to_speech_handler=self._text_to_speech_handler)
-
-        return self._voice_query.lower()
+            text_to_speech_handler=self._text_to_speech_handler,
+            should_announce_error_message=should_announce_error_message)
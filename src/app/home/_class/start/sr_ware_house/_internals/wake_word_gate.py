@@ -0,0 +1,195 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+wake_word_gate.py:
+==================
+This file contains a class that decides locally if an utterance may contain a wake word,
+before it is sent to the cloud speech recognizer.
+
+Overview:
+=========
+- Utterances that are too short or too long to be a wake word are rejected right away.
+- The rest is compared against the enrolled wake word templates with the KeywordSpotter.
+- Until enough templates have been enrolled the gate stays open, and every wake word
+the cloud recognizer confirms is enrolled as a new template. Julie learns the user's voice
+while she is being used, no separate training session needed.
+- Every wake phrase ("hi julie", "hey oojda") is enrolled under its own label, and every
+few rejected utterances one still passes to the cloud. A new phrase, a second user or a new
+microphone is learned the same way, instead of being locked out by the templates.
+- --no-wake-gate sends every utterance to the cloud, --reset-wake-gate forgets the templates.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+
+# Include internal typings.
+from typing import ClassVar, Dict
+
+# Include external packages and modules.
+import numpy as np
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.keyword_spotter.keyword_spotter import KeywordSpotter
+from src.app.home._class.start.sr_ware_house._internals.listening_pipeline import Utterance
+
+
+@dataclass
+class WakeWordGate:
+    """Class to keep utterances without a wake word away from the cloud speech recognizer."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Instantiate KeywordSpotter.
+    _keyword_spotter: KeywordSpotter = field(default_factory=lambda: KeywordSpotter(
+        _templates_file_name="wake_word_templates.npz"))
+
+    # Set from the command line, a disabled gate passes every utterance.
+    is_enabled: ClassVar[bool] = True
+
+    # Every wake phrase is enrolled as "wake_word:<phrase>". Templates enrolled before the
+    # phrases were told apart are labelled "wake_word", they still match.
+    _wake_word_label: ClassVar[str] = "wake_word"
+
+    # Utterances include the pre-roll and the closing pause, so these bounds are generous.
+    _min_utterance_seconds: ClassVar[float] = 0.3
+    _max_utterance_seconds: ClassVar[float] = 5.0
+
+    # The gate stays open until a wake phrase has this many templates.
+    _min_templates_to_close_gate: ClassVar[int] = 3
+
+    # Every this many utterances the spotter rejects in a row, one passes to the cloud anyway.
+    _pass_through_interval: ClassVar[int] = 4
+
+    # Log the gate counters every this many utterances.
+    _report_interval: ClassVar[int] = 50
+
+    _gate_counts: Dict[str, int] = field(default_factory=lambda: {
+        "rejected_by_duration": 0,
+        "rejected_by_spotter": 0,
+        "passed_while_disabled": 0,
+        "passed_while_enrolling": 0,
+        "passed_through": 0,
+        "passed": 0,
+    })
+
+    _rejections_since_pass_through: int = 0
+
+    # Features of the most recent utterance, reused when it gets enrolled.
+    _last_features: (np.ndarray | None) = None
+
+    def passes_wake_gate(self, utterance: Utterance) -> bool:
+        """Check locally if the utterance may contain a wake word.
+
+        Args:
+            - utterance (Utterance): The captured utterance.
+
+        Returns:
+            - bool: True if the utterance should be sent to the speech recognizer.
+        """
+
+        self._last_features = None
+
+        if not WakeWordGate.is_enabled:
+            return self._count_gate_result(gate_result="passed_while_disabled")
+
+        if not self._min_utterance_seconds <= utterance.duration <= self._max_utterance_seconds:
+            return self._count_gate_result(gate_result="rejected_by_duration")
+
+        self._last_features = self._keyword_spotter.compute_features(
+            frame_data=utterance.frame_data,
+            sample_rate=utterance.sample_rate,
+            sample_width=utterance.sample_width)
+
+        wake_word_template_counts: Dict[str, int] = self._get_wake_word_template_counts()
+
+        if max(wake_word_template_counts.values(), default=0) < self._min_templates_to_close_gate:
+            return self._count_gate_result(gate_result="passed_while_enrolling")
+
+        matched_label, _ = self._keyword_spotter.match_features(
+            features=self._last_features, labels=tuple(wake_word_template_counts))
+
+        if matched_label:
+            self._rejections_since_pass_through = 0
+
+            return self._count_gate_result(gate_result="passed")
+
+        self._rejections_since_pass_through += 1
+
+        # The cloud gets to hear what the templates do not know yet. If it is a wake word
+        # after all, it is enrolled under its own phrase.
+        if self._rejections_since_pass_through >= self._pass_through_interval:
+            self._rejections_since_pass_through = 0
+
+            return self._count_gate_result(gate_result="passed_through")
+
+        return self._count_gate_result(gate_result="rejected_by_spotter")
+
+    def confirm_wake_word(self, wake_phrase: str) -> None:
+        """Enroll the most recent utterance, after the speech recognizer confirmed a wake word.
+
+        Args:
+            - wake_phrase (str): The wake phrase the utterance was recognized as.
+
+        Returns:
+            - None.
+        """
+
+        if self._last_features is not None:
+            self._keyword_spotter.enroll_features(
+                label=f"{self._wake_word_label}:{wake_phrase}", features=self._last_features)
+            self._last_features = None
+
+    def reset_wake_word_templates(self) -> None:
+        """Forget every enrolled wake word, the gate stays open until they are learned again.
+
+        Returns:
+            - None.
+        """
+
+        self._keyword_spotter.remove_templates()
+        self._log_handler.create_log(
+            log_type="info",
+            log_message="Wake word templates were reset, they are learned again from now on.")
+
+    def _get_wake_word_template_counts(self) -> Dict[str, int]:
+        """Return how many templates every wake phrase label has."""
+
+        return {label: template_count for label, template_count
+                in self._keyword_spotter.get_template_counts().items()
+                if label.split(":", 1)[0] == self._wake_word_label}
+
+    def _count_gate_result(self, gate_result: str) -> bool:
+        """Count the gate result, log the counters now and then, and return if it passed."""
+
+        self._gate_counts[gate_result] += 1
+
+        if sum(self._gate_counts.values()) % self._report_interval == 0:
+            self._log_handler.create_log(log_type="info",
+                                         log_message=f"Wake word gate: {self._gate_counts}")
+
+        return gate_result.startswith("passed")
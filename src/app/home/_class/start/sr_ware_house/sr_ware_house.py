@@ -32,34 +32,39 @@ Refer to the module documentation for details.
 
 # Include built-in packages and modules.
 from dataclasses import dataclass, field
-from time import sleep
 
 # Include internal typings.
-from typing import Dict
-
-# Include external packages and modules.
-from speech_recognition import Recognizer, Microphone # type: ignore
-from memory_profiler import profile # type: ignore
+from typing import Dict, Tuple
 
 # Include custom packages and modules.
 from src.app.utility.handler._class.text_to_speech.text_to_speech\
     import TextToSpeech
+from src.app.utility.handler._class.fuzzy_phrase_matcher.fuzzy_phrase_matcher\
+    import FuzzyPhraseMatcher
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.handler._class.startup_timer.startup_timer import STARTUP_TIMER
 from src.app.home._class.start.sr_ware_house._internals.set_speech_recognizer\
     import SetSpeechRecognizer
 from src.app.home._class.start.sr_ware_house._internals.initiate_julie import initiate_julie
+from src.app.home._class.start.sr_ware_house._internals.wake_word_gate import WakeWordGate
 from src.app.utility.data._module.wake_words import wake_words_to_activate_julie
+from src.app.utility.data._module.prompt_phrases import\
+    (ADJUSTING_NOISE_ANNOUNCEMENT, ONLINE_ANNOUNCEMENT, TERMINATION_ANNOUNCEMENT, )
 
 # * GLOBAL VARIABLES ! (USE WITH CARE)
 # Define announcement messages.
 _ANNOUNCEMENT_MESSAGE: Dict[str, str] = {
-    "online_message": "Julie is online. Say \"Hey Julie\"\n",
-    "adjusting_noise": "Adjusting for ambient noise. Please wait.\n",
-    "termination_message": """The program has been terminated using the Control + C shortcut.
-Thank you for using my service.\nWishing you a great day ahead!\n"""
+    "online_message": ONLINE_ANNOUNCEMENT,
+    "adjusting_noise": ADJUSTING_NOISE_ANNOUNCEMENT,
+    "end_of_audio_message": "The recorded audio has ended.",
+    "termination_message": TERMINATION_ANNOUNCEMENT
     }
 
-# ! DANGER: DISABLE ALL @profile DECORATOR'S BEFORE PUSHING THE CODE INTO PRODUCTION.
-# ! THIS IS TO AVOID UNNECESSARY MEMORY CONSUMPTION.
+# Services the first recognition needs, warmed up as soon as the listening starts.
+_RECOGNITION_SERVICES: Tuple[str, ...] = ("recognition_worker_pool",)
+
+# Plugins that the wake word loop does not need yet, warmed up once Julie is online.
+_BACKGROUND_PLUGINS: Tuple[str, ...] = ("gemini_ai",)
 
 
 @dataclass
@@ -72,11 +77,14 @@ class SRWareHouse():
     # Instantiate SetSpeechRecognizer.
     _set_speech_recognizer: SetSpeechRecognizer = field(default_factory=SetSpeechRecognizer)
 
-    # Instantiate Recognizer and Microphone.
-    _recognizer: Recognizer = Recognizer()
-    _microphone: Microphone = Microphone()
+    # Instantiate WakeWordGate.
+    _wake_word_gate: WakeWordGate = field(default_factory=WakeWordGate)
+
+    # Instantiate FuzzyPhraseMatcher.
+    # A false wake only costs a prompt, so "ok judy" is still close enough to "ok julie".
+    _wake_word_matcher: FuzzyPhraseMatcher = field(default_factory=lambda: FuzzyPhraseMatcher(
+        phrases=wake_words_to_activate_julie, _max_distance=3, _max_distance_ratio=0.4))
 
-    @profile
     def initiate_speech_recognition (self, speech_recognizer: str) -> None:
         """Method that initiates the speech recognition process.
 
@@ -89,29 +97,52 @@ class SRWareHouse():
         """
 
         try:
-            self._text_to_speech_handler.create_text_to_speech(
-                text_to_produce_speech=_ANNOUNCEMENT_MESSAGE["adjusting_noise"])
+            # The recognition worker processes are spawned while the noise is calibrated.
+            SERVICE_LOADER.warm_up_services(service_names=_RECOGNITION_SERVICES)
+
+            # A restart reuses the last noise profile, and skips the blocking calibration.
+            # Recorded audio is never calibrated, the detector adapts while it is replayed.
+            if (self._set_speech_recognizer.is_live_audio_source
+                    and not self._set_speech_recognizer.load_noise_calibration()):
+                self._text_to_speech_handler.create_text_to_speech(
+                    text_to_produce_speech=_ANNOUNCEMENT_MESSAGE["adjusting_noise"])
 
-            with self._microphone as source:
-                self._recognizer.adjust_for_ambient_noise(source) # type: ignore
+                self._set_speech_recognizer.calibrate_ambient_noise()
+
+            STARTUP_TIMER.mark_phase("ambient_noise_calibration")
 
             print(_ANNOUNCEMENT_MESSAGE["online_message"])
+            STARTUP_TIMER.mark_ready()
+            SERVICE_LOADER.get_service("plugin_registry").warm_up_plugins(
+                plugin_names=_BACKGROUND_PLUGINS)
+
             self._text_to_speech_handler.create_text_to_speech(
                 text_to_produce_speech=_ANNOUNCEMENT_MESSAGE["online_message"])
 
             while True:
+                # Only utterances that pass the local wake word gate reach the cloud.
                 query = self._set_speech_recognizer.initiate_speech_recognition_once(
-                speech_recognizer=speech_recognizer)
+                speech_recognizer=speech_recognizer,
+                utterance_gate=self._wake_word_gate.passes_wake_gate)
+
+                # A wake word the recognizer missed by a character or two still wakes Julie.
+                wake_phrase: (str | None) = self._wake_word_matcher.match_phrase(query=query)
+
+                if wake_phrase is not None:
+                    self._wake_word_gate.confirm_wake_word(wake_phrase=wake_phrase)
 
-                if query in wake_words_to_activate_julie:
                     initiate_julie(
                         speech_recognizer=speech_recognizer,
                         set_speech_recognizer=self._set_speech_recognizer,
                         text_to_speech_handler=self._text_to_speech_handler)
 
-                sleep(1)
+        except EOFError:
+            print(_ANNOUNCEMENT_MESSAGE["end_of_audio_message"],
+                  self._set_speech_recognizer.create_latency_summary())
 
         except KeyboardInterrupt:
+            self._set_speech_recognizer.save_noise_calibration()
+
             print(_ANNOUNCEMENT_MESSAGE["termination_message"])
             self._text_to_speech_handler.create_text_to_speech(
                 text_to_produce_speech=_ANNOUNCEMENT_MESSAGE["termination_message"])
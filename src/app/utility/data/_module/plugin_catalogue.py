@@ -0,0 +1,130 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+plugin_catalogue.py:
+====================
+This file contains the catalogue of plugins: every command and skill Julie knows,
+with its phrases and the functions that handle it.
+
+Overview:
+=========
+- Only names and phrases live here, a plugin's module is imported the first time one of its
+intents fires. Adding a plugin does not add to Julie's startup time.
+- Phrases are matched whole, a slot such as {application_name} captures the rest of the query.
+Slots after the same phrase are tried in catalogue order.
+- Commands run by priority: Gemini (0) is pre-empted by any command (1).
+"stop" and the exit phrases run inline, in the listening loop.
+The star chart, not the stars.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include internal typings.
+from typing import Tuple
+
+# Include custom packages and modules.
+from src.app.utility.data._module.wake_words import wake_words_to_self_describe,\
+    wake_words_to_exit_program
+from src.app.utility.handler._class.plugin_registry.plugin_registry import\
+    (Plugin, PluginIntent, )
+
+
+PLUGIN_CATALOGUE: Tuple[Plugin, ...] = (
+    Plugin(plugin_name="julie_command",
+           module_path="src.app.utility.helper._module.julie_command.julie_command",
+           intents=(
+               PluginIntent(intent_name="self_describe", phrases=wake_words_to_self_describe,
+                            handler_name="describe_julie"),
+               PluginIntent(intent_name="stop_commands", handler_name="stop_commands",
+                            should_run_inline=True, phrases=(
+                                "stop", "stop it", "cancel", "cancel that", "never mind",
+                                "nevermind", "be quiet", "quiet")),
+               PluginIntent(intent_name="exit_program", phrases=wake_words_to_exit_program,
+                            handler_name="exit_program", should_run_inline=True),
+           )),
+
+    # "go to" starts a lot of questions ("go to the moon"), it only opens installed
+    # applications. "open" opens anything, so the user hears which application is missing.
+    Plugin(plugin_name="app_opener",
+           module_path="src.app.utility.helper._module.app_opener.app_opener",
+           intents=(
+               PluginIntent(intent_name="open_application", phrases=("open {application_name}",),
+                            handler_name="open_requested_application"),
+               PluginIntent(intent_name="open_application",
+                            phrases=("go to {application_name}",),
+                            handler_name="open_requested_application",
+                            slot_validator_name="is_installed_application"),
+           )),
+
+    Plugin(plugin_name="clock",
+           module_path="src.app.utility.helper._module.local_skill.clock.clock_skill",
+           intents=(
+               PluginIntent(intent_name="tell_time", handler_name="tell_time", phrases=(
+                   "what time is it", "what's the time", "what is the time", "tell me the time",
+                   "what's the time now", "what is the time now", "current time",
+                   "time please")),
+               PluginIntent(intent_name="tell_date", handler_name="tell_date", phrases=(
+                   "what's the date", "what is the date", "what's today's date",
+                   "what is today's date", "what day is it", "what day is today", "what's today",
+                   "what is today", "tell me the date", "today's date")),
+           )),
+
+    Plugin(plugin_name="arithmetic",
+           module_path="src.app.utility.helper._module.local_skill.arithmetic.arithmetic_skill",
+           intents=(
+               PluginIntent(intent_name="calculate", handler_name="calculate",
+                            slot_validator_name="is_arithmetic_expression", phrases=(
+                                "what is {expression}", "what's {expression}",
+                                "calculate {expression}", "compute {expression}",
+                                "how much is {expression}")),
+           )),
+
+    Plugin(plugin_name="unit_conversion",
+           module_path=("src.app.utility.helper._module.local_skill.unit_conversion"
+                        ".unit_conversion_skill"),
+           intents=(
+               PluginIntent(intent_name="convert_units", handler_name="convert_units",
+                            slot_validator_name="is_unit_conversion", phrases=(
+                                "convert {conversion}", "what is {conversion}",
+                                "what's {conversion}", "how much is {conversion}")),
+           )),
+
+    Plugin(plugin_name="timer",
+           module_path="src.app.utility.helper._module.local_skill.timer.timer_skill",
+           intents=(
+               PluginIntent(intent_name="set_timer", handler_name="set_timer",
+                            slot_validator_name="is_timer_duration", phrases=(
+                                "set a timer for {duration}", "set timer for {duration}",
+                                "set the timer for {duration}", "start a timer for {duration}",
+                                "start timer for {duration}", "timer for {duration}")),
+           )),
+
+    # Every query no other plugin handles.
+    Plugin(plugin_name="gemini_ai",
+           module_path=("src.app.utility.helper._module.artificial_intelligence"
+                        ".googles_gemini_ai.gemini_ai"),
+           fallback_handler_name="ask_gemini_ai",
+           fallback_priority=0,
+           warm_up_service_names=("gemini_ai_model",)),
+)
@@ -0,0 +1,65 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+prompt_phrases.py:
+==================
+This file contains the fixed phrases Julie speaks over and over, such as her prompts,
+announcements and apologies.
+These are the phrases the speech audio cache renders ahead of time (--warm-tts-cache).
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include internal typings.
+from typing import Tuple
+
+
+ASSIST_PROMPT: str = "How can I assist you today?"
+
+PLEASE_WAIT_PROMPT: str = "Please wait!"
+
+ONLINE_ANNOUNCEMENT: str = "Julie is online. Say \"Hey Julie\"\n"
+
+ADJUSTING_NOISE_ANNOUNCEMENT: str = "Adjusting for ambient noise. Please wait.\n"
+
+TERMINATION_ANNOUNCEMENT: str = """The program has been terminated using the Control + C shortcut.
+Thank you for using my service.\nWishing you a great day ahead!\n"""
+
+EXIT_ANNOUNCEMENT: str = "Thank you for using my service. Exiting Program. Take Care!"
+
+NOT_UNDERSTOOD_APOLOGY: str = (
+    "Sorry, I didn't catch that. Could you please rephrase or clarify your question?\n")
+
+CONNECTION_APOLOGY: str = (
+    "Oops! It seems there's an issue with your connection.\n"
+    "Please check your internet settings and try again for voice "
+    "recognition to work smoothly.\n")
+
+CANNOT_HELP_APOLOGY: str = "Sorry! I cant help you with this. Please try something else!"
+
+prompt_phrases_to_prerender: Tuple[str, ...] = (
+    ASSIST_PROMPT, PLEASE_WAIT_PROMPT, ONLINE_ANNOUNCEMENT, ADJUSTING_NOISE_ANNOUNCEMENT,
+    TERMINATION_ANNOUNCEMENT, EXIT_ANNOUNCEMENT, NOT_UNDERSTOOD_APOLOGY, CONNECTION_APOLOGY,
+    CANNOT_HELP_APOLOGY,
+)
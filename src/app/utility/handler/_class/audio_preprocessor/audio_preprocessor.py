@@ -0,0 +1,141 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+audio_preprocessor.py:
+======================
+This file contains AudioPreprocessor class, responsible to shrink an utterance before it is
+encoded and uploaded to the speech recognizer.
+
+Overview:
+=========
+- The silence around the speech is trimmed, only a short margin is kept.
+- Audio above 16 kHz is resampled to 16 kHz, the recognizers downsample it to that anyway.
+- The gain is normalized, so quiet speakers reach the recognizer at a usable level.
+- The utterance is read straight from the capture ring buffer and processed one block at a time,
+the only full copy is the 16 bit output.
+- The captured and uploaded byte counts of every utterance are logged, and summed up.
+Pack light for the trip to orbit.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+
+# Include internal typings.
+from typing import ClassVar, Dict
+
+# Include external packages and modules.
+import numpy as np
+from speech_recognition import AudioData # type: ignore
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.helper._module.audio_features.audio_features import\
+    (find_speech_bounds, resample_polyphase, )
+
+
+@dataclass
+class AudioPreprocessor:
+    """Class to trim, resample and normalize an utterance before it is uploaded."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Audio above this sample rate is resampled to it, lower rates are left as they are.
+    _target_sample_rate: ClassVar[int] = 16000
+
+    # Steps quieter than this (in dB below the loudest step) are trimmed from both ends,
+    # keeping a short margin, the recognizers cut words that start on the first sample.
+    _trim_decibels: ClassVar[float] = 40.0
+    _margin_seconds: ClassVar[float] = 0.1
+
+    # The peak is normalized to this share of full scale, without boosting noise too much.
+    _target_peak: ClassVar[float] = 0.7
+    _max_gain: ClassVar[float] = 8.0
+
+    _byte_counts: Dict[str, int] = field(default_factory=lambda: {
+        "utterances": 0,
+        "captured_bytes": 0,
+        "uploaded_bytes": 0,
+    })
+
+    def preprocess_audio(self, frame_data: (bytes | memoryview), sample_rate: int,
+                         sample_width: int) -> AudioData:
+        """Trim, resample and normalize the PCM frames of an utterance.
+
+        Args:
+            - frame_data (bytes | memoryview): The PCM frames, such as an Utterance's view
+            into the capture ring buffer. They are only read.
+            - sample_rate (int): The sample rate of the frames.
+            - sample_width (int): The number of bytes per sample.
+
+        Returns:
+            - AudioData: The preprocessed 16 bit audio.
+        """
+
+        samples: np.ndarray = np.frombuffer(frame_data, dtype=f"<i{sample_width}")
+
+        start_index, end_index = find_speech_bounds(samples=samples, sample_rate=sample_rate,
+                                                    trim_decibels=self._trim_decibels)
+        margin_length: int = int(self._margin_seconds * sample_rate)
+
+        output_sample_rate: int = min(sample_rate, self._target_sample_rate)
+        output_samples: np.ndarray = resample_polyphase(
+            samples=samples[max(0, start_index - margin_length):end_index + margin_length],
+            from_sample_rate=sample_rate,
+            to_sample_rate=output_sample_rate,
+            sample_scale=1.0 / 2 ** (8 * sample_width - 1))
+
+        peak: float = float(np.abs(output_samples).max()) if len(output_samples) else 0.0
+
+        if peak:
+            output_samples *= np.float32(min(self._max_gain, self._target_peak / peak))
+
+        np.clip(output_samples, -1.0, 1.0, out=output_samples)
+        output_samples *= np.float32(2 ** 15 - 1)
+
+        output_frame_data: bytes = output_samples.astype("<i2").tobytes()
+
+        self._count_bytes(captured_bytes=len(samples) * sample_width,
+                          uploaded_bytes=len(output_frame_data))
+
+        return AudioData(output_frame_data, output_sample_rate, 2)
+
+    def get_byte_counts(self) -> Dict[str, int]:
+        """Return a copy of the utterance, captured byte and uploaded byte counters."""
+
+        return dict(self._byte_counts)
+
+    def _count_bytes(self, captured_bytes: int, uploaded_bytes: int) -> None:
+        """Count the bytes of an utterance and log them."""
+
+        self._byte_counts["utterances"] += 1
+        self._byte_counts["captured_bytes"] += captured_bytes
+        self._byte_counts["uploaded_bytes"] += uploaded_bytes
+
+        self._log_handler.create_log(
+            log_type="info",
+            log_message=(f"Utterance preprocessed from {captured_bytes} to "
+                         f"{uploaded_bytes} bytes."))
@@ -0,0 +1,162 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+audio_ring_buffer.py:
+=====================
+This file contains AudioRingBuffer class, a fixed size preallocated buffer for PCM frames.
+
+Overview:
+=========
+- The buffer is allocated once, writes copy the frames into it and never allocate.
+- Every frame is stored twice, at its offset and at its offset + capacity.
+Because of this mirror, any window of up to capacity bytes is contiguous,
+and reading it is a zero copy memoryview slice, even when the window wraps around.
+- Positions are absolute byte counts since the buffer was created, so a reader can tell
+if the frames it wants have already been overwritten. Like a space station orbit,
+it keeps going round, but the mission clock never resets.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+from threading import Lock
+
+
+@dataclass
+class AudioRingBuffer:
+    """Class to store the most recent PCM frames in a fixed size preallocated buffer.
+
+    Example:
+        - ring_buffer = AudioRingBuffer(capacity=32000)
+        - end_position = ring_buffer.write_frames(frames=chunk)
+        - frames = ring_buffer.read_frames(start_position=0, end_position=end_position)
+    """
+
+    # The buffer size in bytes, round it to a multiple of the sample width.
+    capacity: int
+
+    _buffer: bytearray = field(init=False)
+    _buffer_view: memoryview = field(init=False)
+
+    # Total amount of bytes written since the buffer was created.
+    _write_position: int = 0
+    _write_lock: Lock = field(default_factory=Lock)
+
+    def __post_init__(self):
+        if self.capacity <= 0:
+            raise ValueError("Please note that the ring buffer capacity must be positive.")
+
+        # Twice the capacity, for the mirrored copy of every frame.
+        self._buffer = bytearray(2 * self.capacity)
+        self._buffer_view = memoryview(self._buffer)
+
+    @property
+    def write_position(self) -> int:
+        """The absolute position right after the most recently written byte."""
+
+        return self._write_position
+
+    @property
+    def oldest_position(self) -> int:
+        """The absolute position of the oldest byte that is still available."""
+
+        return max(0, self._write_position - self.capacity)
+
+    def write_frames(self, frames: bytes) -> int:
+        """Copy the given PCM frames into the buffer.
+
+        Args:
+            - frames (bytes): The PCM frames, any bytes-like object is accepted.
+            If it is longer than the capacity only its last capacity bytes are kept.
+
+        Returns:
+            - int: The absolute write position after the frames have been written.
+        """
+
+        frames_view: memoryview = memoryview(frames).cast("B")
+
+        with self._write_lock:
+            if len(frames_view) > self.capacity:
+                self._write_position += len(frames_view) - self.capacity
+                frames_view = frames_view[-self.capacity:]
+
+            frames_length: int = len(frames_view)
+            offset: int = self._write_position % self.capacity
+
+            # Offset + length never exceeds twice the capacity, so this is a single copy.
+            self._buffer_view[offset:offset + frames_length] = frames_view
+
+            # Mirror the part in the first half into the second half and vice versa.
+            first_half_length: int = min(frames_length, self.capacity - offset)
+            self._buffer_view[offset + self.capacity:offset + self.capacity + first_half_length] = (
+                frames_view[:first_half_length])
+            self._buffer_view[:frames_length - first_half_length] = (
+                frames_view[first_half_length:])
+
+            self._write_position += frames_length
+
+        return self._write_position
+
+    def read_frames(self, start_position: int, end_position: int) -> memoryview:
+        """Return a zero copy view of the frames between the two absolute positions.
+
+        Args:
+            - start_position (int): Absolute position of the first byte.
+            - end_position (int): Absolute position right after the last byte.
+
+        Returns:
+            - memoryview: A read only view into the buffer.
+            The view stays valid until the writer has moved capacity bytes past start_position,
+            use is_available to check it before using an old view.
+
+        Raises:
+            - ValueError: if the frames are not (or no longer) in the buffer.
+        """
+
+        if not self.is_available(start_position=start_position, end_position=end_position):
+            raise ValueError(
+                f"Frames {start_position}:{end_position} are not available, the buffer holds "
+                f"{self.oldest_position}:{self._write_position}.")
+
+        offset: int = start_position % self.capacity
+
+        return self._buffer_view[offset:offset + end_position - start_position].toreadonly()
+
+    def is_available(self, start_position: int, end_position: (int | None) = None) -> bool:
+        """Check if the frames between the two absolute positions are still in the buffer.
+
+        Args:
+            - start_position (int): Absolute position of the first byte.
+            - end_position (int | None): Absolute position right after the last byte,
+            defaults to the current write position.
+
+        Returns:
+            - bool: True if the frames can be read.
+        """
+
+        if end_position is None:
+            end_position = self._write_position
+
+        return self.oldest_position <= start_position <= end_position <= self._write_position
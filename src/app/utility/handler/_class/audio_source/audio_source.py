@@ -0,0 +1,319 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+audio_source.py:
+================
+This file contains the audio sources the listening pipeline can capture from.
+- MicrophoneAudioSource: the shared speech_recognition Microphone.
+- WaveFileAudioSource: a recorded WAV file, replayed as fast as possible or in real time.
+- PcmStreamAudioSource: raw PCM frames from a pipe, such as the standard input.
+- InMemoryAudioSource: PCM frames that are already in memory, for benchmarks.
+
+Overview:
+=========
+Recorded audio lets the whole wake word, command and response loop run without a sound card,
+such as on a CI box. Ground control to Major Tom, no microphone required.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+import sys
+import wave
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from time import perf_counter, sleep
+
+# Include internal typings.
+from typing import BinaryIO
+
+# Include external packages and modules.
+import numpy as np
+from speech_recognition import Microphone # type: ignore
+
+# Include custom packages and modules.
+from src.app.design_pattern.strategy.abstract.blueprint.abstract_audio_source\
+    .abstract_audio_source import AbstractAudioSource
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+
+# The Microphone is only created the first time it is needed.
+SERVICE_LOADER.register_service("speech_recognizer_microphone", Microphone)
+
+
+@dataclass
+class MicrophoneAudioSource(AbstractAudioSource):
+    """Class to capture audio from the shared speech_recognition Microphone."""
+
+    # Keeps the Microphone's context open from open_audio_source until close_audio_source.
+    _exit_stack: ExitStack = field(default_factory=ExitStack)
+
+    @property
+    def _microphone(self) -> Microphone:
+        """The shared Microphone, created by the service loader on first use."""
+
+        return SERVICE_LOADER.get_service("speech_recognizer_microphone")
+
+    @property
+    def source_name(self) -> str:
+        """The name the latencies are reported under."""
+
+        return "microphone"
+
+    @property
+    def sample_rate(self) -> int:
+        """The Microphone's sample rate in Hz."""
+
+        return self._microphone.SAMPLE_RATE
+
+    @property
+    def sample_width(self) -> int:
+        """The Microphone's sample width in bytes."""
+
+        return self._microphone.SAMPLE_WIDTH
+
+    @property
+    def is_live(self) -> bool:
+        """The Microphone is always live."""
+
+        return True
+
+    def open_audio_source(self) -> None:
+        """Open the shared Microphone's stream."""
+
+        self._exit_stack.enter_context(self._microphone)
+
+    def read_chunk(self) -> bytes:
+        """Read one chunk from the Microphone, blocking until it is recorded."""
+
+        return self._microphone.stream.read(self._microphone.CHUNK)
+
+    def close_audio_source(self) -> None:
+        """Close the shared Microphone's stream."""
+
+        self._exit_stack.close()
+
+
+@dataclass
+class WaveFileAudioSource(AbstractAudioSource):
+    """Class to replay a 16 or 32 bit WAV file, multi channel files are mixed down to mono."""
+
+    file_path: str
+
+    # Replay at the speed it was recorded, instead of as fast as the consumers keep up.
+    is_realtime: bool = False
+
+    # The number of frames per chunk.
+    chunk_size: int = 1024
+
+    _wave_file: (wave.Wave_read | None) = None
+    _replay_started_at: float = 0.0
+    _replayed_frames: int = 0
+
+    @property
+    def source_name(self) -> str:
+        """The name the latencies are reported under."""
+
+        return f"wave_file:{self.file_path}"
+
+    @property
+    def sample_rate(self) -> int:
+        """The WAV file's sample rate in Hz."""
+
+        return self._get_wave_file().getframerate()
+
+    @property
+    def sample_width(self) -> int:
+        """The WAV file's sample width in bytes."""
+
+        return self._get_wave_file().getsampwidth()
+
+    @property
+    def is_live(self) -> bool:
+        """A WAV file is only live when it is replayed in real time."""
+
+        return self.is_realtime
+
+    def open_audio_source(self) -> None:
+        """Open the WAV file, it is replayed from the start on every open.
+
+        Raises:
+            - ValueError: if the WAV file is not 16 or 32 bit.
+        """
+
+        self.close_audio_source()
+        self._wave_file = wave.open(self.file_path, "rb") # pylint: disable=consider-using-with
+
+        if self._wave_file.getsampwidth() not in (2, 4):
+            self.close_audio_source()
+            raise ValueError(f"Only 16 and 32 bit WAV files can be replayed: {self.file_path}")
+
+        self._replay_started_at = perf_counter()
+        self._replayed_frames = 0
+
+    def read_chunk(self) -> bytes:
+        """Read the next mono chunk, an empty chunk once the file has ended."""
+
+        wave_file: wave.Wave_read = self._get_wave_file()
+        chunk: bytes = wave_file.readframes(self.chunk_size)
+        channels: int = wave_file.getnchannels()
+
+        if chunk and channels > 1:
+            sample_type: str = f"<i{wave_file.getsampwidth()}"
+            chunk = (np.frombuffer(chunk, dtype=sample_type).reshape(-1, channels)
+                     .mean(axis=1).astype(sample_type).tobytes())
+
+        if self.is_realtime:
+            self._replayed_frames += len(chunk) // wave_file.getsampwidth()
+            sleep(max(0.0, self._replay_started_at + self._replayed_frames / self.sample_rate
+                      - perf_counter()))
+
+        return chunk
+
+    def close_audio_source(self) -> None:
+        """Close the WAV file if it is open."""
+
+        if self._wave_file is not None:
+            self._wave_file.close()
+            self._wave_file = None
+
+    def _get_wave_file(self) -> wave.Wave_read:
+        """Return the open WAV file, opening it to read the format if it is not open yet."""
+
+        if self._wave_file is None:
+            self.open_audio_source()
+
+        return self._wave_file # type: ignore
+
+
+@dataclass
+class PcmStreamAudioSource(AbstractAudioSource):
+    """Class to capture mono little endian PCM frames from a pipe, such as the standard input.
+
+    Example:
+        - sox corpus.wav -t raw -r 16000 -b 16 -c 1 -e signed - | python oojda_main.py --replay -
+    """
+
+    stream: BinaryIO = field(default_factory=lambda: sys.stdin.buffer)
+
+    # The raw frames carry no header, so their format has to be given.
+    pcm_sample_rate: int = 16000
+    pcm_sample_width: int = 2
+
+    # The number of frames per chunk.
+    chunk_size: int = 1024
+
+    @property
+    def source_name(self) -> str:
+        """The name the latencies are reported under."""
+
+        return "pcm_stream"
+
+    @property
+    def sample_rate(self) -> int:
+        """The given sample rate in Hz."""
+
+        return self.pcm_sample_rate
+
+    @property
+    def sample_width(self) -> int:
+        """The given sample width in bytes."""
+
+        return self.pcm_sample_width
+
+    @property
+    def is_live(self) -> bool:
+        """A pipe is read as fast as it is written."""
+
+        return False
+
+    def open_audio_source(self) -> None:
+        """The stream is opened by whoever passed it in."""
+
+    def read_chunk(self) -> bytes:
+        """Read the next chunk, an empty chunk once the stream has ended."""
+
+        chunk: bytes = self.stream.read(self.chunk_size * self.pcm_sample_width)
+
+        # Drop a trailing partial sample, it cannot be decoded.
+        return chunk[:len(chunk) - len(chunk) % self.pcm_sample_width]
+
+    def close_audio_source(self) -> None:
+        """The stream is closed by whoever passed it in."""
+
+
+@dataclass
+class InMemoryAudioSource(AbstractAudioSource):
+    """Class to capture PCM frames that are already in memory, without any file or device."""
+
+    frame_data: bytes
+    pcm_sample_rate: int = 16000
+    pcm_sample_width: int = 2
+
+    # The number of frames per chunk.
+    chunk_size: int = 1024
+
+    _read_position: int = 0
+
+    @property
+    def source_name(self) -> str:
+        """The name the latencies are reported under."""
+
+        return "in_memory"
+
+    @property
+    def sample_rate(self) -> int:
+        """The given sample rate in Hz."""
+
+        return self.pcm_sample_rate
+
+    @property
+    def sample_width(self) -> int:
+        """The given sample width in bytes."""
+
+        return self.pcm_sample_width
+
+    @property
+    def is_live(self) -> bool:
+        """The frames are already in memory."""
+
+        return False
+
+    def open_audio_source(self) -> None:
+        """Rewind to the first frame."""
+
+        self._read_position = 0
+
+    def read_chunk(self) -> bytes:
+        """Read the next chunk, an empty chunk once every frame has been read."""
+
+        chunk_length: int = self.chunk_size * self.pcm_sample_width
+        chunk: bytes = self.frame_data[self._read_position:self._read_position + chunk_length]
+        self._read_position += len(chunk)
+
+        return chunk
+
+    def close_audio_source(self) -> None:
+        """Skip the remaining frames."""
+
+        self._read_position = len(self.frame_data)
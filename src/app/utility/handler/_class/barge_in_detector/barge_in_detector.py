@@ -0,0 +1,202 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+barge_in_detector.py:
+=====================
+This file contains BargeInDetector class, responsible to stop Julie's speech as soon as the user
+talks over her, so nobody has to sit through a long answer to say "stop".
+
+Overview:
+=========
+- It runs on the capture thread, and looks at every captured chunk while Julie is speaking.
+- Julie's own voice reaches the microphone too. Its level is followed with a peak envelope,
+and only audio clearly louder than it (and louder than the speech threshold of the
+VoiceActivityDetector) counts as the user.
+- Once the user has been talking for a moment, the SpeechOutputWorker is interrupted:
+the text being spoken stops after its current chunk, every queued text is dropped.
+- The barge-in latency (from the moment the user started talking until Julie was silent)
+is logged and averaged.
+Houston, the crew would like a word.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from collections import deque
+from dataclasses import dataclass, field
+from math import exp
+from time import perf_counter
+
+# Include internal typings.
+from typing import Any, ClassVar, Deque, Dict, List
+
+# Include external packages and modules.
+import numpy as np
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.helper._module.audio_features.audio_features import convert_pcm_to_samples
+
+
+@dataclass
+class BargeInDetector:
+    """Class to interrupt Julie's speech once the user talks over it."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # The user must be this much louder than Julie's echo, for at least this long.
+    # Shorter bursts are a cough, or a loud syllable of Julie's own.
+    _echo_energy_ratio: ClassVar[float] = 2.0
+    _min_barge_in_seconds: ClassVar[float] = 0.3
+
+    # Julie's echo is followed this long (time constant in seconds) after its last peak.
+    _echo_decay_seconds: ClassVar[float] = 1.0
+
+    # Nothing counts as a barge-in during the first moment of the speech, the echo level
+    # is still being learned.
+    _echo_learning_seconds: ClassVar[float] = 0.2
+
+    _echo_energy: float = 0.0
+    _playback_seconds: float = 0.0
+    _barge_in_seconds: float = 0.0
+
+    # Latency (in seconds) of the most recent barge-ins.
+    _barge_in_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
+
+    _barge_in_counts: Dict[str, int] = field(default_factory=lambda: {
+        "barge_ins": 0,
+        "interrupted_texts": 0,
+    })
+
+    def process_chunk(self, chunk: bytes, sample_rate: int, sample_width: int,
+                      energy_threshold: float) -> (float | None):
+        """Look at the next captured chunk, and interrupt Julie if the user talks over her.
+
+        Args:
+            - chunk (bytes): The PCM frames of the chunk.
+            - sample_rate (int): The sample rate of the frames.
+            - sample_width (int): The number of bytes per sample.
+            - energy_threshold (float): The speech threshold of the VoiceActivityDetector,
+            in 16 bit sample RMS units.
+
+        Returns:
+            - float | None: The moment (perf_counter) the user started talking over Julie,
+            None if Julie was not interrupted by this chunk.
+        """
+
+        speech_output_worker: Any = self._get_speech_output_worker()
+
+        if speech_output_worker is None or not speech_output_worker.is_speaking:
+            self._playback_seconds = 0.0
+            self._barge_in_seconds = 0.0
+            self._echo_energy = 0.0
+
+            return None
+
+        chunk_seconds: float = len(chunk) / (sample_rate * sample_width)
+        samples: np.ndarray = convert_pcm_to_samples(frame_data=chunk, sample_width=sample_width)
+
+        if samples.size == 0:
+            return None
+
+        chunk_energy: float = float(np.sqrt(np.mean(np.square(samples)))) * 32768.0
+        self._playback_seconds += chunk_seconds
+
+        is_louder_than_echo: bool = (
+            self._playback_seconds > self._echo_learning_seconds
+            and chunk_energy > max(energy_threshold, self._echo_energy * self._echo_energy_ratio))
+
+        if not is_louder_than_echo:
+            # The user's own voice must not become the echo level.
+            self._echo_energy = max(
+                chunk_energy,
+                self._echo_energy * exp(-chunk_seconds / self._echo_decay_seconds))
+            self._barge_in_seconds = 0.0
+
+            return None
+
+        self._barge_in_seconds += chunk_seconds
+
+        if self._barge_in_seconds < self._min_barge_in_seconds:
+            return None
+
+        barge_in_started_at: float = perf_counter() - self._barge_in_seconds
+        self._interrupt(speech_output_worker=speech_output_worker,
+                        barge_in_started_at=barge_in_started_at)
+
+        self._playback_seconds = 0.0
+        self._barge_in_seconds = 0.0
+
+        return barge_in_started_at
+
+    def get_average_barge_in_latency(self) -> float:
+        """Return the average barge-in latency (in seconds) of the recent barge-ins."""
+
+        if not self._barge_in_latencies:
+            return 0.0
+
+        return sum(self._barge_in_latencies) / len(self._barge_in_latencies)
+
+    def get_barge_in_counts(self) -> Dict[str, int]:
+        """Return a copy of the barge-in and interrupted text counters.
+
+        Returns:
+            - Dict[str, int]: The counters.
+        """
+
+        return dict(self._barge_in_counts)
+
+    def _get_speech_output_worker(self) -> Any:
+        """Return the speech output worker, None if Julie has not spoken yet."""
+
+        # The capture thread must not be the one that starts the text to speech engine.
+        if not SERVICE_LOADER.is_service_loaded("speech_output_worker"):
+            return None
+
+        return SERVICE_LOADER.get_service("speech_output_worker")
+
+    def _interrupt(self, speech_output_worker: Any, barge_in_started_at: float) -> None:
+        """Interrupt the speech, and record the latency once the interrupted text is silent."""
+
+        interrupted_handles: List[Any] = speech_output_worker.interrupt_speech()
+
+        if not interrupted_handles:
+            return
+
+        self._barge_in_counts["barge_ins"] += 1
+        self._barge_in_counts["interrupted_texts"] += len(interrupted_handles)
+
+        def _record_barge_in_latency(speech_handle: Any) -> None:
+            barge_in_latency: float = speech_handle.done_time - barge_in_started_at
+            self._barge_in_latencies.append(barge_in_latency)
+
+            self._log_handler.create_log(
+                log_type="info",
+                log_message=(f"Barge-in: Julie was silent {barge_in_latency * 1000:.0f} ms "
+                             f"after the user started talking, {len(interrupted_handles) - 1} "
+                             f"queued texts dropped. Counts: {self._barge_in_counts}"))
+
+        interrupted_handles[0].add_done_callback(_record_barge_in_latency)
@@ -0,0 +1,328 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+command_executor.py:
+====================
+This file contains CommandExecutor class, responsible to run the commands (opening an
+application, asking Gemini) on worker threads, where they can be cancelled and pre-empted.
+
+Overview:
+=========
+- Every command gets a CancellationToken. A cancelled command is not started, and whatever it
+would still say is not spoken (see is_current_command_cancelled).
+- Commands have a priority, a higher priority runs first. A new command cancels the running
+commands of a lower priority (pre-emption), and queues behind the ones of the same or a higher one.
+- submit_command returns a CommandHandle, the listening loop waits on it for a moment,
+so a quick command's answer is spoken before Julie prompts again.
+- The executor is bounded: a few daemon worker threads, and a few pending commands.
+Once the queue is full, the lowest priority pending command is dropped.
+- A cancelled command may still be finishing (such as waiting on Gemini's answer),
+the next command does not wait for it, it runs on another worker.
+Ground control can abort any burn.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+import heapq
+from dataclasses import dataclass, field
+from itertools import count
+from threading import Condition, Event, Thread, local
+
+# Include internal typings.
+from typing import Callable, ClassVar, Dict, Iterator, List, Tuple
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# The cancellation token of the command the current worker thread runs.
+_COMMAND_STATE: local = local()
+
+
+@dataclass
+class CancellationToken:
+    """Tells a command it has been cancelled, such as by "stop" or a more urgent command."""
+
+    _cancelled_event: Event = field(default_factory=Event)
+
+    @property
+    def is_cancelled(self) -> bool:
+        """True once the command has been cancelled."""
+
+        return self._cancelled_event.is_set()
+
+    def cancel(self) -> None:
+        """Cancel the command."""
+
+        self._cancelled_event.set()
+
+    def wait(self, timeout: float) -> bool:
+        """Sleep up to timeout seconds, waking up early if the command is cancelled.
+
+        Args:
+            - timeout (float): The number of seconds to sleep.
+
+        Returns:
+            - bool: True if the command has been cancelled.
+        """
+
+        return self._cancelled_event.wait(timeout=timeout)
+
+
+@dataclass
+class CommandHandle:
+    """Tells the submitter when its command has finished, and lets it cancel the command."""
+
+    cancellation_token: CancellationToken
+    _finished_event: Event
+
+    @property
+    def is_finished(self) -> bool:
+        """True once the command has run, failed, or been dropped or cancelled before it ran."""
+
+        return self._finished_event.is_set()
+
+    def cancel(self) -> None:
+        """Cancel the command."""
+
+        self.cancellation_token.cancel()
+
+    def wait(self, timeout: (float | None) = None) -> bool:
+        """Wait until the command has finished.
+
+        Args:
+            - timeout (float | None): The number of seconds to wait at most, defaults to no limit.
+
+        Returns:
+            - bool: True if the command has finished.
+        """
+
+        return self._finished_event.wait(timeout=timeout)
+
+
+@dataclass
+class _Command:
+    """A submitted command, its cancellation token, and when it has finished."""
+
+    command_name: str
+    priority: int
+    command_function: Callable[[], None]
+    cancellation_token: CancellationToken = field(default_factory=CancellationToken)
+    finished_event: Event = field(default_factory=Event)
+
+
+def get_current_cancellation_token() -> (CancellationToken | None):
+    """Return the cancellation token of the command this thread runs.
+
+    Returns:
+        - CancellationToken | None: The token, None outside of a command.
+    """
+
+    return getattr(_COMMAND_STATE, "cancellation_token", None)
+
+def is_current_command_cancelled() -> bool:
+    """Check if the command this thread runs has been cancelled.
+
+    Returns:
+        - bool: True if it has, False if it has not or outside of a command.
+    """
+
+    cancellation_token: (CancellationToken | None) = get_current_cancellation_token()
+
+    return cancellation_token is not None and cancellation_token.is_cancelled
+
+
+@dataclass
+class CommandExecutor:
+    """Class to run commands on a bounded pool of worker threads, by priority."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Two workers let a new command run while a cancelled one is still finishing.
+    _max_workers: ClassVar[int] = 2
+
+    # Once this many commands are pending, the lowest priority one is dropped.
+    _max_pending_commands: ClassVar[int] = 4
+
+    # (-priority, submission order, command), the next command to run is first.
+    _pending_commands: List[Tuple[int, int, _Command]] = field(default_factory=lambda: [])
+    _running_commands: List[_Command] = field(default_factory=lambda: [])
+    _commands_condition: Condition = field(default_factory=Condition)
+    _submission_counter: Iterator[int] = field(default_factory=count)
+    _workers: List[Thread] = field(default_factory=lambda: [])
+
+    _command_counts: Dict[str, int] = field(default_factory=lambda: {
+        "submitted": 0,
+        "completed": 0,
+        "preempted": 0,
+        "dropped": 0,
+        "cancelled": 0,
+        "failed": 0,
+    })
+
+    def submit_command(self, command_name: str, priority: int,
+                       command_function: Callable[[], None]) -> CommandHandle:
+        """Queue a command, pre-empting the running commands of a lower priority.
+
+        Args:
+            - command_name (str): The name of the command, such as its intent name.
+            - priority (int): The priority, a higher priority runs first.
+            - command_function (Callable[[], None]): The command.
+
+        Returns:
+            - CommandHandle: The handle that waits for, or cancels the command.
+        """
+
+        command: _Command = _Command(command_name=command_name, priority=priority,
+                                     command_function=command_function)
+
+        with self._commands_condition:
+            self._start_workers()
+            self._command_counts["submitted"] += 1
+
+            for running_command in self._running_commands:
+                if (running_command.priority < priority
+                        and not running_command.cancellation_token.is_cancelled):
+                    running_command.cancellation_token.cancel()
+                    self._command_counts["preempted"] += 1
+                    self._log_handler.create_log(
+                        log_type="info",
+                        log_message=(f"Command {command_name} pre-empted "
+                                     f"{running_command.command_name}."))
+
+            heapq.heappush(self._pending_commands,
+                           (-priority, next(self._submission_counter), command))
+
+            if len(self._pending_commands) > self._max_pending_commands:
+                dropped_entry: Tuple[int, int, _Command] = max(self._pending_commands)
+                dropped_command: _Command = dropped_entry[2]
+                self._pending_commands.remove(dropped_entry)
+                heapq.heapify(self._pending_commands)
+
+                dropped_command.cancellation_token.cancel()
+                dropped_command.finished_event.set()
+                self._command_counts["dropped"] += 1
+                self._log_handler.create_log(
+                    log_type="warning",
+                    log_message=(f"Too many pending commands, "
+                                 f"{dropped_command.command_name} was dropped."))
+
+            self._commands_condition.notify_all()
+
+        return CommandHandle(cancellation_token=command.cancellation_token,
+                             _finished_event=command.finished_event)
+
+    def cancel_commands(self) -> int:
+        """Cancel every running and pending command.
+
+        Returns:
+            - int: The number of commands cancelled.
+        """
+
+        with self._commands_condition:
+            commands: List[_Command] = [
+                command for command in self._running_commands
+                if not command.cancellation_token.is_cancelled]
+            pending_commands: List[_Command] = [
+                command for _, _, command in self._pending_commands]
+            commands.extend(pending_commands)
+            self._pending_commands.clear()
+
+            for command in commands:
+                command.cancellation_token.cancel()
+
+            # A pending command never runs, it has finished as soon as it is cancelled.
+            for command in pending_commands:
+                command.finished_event.set()
+
+            self._command_counts["cancelled"] += len(commands)
+
+        if commands:
+            self._log_handler.create_log(
+                log_type="info",
+                log_message=(f"Cancelled {len(commands)} commands: "
+                             f"{[command.command_name for command in commands]}"))
+
+        return len(commands)
+
+    def get_command_counts(self) -> Dict[str, int]:
+        """Return a copy of the submitted, completed, pre-empted, dropped, cancelled
+        and failed command counters."""
+
+        with self._commands_condition:
+            return dict(self._command_counts)
+
+    def _start_workers(self) -> None:
+        """Start the worker threads on the first command, the condition must be held."""
+
+        while len(self._workers) < self._max_workers:
+            worker: Thread = Thread(target=self._run_worker, daemon=True,
+                                    name=f"oojda-command-worker-{len(self._workers)}")
+            self._workers.append(worker)
+            worker.start()
+
+    def _can_start_next_command(self) -> bool:
+        """Check if a command is pending, and no uncancelled command is running."""
+
+        return bool(self._pending_commands) and all(
+            command.cancellation_token.is_cancelled for command in self._running_commands)
+
+    def _run_worker(self) -> None:
+        """Run pending commands one at a time, for as long as Julie runs."""
+
+        while True:
+            with self._commands_condition:
+                self._commands_condition.wait_for(self._can_start_next_command)
+
+                command: _Command = heapq.heappop(self._pending_commands)[2]
+                self._running_commands.append(command)
+
+            _COMMAND_STATE.cancellation_token = command.cancellation_token
+            command_result: str = "failed"
+
+            try:
+                command.command_function()
+                command_result = "completed"
+
+            except Exception as err: # pylint: disable=broad-exception-caught
+                self._log_handler.create_log(
+                    log_type="error",
+                    log_message=f"Command {command.command_name} failed. {err}")
+
+            finally:
+                _COMMAND_STATE.cancellation_token = None
+
+                with self._commands_condition:
+                    self._running_commands.remove(command)
+                    self._command_counts[command_result] += 1
+                    self._commands_condition.notify_all()
+
+                command.finished_event.set()
+
+
+# The worker threads are only started with the first command.
+SERVICE_LOADER.register_service("command_executor", CommandExecutor)
@@ -0,0 +1,247 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+fuzzy_phrase_matcher.py:
+========================
+This file contains FuzzyPhraseMatcher class, responsible to match a recognized query to the
+nearest of a fixed set of phrases, such as "hey julia" to "hey julie".
+
+Overview:
+=========
+- The phrases are indexed once in a BK-tree, keyed by their character edit distance.
+A lookup only compares the query against the few phrases that can be within the distance budget,
+about a dozen comparisons for the wake words.
+- A match must be within the distance budget, both absolute and relative to the phrase length,
+so "exit" never matches "edit". A tie between two phrases is no match.
+- Queries just outside the budget are counted and logged as near misses,
+the counters show whether the budget is too tight or too loose for the user's microphone.
+Close enough for orbit, not for docking.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+
+# Include internal typings.
+from typing import ClassVar, Dict, List, Tuple
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.helper._module.command_grammar.command_grammar import normalize_query
+
+
+def compute_edit_distance(first_text: str, second_text: str) -> int:
+    """Compute the Levenshtein distance between two texts.
+
+    Args:
+        - first_text (str): The first text.
+        - second_text (str): The second text.
+
+    Returns:
+        - int: The number of character insertions, deletions and substitutions.
+    """
+
+    if len(first_text) < len(second_text):
+        first_text, second_text = second_text, first_text
+
+    previous_row: List[int] = list(range(len(second_text) + 1))
+
+    for first_index, first_character in enumerate(first_text, start=1):
+        current_row: List[int] = [first_index]
+
+        for second_index, second_character in enumerate(second_text, start=1):
+            current_row.append(min(previous_row[second_index] + 1,
+                                   current_row[second_index - 1] + 1,
+                                   previous_row[second_index - 1]
+                                   + (first_character != second_character)))
+
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+@dataclass
+class _BKTreeNode:
+    """A phrase, and its child nodes by their edit distance to it."""
+
+    phrase: str
+    children: Dict[int, "_BKTreeNode"] = field(default_factory=lambda: {})
+
+
+@dataclass
+class FuzzyPhraseMatcher:
+    """Class to match queries to the nearest fixed phrase with a BK-tree, within a budget."""
+
+    phrases: Tuple[str, ...] = ()
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # A match is at most this many edits away, and at most this share of the phrase length.
+    _max_distance: int = 2
+    _max_distance_ratio: float = 0.15
+
+    # Queries this many edits past the budget are still counted as near misses.
+    _near_miss_margin: ClassVar[int] = 2
+
+    # Log the counters every this many lookups.
+    _report_interval: ClassVar[int] = 50
+
+    _root: (_BKTreeNode | None) = None
+    _exact_phrases: Dict[str, str] = field(default_factory=lambda: {})
+
+    _match_counts: Dict[str, int] = field(default_factory=lambda: {
+        "exact": 0,
+        "corrected": 0,
+        "near_misses": 0,
+        "misses": 0,
+    })
+
+    def __post_init__(self) -> None:
+        """Index the phrases."""
+
+        for phrase in self.phrases:
+            normalized_phrase: str = normalize_query(query=phrase)
+
+            if normalized_phrase in self._exact_phrases:
+                continue
+
+            self._exact_phrases[normalized_phrase] = phrase
+            self._insert_phrase(phrase=normalized_phrase)
+
+    def match_phrase(self, query: str) -> (str | None):
+        """Find the phrase the query was meant to be.
+
+        Args:
+            - query (str): The recognized query.
+
+        Returns:
+            - str | None: The phrase as it was given, None if no phrase is within the budget
+            or two phrases are equally near.
+        """
+
+        normalized_query: str = normalize_query(query=query)
+
+        if normalized_query in self._exact_phrases:
+            self._count_match(match_result="exact")
+
+            return self._exact_phrases[normalized_query]
+
+        if not normalized_query:
+            return None
+
+        nearest_phrases: List[Tuple[int, str]] = sorted(self._find_phrases_within(
+            query=normalized_query, max_distance=self._max_distance + self._near_miss_margin))
+
+        if not nearest_phrases:
+            self._count_match(match_result="misses")
+
+            return None
+
+        distance, phrase = nearest_phrases[0]
+        is_tied: bool = len(nearest_phrases) > 1 and nearest_phrases[1][0] == distance
+
+        if (is_tied or distance > self._max_distance
+                or distance > self._max_distance_ratio * len(phrase)):
+            self._count_match(match_result="near_misses")
+            self._log_handler.create_log(
+                log_type="info",
+                log_message=(f"Near miss: \"{normalized_query}\" is {distance} edits from "
+                             f"\"{phrase}\"{' (tied)' if is_tied else ''}."))
+
+            return None
+
+        self._count_match(match_result="corrected")
+        self._log_handler.create_log(
+            log_type="info",
+            log_message=f"Corrected \"{normalized_query}\" to \"{phrase}\" ({distance} edits).")
+
+        return self._exact_phrases[phrase]
+
+    def correct_query(self, query: str) -> str:
+        """Return the phrase the query was meant to be, or the query itself.
+
+        Args:
+            - query (str): The recognized query.
+
+        Returns:
+            - str: The matched phrase, the unchanged query if no phrase matches.
+        """
+
+        return self.match_phrase(query=query) or query
+
+    def get_match_counts(self) -> Dict[str, int]:
+        """Return a copy of the exact, corrected, near miss and miss counters."""
+
+        return dict(self._match_counts)
+
+    def _insert_phrase(self, phrase: str) -> None:
+        """Insert a normalized phrase into the BK-tree."""
+
+        if self._root is None:
+            self._root = _BKTreeNode(phrase=phrase)
+
+            return
+
+        node: _BKTreeNode = self._root
+
+        while True:
+            distance: int = compute_edit_distance(phrase, node.phrase)
+
+            if distance not in node.children:
+                node.children[distance] = _BKTreeNode(phrase=phrase)
+
+                return
+
+            node = node.children[distance]
+
+    def _find_phrases_within(self, query: str, max_distance: int) -> List[Tuple[int, str]]:
+        """Find every phrase within max_distance edits of the query, with its distance."""
+
+        found_phrases: List[Tuple[int, str]] = []
+        pending_nodes: List[_BKTreeNode] = [self._root] if self._root else []
+
+        while pending_nodes:
+            node: _BKTreeNode = pending_nodes.pop()
+            distance: int = compute_edit_distance(query, node.phrase)
+
+            if distance <= max_distance:
+                found_phrases.append((distance, node.phrase))
+
+            # By the triangle inequality, only these subtrees can hold phrases within reach.
+            pending_nodes.extend(
+                child for child_distance, child in node.children.items()
+                if distance - max_distance <= child_distance <= distance + max_distance)
+
+        return found_phrases
+
+    def _count_match(self, match_result: str) -> None:
+        """Count the lookup result and log the counters now and then."""
+
+        self._match_counts[match_result] += 1
+
+        if sum(self._match_counts.values()) % self._report_interval == 0:
+            self._log_handler.create_log(log_type="info",
+                                         log_message=f"Fuzzy phrase matches: {self._match_counts}")
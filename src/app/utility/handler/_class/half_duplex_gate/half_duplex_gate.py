@@ -0,0 +1,278 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+half_duplex_gate.py:
+====================
+This file contains HalfDuplexGate class, responsible to coordinate Julie's speech output with
+the audio capture, so Julie does not transcribe her own voice.
+
+Overview:
+=========
+- The SpeechOutputWorker marks when Julie starts and stops speaking. Audio captured meanwhile,
+and for a short tail after (room echo, output buffers), is gated.
+- The ListeningPipeline tags the gated chunks. An utterance captured mostly while Julie spoke
+(and that did not barge in on her) is dropped before it reaches the speech recognizer,
+the avoided recognizer calls are counted.
+- Optional (--echo-suppression): the PCM Julie plays is kept as a reference signal. Its delayed,
+scaled copy is found in every gated chunk by cross correlation, and subtracted from it.
+Only audio played from PCM (cached or pipelined texts) has a reference signal.
+Like every good radio: talk, say over, then listen.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from collections import deque
+from dataclasses import dataclass, field
+from threading import Lock
+from time import perf_counter
+
+# Include internal typings.
+from typing import ClassVar, Deque, Dict, List, Tuple
+
+# Include external packages and modules.
+import numpy as np
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.helper._module.audio_features.audio_features import\
+    (convert_pcm_to_samples, resample_polyphase, )
+
+
+@dataclass
+class HalfDuplexGate:
+    """Class to gate the audio captured while Julie speaks, and to suppress her echo in it."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Audio captured up to this long after Julie stopped speaking is gated too.
+    tail_seconds: ClassVar[float] = 0.3
+
+    # Subtract Julie's own voice (the reference signal) from the gated audio.
+    is_echo_suppression_enabled: ClassVar[bool] = False
+
+    # The echo is searched up to this late after the reference was played,
+    # and is at most this much louder than the reference.
+    _max_echo_delay_seconds: ClassVar[float] = 0.3
+    _max_echo_gain: ClassVar[float] = 4.0
+
+    # Log the counters every this many avoided recognizer calls.
+    _report_interval: ClassVar[int] = 20
+
+    _capture_sample_rate: int = 16000
+    _is_playing: bool = False
+    _playback_ended_at: float = float("-inf")
+
+    # (Played at, samples at the capture sample rate) of the most recently played chunks.
+    _reference_chunks: Deque[Tuple[float, np.ndarray]] = field(
+        default_factory=lambda: deque(maxlen=64))
+    _reference_lock: Lock = field(default_factory=Lock)
+
+    _gate_counts: Dict[str, int] = field(default_factory=lambda: {
+        "gated_chunks": 0,
+        "suppressed_chunks": 0,
+        "avoided_recognitions": 0,
+    })
+
+    def start_playback(self) -> None:
+        """Mark that Julie has started speaking.
+
+        Returns:
+            - None.
+        """
+
+        self._is_playing = True
+
+    def stop_playback(self) -> None:
+        """Mark that Julie has stopped speaking, the gate stays closed for the tail.
+
+        Returns:
+            - None.
+        """
+
+        self._playback_ended_at = perf_counter()
+        self._is_playing = False
+
+        with self._reference_lock:
+            # The reference is only needed until the tail has passed.
+            while (self._reference_chunks
+                   and self._reference_chunks[0][0] < self._playback_ended_at
+                   - self._max_echo_delay_seconds - HalfDuplexGate.tail_seconds):
+                self._reference_chunks.popleft()
+
+    def is_gated(self) -> bool:
+        """Check if audio captured right now may hold Julie's voice.
+
+        Returns:
+            - bool: True while Julie speaks, and for the tail after.
+        """
+
+        return (self._is_playing
+                or perf_counter() - self._playback_ended_at < HalfDuplexGate.tail_seconds)
+
+    def set_capture_sample_rate(self, sample_rate: int) -> None:
+        """Set the sample rate of the captured audio, the reference is resampled to it.
+
+        Args:
+            - sample_rate (int): The sample rate of the audio source.
+
+        Returns:
+            - None.
+        """
+
+        self._capture_sample_rate = sample_rate
+
+    def feed_reference(self, frame_data: bytes, sample_rate: int, sample_width: int,
+                       channels: int) -> None:
+        """Keep a chunk of the PCM Julie is playing, as the reference signal of her echo.
+
+        Args:
+            - frame_data (bytes): The PCM frames written to the sound card.
+            - sample_rate (int): The sample rate of the frames.
+            - sample_width (int): The number of bytes per sample.
+            - channels (int): The number of interleaved channels.
+
+        Returns:
+            - None.
+        """
+
+        if not HalfDuplexGate.is_echo_suppression_enabled:
+            return
+
+        samples: np.ndarray = convert_pcm_to_samples(frame_data=frame_data,
+                                                     sample_width=sample_width)
+
+        if channels > 1:
+            samples = samples[:len(samples) // channels * channels].reshape(
+                -1, channels).mean(axis=1)
+
+        samples = resample_polyphase(samples=samples, from_sample_rate=sample_rate,
+                                     to_sample_rate=self._capture_sample_rate)
+
+        with self._reference_lock:
+            self._reference_chunks.append((perf_counter(), samples))
+
+    def suppress_echo(self, chunk: bytes, sample_width: int) -> bytes:
+        """Count a gated chunk, and subtract Julie's echo from it if echo suppression is on.
+
+        Args:
+            - chunk (bytes): The PCM frames of the chunk, just captured.
+            - sample_width (int): The number of bytes per sample.
+
+        Returns:
+            - bytes: The chunk without the echo, the chunk itself if there is no reference.
+        """
+
+        self._gate_counts["gated_chunks"] += 1
+
+        if not HalfDuplexGate.is_echo_suppression_enabled:
+            return chunk
+
+        samples: np.ndarray = convert_pcm_to_samples(frame_data=chunk, sample_width=sample_width)
+        reference_samples: (np.ndarray | None) = self._get_reference_samples(
+            chunk_length=len(samples))
+
+        if reference_samples is None:
+            return chunk
+
+        echo_samples: np.ndarray = self._estimate_echo(samples=samples,
+                                                       reference_samples=reference_samples)
+        self._gate_counts["suppressed_chunks"] += 1
+
+        full_scale: float = float(2 ** (8 * sample_width - 1))
+
+        return np.clip(np.rint((samples - echo_samples) * full_scale),
+                       -full_scale, full_scale - 1).astype(f"<i{sample_width}").tobytes()
+
+    def count_avoided_recognition(self) -> None:
+        """Count an utterance of Julie's own voice that was not sent to the speech recognizer.
+
+        Returns:
+            - None.
+        """
+
+        self._gate_counts["avoided_recognitions"] += 1
+
+        if self._gate_counts["avoided_recognitions"] % self._report_interval == 0:
+            self._log_handler.create_log(log_type="info",
+                                         log_message=f"Half duplex gate: {self._gate_counts}")
+
+    def get_gate_counts(self) -> Dict[str, int]:
+        """Return a copy of the gated chunk, suppressed chunk and avoided recognition counters.
+
+        Returns:
+            - Dict[str, int]: The counters.
+        """
+
+        return dict(self._gate_counts)
+
+    def _get_reference_samples(self, chunk_length: int) -> (np.ndarray | None):
+        """Return the reference played within the echo delay before the chunk, oldest first."""
+
+        captured_at: float = perf_counter()
+        window_seconds: float = (chunk_length / self._capture_sample_rate
+                                 + self._max_echo_delay_seconds)
+
+        with self._reference_lock:
+            reference_chunks: List[np.ndarray] = [
+                samples for played_at, samples in self._reference_chunks
+                if played_at >= captured_at - window_seconds]
+
+        if not reference_chunks:
+            return None
+
+        reference_samples: np.ndarray = np.concatenate(reference_chunks)
+
+        # Silence before the reference, so every alignment of the chunk is possible.
+        return np.concatenate((np.zeros(chunk_length, dtype=np.float32), reference_samples))
+
+    def _estimate_echo(self, samples: np.ndarray, reference_samples: np.ndarray) -> np.ndarray:
+        """Find the delay and gain of the reference that best explain the chunk."""
+
+        chunk_length: int = len(samples)
+        fft_length: int = 1 << (len(reference_samples) + chunk_length - 1).bit_length()
+
+        # correlations[delay] = sum(reference_samples[delay + i] * samples[i]), one FFT each.
+        correlations: np.ndarray = np.fft.irfft(
+            np.fft.rfft(reference_samples, fft_length)
+            * np.conj(np.fft.rfft(samples, fft_length)),
+            fft_length)[:len(reference_samples) - chunk_length + 1]
+
+        cumulative_energy: np.ndarray = np.concatenate(
+            ([0.0], np.cumsum(np.square(reference_samples, dtype=np.float64))))
+        energies: np.ndarray = cumulative_energy[chunk_length:] - cumulative_energy[:-chunk_length]
+        energies = np.maximum(energies, 1e-9)
+
+        # The alignment that removes the most energy from the chunk.
+        delay: int = int(np.argmax(np.square(correlations) / energies))
+        gain: float = float(np.clip(correlations[delay] / energies[delay],
+                                    0.0, self._max_echo_gain))
+
+        return gain * reference_samples[delay:delay + chunk_length]
+
+
+# The speech output worker and the capture thread share the gate.
+SERVICE_LOADER.register_service("half_duplex_gate", HalfDuplexGate)
@@ -0,0 +1,224 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+intent_router.py:
+=================
+This file contains IntentRouter class, responsible to find which intent (command) a query is,
+and to extract its slots, such as the application name of "open spotify".
+
+Overview:
+=========
+- Every intent is declared with its phrases, such as "exit" or "open {application_name}".
+A slot must be the last token of a phrase, it captures the rest of the query.
+- The phrases are compiled into a trie over the normalized tokens when they are registered,
+so routing a query walks it once, token by token, however many intents there are.
+- Only whole queries match, "what time does the store open" is not an open command.
+- Every routed query counts a hit for its intent, or for "unmatched".
+All systems go, every signal finds its channel.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+
+# Include internal typings.
+from typing import Callable, ClassVar, Dict, List, Set, Tuple
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.helper._module.command_grammar.command_grammar import normalize_query
+
+
+@dataclass(frozen=True)
+class IntentMatch:
+    """The intent a query was routed to, and the values of its slots."""
+
+    intent_name: str
+    slots: Dict[str, str] = field(default_factory=lambda: {})
+
+
+@dataclass
+class _IntentTrieNode:
+    """A trie node, reached by the tokens of a phrase so far."""
+
+    children: Dict[str, "_IntentTrieNode"] = field(default_factory=lambda: {})
+
+    # The intent of the phrase that ends at this node.
+    intent_name: (str | None) = None
+
+    # The phrases that continue with a slot at this node: (intent name, slot name, validator),
+    # tried in the order they were registered.
+    slot_intents: List[Tuple[str, str, (Callable[[str], bool] | None)]] = field(
+        default_factory=lambda: [])
+
+    # Every intent whose phrases pass through this node.
+    reachable_intent_names: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class IntentRouter:
+    """Class to route queries to intents with a token trie, and count the hits."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    _root: _IntentTrieNode = field(default_factory=_IntentTrieNode)
+
+    # Log the counters every this many routed queries.
+    _report_interval: ClassVar[int] = 50
+
+    _intent_counts: Dict[str, int] = field(default_factory=lambda: {"unmatched": 0})
+
+    def register_intent(self, intent_name: str, phrases: Tuple[str, ...],
+                        slot_validator: (Callable[[str], bool] | None) = None) -> None:
+        """Compile the phrases of an intent into the trie.
+
+        Args:
+            - intent_name (str): The name of the intent, such as: exit_program.
+            - phrases (Tuple[str, ...]): The phrases, a phrase may end with a slot token
+            such as {application_name}.
+            - slot_validator (Callable[[str], bool] | None): Optional check of the slot value,
+            a query with a rejected value is not routed to this intent.
+
+        Returns:
+            - None.
+
+        Raises:
+            - ValueError: if a slot is not the last token of its phrase.
+        """
+
+        for phrase in phrases:
+            tokens: List[str] = phrase.split()
+            node: _IntentTrieNode = self._root
+            node.reachable_intent_names.add(intent_name)
+
+            for token_index, token in enumerate(tokens):
+                if token.startswith("{") and token.endswith("}"):
+                    if token_index != len(tokens) - 1:
+                        raise ValueError(
+                            f"Alert: The slot {token} must be the last token of \"{phrase}\".")
+
+                    node.slot_intents.append((intent_name, token[1:-1], slot_validator))
+                    break
+
+                node = node.children.setdefault(normalize_query(token), _IntentTrieNode())
+                node.reachable_intent_names.add(intent_name)
+
+            else:
+                node.intent_name = intent_name
+
+        self._intent_counts.setdefault(intent_name, 0)
+
+    def route(self, query: str) -> (IntentMatch | None):
+        """Route a query to its intent, and count the hit.
+
+        Args:
+            - query (str): The voice query.
+
+        Returns:
+            - IntentMatch | None: The intent and its slots, None if no intent matches.
+        """
+
+        intent_match: (IntentMatch | None) = self.match_intent(query=query)
+
+        self._intent_counts[intent_match.intent_name if intent_match else "unmatched"] += 1
+
+        if sum(self._intent_counts.values()) % self._report_interval == 0:
+            self._log_handler.create_log(log_type="info",
+                                         log_message=f"Intent hits: {self._intent_counts}")
+
+        return intent_match
+
+    def match_intent(self, query: str,
+                     should_validate_slots: bool = True) -> (IntentMatch | None):
+        """Find the intent of a query, without counting a hit.
+
+        - A whole phrase wins over a slot, a longer phrase before the slot wins over a shorter one.
+        Slots after the same phrase are tried in the order they were registered.
+
+        Args:
+            - query (str): The voice query.
+            - should_validate_slots (bool): False accepts any slot value, such as for a partial
+            hypothesis that ends mid word.
+
+        Returns:
+            - IntentMatch | None: The intent and its slots, None if no intent matches.
+        """
+
+        tokens: List[str] = normalize_query(query).split()
+        node: (_IntentTrieNode | None) = self._root
+        slot_candidates: List[Tuple[_IntentTrieNode, int]] = []
+
+        for token_index, token in enumerate(tokens):
+            if node.slot_intents: # type: ignore
+                slot_candidates.append((node, token_index)) # type: ignore
+
+            node = node.children.get(token) # type: ignore
+
+            if node is None:
+                break
+
+        if node is not None and tokens and node.intent_name is not None:
+            return IntentMatch(intent_name=node.intent_name)
+
+        for slot_node, token_index in reversed(slot_candidates):
+            slot_value: str = " ".join(tokens[token_index:])
+
+            for intent_name, slot_name, slot_validator in slot_node.slot_intents:
+                if (not should_validate_slots or slot_validator is None
+                        or slot_validator(slot_value)):
+                    return IntentMatch(intent_name=intent_name, slots={slot_name: slot_value})
+
+        return None
+
+    def match_unambiguous_phrase(self, query: str) -> (IntentMatch | None):
+        """Find the intent of a query that may still grow, such as a partial hypothesis.
+
+        Args:
+            - query (str): The voice query so far.
+
+        Returns:
+            - IntentMatch | None: The intent, only if the query is a whole phrase and every
+            longer phrase it starts belongs to the same intent. Slots never match.
+        """
+
+        node: (_IntentTrieNode | None) = self._root
+
+        for token in normalize_query(query).split():
+            node = node.children.get(token) # type: ignore
+
+            if node is None:
+                return None
+
+        if (node is self._root or node.intent_name is None # type: ignore
+                or node.reachable_intent_names != {node.intent_name}): # type: ignore
+            return None
+
+        return IntentMatch(intent_name=node.intent_name) # type: ignore
+
+    def get_intent_counts(self) -> Dict[str, int]:
+        """Return a copy of the hit counter of every intent, and of the unmatched queries."""
+
+        return dict(self._intent_counts)
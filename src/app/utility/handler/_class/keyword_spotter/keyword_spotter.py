@@ -0,0 +1,312 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+keyword_spotter.py:
+===================
+This file contains KeywordSpotter class, responsible to recognize short keywords offline.
+Such as: the wake words, by comparing MFCC features against enrolled templates with DTW.
+
+Overview:
+=========
+- Templates are enrolled from utterances that were already confirmed,
+for example by the cloud recognizer, so the spotter learns the user's own voice.
+- Every label gets its own match threshold, derived from how far its templates are apart
+from each other, so no hand tuning is needed per microphone.
+- Templates are saved under oojda/data/configs/keyword_spotter and survive a restart.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+from itertools import combinations
+from os import path, remove
+from threading import Lock
+
+# Include internal typings.
+from typing import ClassVar, Dict, List, Tuple
+
+# Include external packages and modules.
+import numpy as np
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.directory_operation.directory_operation\
+    import DirectoryOperation
+from src.app.utility.helper._module.audio_features.audio_features import\
+    (compute_dtw_distance, compute_mfcc, convert_pcm_to_samples, trim_silence, )
+
+
+@dataclass
+class KeywordSpotter:
+    """Class to match short utterances against enrolled keyword templates, offline."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Instantiate DirectoryOperation.
+    _directory_operation: DirectoryOperation = field(default_factory=DirectoryOperation)
+
+    # The keyword templates default location.
+    _templates_directory_path: ClassVar[str] = "oojda/data/configs/keyword_spotter"
+    _templates_file_name: str = "keyword_templates.npz"
+
+    # The newest templates are kept, the oldest one is replaced once a label is full.
+    _max_templates_per_label: ClassVar[int] = 8
+
+    # A match must be this close, relative to the average distance between the templates.
+    _match_threshold_margin: ClassVar[float] = 1.5
+
+    # Threshold used while a label only has a single template.
+    _default_match_threshold: ClassVar[float] = 6.0
+
+    # Frames quieter than this (in dB below the loudest frame) are trimmed from both ends.
+    _silence_trim_decibels: ClassVar[float] = 35.0
+
+    # Templates more than this many times longer or shorter are skipped without running DTW,
+    # they cannot be the same keyword.
+    _max_length_ratio: ClassVar[float] = 2.0
+
+    _templates: Dict[str, List[np.ndarray]] = field(default_factory=lambda: {})
+    _match_thresholds: Dict[str, float] = field(default_factory=lambda: {})
+    _templates_lock: Lock = field(default_factory=Lock)
+    _is_loaded: bool = False
+
+    def compute_features(self, frame_data: bytes, sample_rate: int,
+                         sample_width: int) -> np.ndarray:
+        """Compute the MFCC features of an utterance, with the silence around it trimmed.
+
+        Args:
+            - frame_data (bytes): The PCM frames of the utterance.
+            - sample_rate (int): The sample rate of the frames.
+            - sample_width (int): The number of bytes per sample.
+
+        Returns:
+            - np.ndarray: The features, shaped (frames, coefficients).
+        """
+
+        samples: np.ndarray = trim_silence(
+            samples=convert_pcm_to_samples(frame_data=frame_data, sample_width=sample_width),
+            sample_rate=sample_rate,
+            trim_decibels=self._silence_trim_decibels)
+
+        return compute_mfcc(samples=samples, sample_rate=sample_rate)
+
+    def enroll_features(self, label: str, features: np.ndarray) -> None:
+        """Add the features of a confirmed utterance as a template for the label.
+
+        Args:
+            - label (str): The keyword the utterance is known to contain.
+            - features (np.ndarray): The features from compute_features.
+
+        Returns:
+            - None.
+        """
+
+        if features.size == 0:
+            return
+
+        self._load_templates()
+
+        with self._templates_lock:
+            label_templates: List[np.ndarray] = self._templates.setdefault(label, [])
+            label_templates.append(features)
+            del label_templates[:-self._max_templates_per_label]
+            self._match_thresholds.pop(label, None)
+
+        self._save_templates()
+
+    def match_features(self, features: np.ndarray,
+                       labels: (Tuple[str, ...] | None) = None,
+                       min_margin_ratio: float = 0.0) -> Tuple[str, float]:
+        """Find the label whose templates are the closest to the features.
+
+        Args:
+            - features (np.ndarray): The features from compute_features.
+            - labels (Tuple[str, ...] | None): Only consider these labels, defaults to all.
+            - min_margin_ratio (float): Every other enrolled label, considered or not,
+            must be at least this many times farther away than the closest label.
+            Defaults to 0.0, no margin.
+
+        Returns:
+            - Tuple[str, float]: The closest label and its DTW distance.
+            The label is empty if no template is within that label's match threshold,
+            or if another label is too close to the closest one.
+        """
+
+        self._load_templates()
+
+        best_label: str = ""
+        best_distance: float = float("inf")
+
+        # A margin is measured against every enrolled label, not only the considered ones.
+        with self._templates_lock:
+            compared_templates: Dict[str, List[np.ndarray]] = {
+                label: list(templates) for label, templates in self._templates.items()
+                if min_margin_ratio > 0.0 or labels is None or label in labels}
+
+        label_distances: Dict[str, float] = {
+            label: min((
+                compute_dtw_distance(features, template) for template in templates
+                if (template.shape[0] <= self._max_length_ratio * features.shape[0]
+                    and features.shape[0] <= self._max_length_ratio * template.shape[0])),
+                default=float("inf"))
+            for label, templates in compared_templates.items()}
+
+        for label, label_distance in label_distances.items():
+            if labels is not None and label not in labels:
+                continue
+
+            if (label_distance <= self._get_match_threshold(label)
+                    and label_distance < best_distance):
+                best_label, best_distance = label, label_distance
+
+        runner_up_distance: float = min((
+            label_distance for label, label_distance in label_distances.items()
+            if label != best_label), default=float("inf"))
+
+        if best_label and runner_up_distance < min_margin_ratio * best_distance:
+            return "", best_distance
+
+        return best_label, best_distance
+
+    def get_template_count(self, label: str) -> int:
+        """Return how many templates have been enrolled for the label.
+
+        Args:
+            - label (str): The keyword label.
+
+        Returns:
+            - int: The number of templates.
+        """
+
+        self._load_templates()
+
+        return len(self._templates.get(label, []))
+
+    def get_template_counts(self) -> Dict[str, int]:
+        """Return how many templates have been enrolled for every label.
+
+        Returns:
+            - Dict[str, int]: The number of templates per label.
+        """
+
+        self._load_templates()
+
+        with self._templates_lock:
+            return {label: len(templates) for label, templates in self._templates.items()}
+
+    def remove_templates(self) -> None:
+        """Forget every enrolled template, and remove the saved templates file.
+
+        Returns:
+            - None.
+        """
+
+        with self._templates_lock:
+            self._templates.clear()
+            self._match_thresholds.clear()
+            self._is_loaded = True
+
+        try:
+            remove(path.join(self._templates_directory_path, self._templates_file_name))
+
+        except FileNotFoundError:
+            pass
+
+        except OSError as err:
+            self._log_handler.create_log(
+                log_type="error",
+                log_message=f"Keyword templates could not be removed. {err}")
+
+    def _get_match_threshold(self, label: str) -> float:
+        """Return (and cache) the match threshold of a label."""
+
+        if label not in self._match_thresholds:
+            templates: List[np.ndarray] = self._templates.get(label, [])
+            pairwise_distances: List[float] = [
+                compute_dtw_distance(first_template, second_template)
+                for first_template, second_template in combinations(templates, 2)]
+
+            self._match_thresholds[label] = (
+                self._match_threshold_margin * float(np.mean(pairwise_distances))
+                if pairwise_distances else self._default_match_threshold)
+
+        return self._match_thresholds[label]
+
+    def _load_templates(self) -> None:
+        """Load the saved templates the first time they are needed."""
+
+        if self._is_loaded:
+            return
+
+        self._is_loaded = True
+        _file_name_with_path: str = path.join(self._templates_directory_path,
+                                              self._templates_file_name)
+
+        if not path.exists(_file_name_with_path):
+            return
+
+        try:
+            with np.load(_file_name_with_path, allow_pickle=False) as saved_templates:
+                labels: np.ndarray = saved_templates["labels"]
+                lengths: np.ndarray = saved_templates["lengths"]
+                features: np.ndarray = saved_templates["features"]
+
+            with self._templates_lock:
+                for label, template in zip(labels, np.split(features, np.cumsum(lengths)[:-1])):
+                    self._templates.setdefault(str(label), []).append(template)
+
+        except (OSError, KeyError, ValueError) as err:
+            self._log_handler.create_log(
+                log_type="warning",
+                log_message=f"Keyword templates could not be loaded, starting fresh. {err}")
+
+    def _save_templates(self) -> None:
+        """Save every template into a single .npz file."""
+
+        with self._templates_lock:
+            labels: List[str] = []
+            templates: List[np.ndarray] = []
+
+            for label, label_templates in self._templates.items():
+                labels.extend([label] * len(label_templates))
+                templates.extend(label_templates)
+
+        if not templates:
+            return
+
+        try:
+            self._directory_operation.create_directory(
+                directory_path=self._templates_directory_path)
+
+            np.savez(path.join(self._templates_directory_path, self._templates_file_name),
+                     labels=np.array(labels),
+                     lengths=np.array([len(template) for template in templates]),
+                     features=np.concatenate(templates))
+
+        except OSError as err:
+            self._log_handler.create_log(
+                log_type="error",
+                log_message=f"Keyword templates could not be saved. {err}")
@@ -0,0 +1,165 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+noise_calibration.py:
+=====================
+This file contains NoiseCalibration class, responsible to save and load the ambient noise floor,
+so a restart does not have to sit through the blocking ambient noise calibration again.
+
+Overview:
+=========
+- The noise floor is saved under oojda/data/configs/audio, together with the audio source
+and the sample rate it was measured at. A profile from another source or rate is ignored.
+- While Julie is running the voice activity detector keeps refining the noise floor,
+the refined value is saved again now and then, only if it has noticeably changed.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+from datetime import datetime
+from os import path
+from time import monotonic
+
+# Include internal typings.
+from typing import Any, ClassVar, Dict
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.file_operation.file_operation import FileOperation
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+
+
+@dataclass
+class NoiseCalibration:
+    """Class to persist the ambient noise floor between launches."""
+
+    # Instantiate FileOperation.
+    _file_operation: FileOperation = field(default_factory=FileOperation)
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # The noise calibration default location.
+    _directory_path: ClassVar[str] = "oojda/data/configs/audio"
+    _file_name: ClassVar[str] = "noise_calibration.json"
+
+    # A refined noise floor is saved at most this often, and only if it changed this much.
+    _save_interval_seconds: ClassVar[float] = 300.0
+    _min_relative_change: ClassVar[float] = 0.1
+
+    _saved_noise_floor: float = 0.0
+    _last_saved_at: float = 0.0
+
+    def load_noise_floor(self, source_name: str, sample_rate: int) -> (float | None):
+        """Load the saved noise floor.
+
+        Args:
+            - source_name (str): The name of the audio source that is about to be used.
+            - sample_rate (int): The sample rate of that audio source.
+
+        Returns:
+            - float | None: The saved noise floor, None if there is no usable profile.
+        """
+
+        if not path.exists(path.join(self._directory_path, self._file_name)):
+            return None
+
+        calibration_data: Any = self._file_operation.create_file_operation(
+            file_contents="Read File",
+            directory_path=self._directory_path,
+            file_type="json",
+            file_name=self._file_name,
+            file_mode="r")
+
+        try:
+            if (calibration_data["SourceName"] != source_name
+                    or int(calibration_data["SampleRate"]) != sample_rate):
+                return None
+
+            self._saved_noise_floor = float(calibration_data["NoiseFloor"])
+
+        except (KeyError, TypeError, ValueError) as err:
+            self._log_handler.create_log(
+                log_type="warning",
+                log_message=f"Noise calibration could not be loaded, calibrating again. {err}")
+
+            return None
+
+        self._last_saved_at = monotonic()
+
+        return self._saved_noise_floor
+
+    def save_noise_floor(self, noise_floor: float, source_name: str, sample_rate: int) -> None:
+        """Save the noise floor.
+
+        Args:
+            - noise_floor (float): The noise floor in 16 bit sample RMS units.
+            - source_name (str): The name of the audio source it was measured on.
+            - sample_rate (int): The sample rate the noise floor was measured at.
+
+        Returns:
+            - None.
+        """
+
+        calibration_data: Dict[str, str] = {
+            "WARNING": "FILE GENERATED BY ORBITAL ORION JULIE DESKTOP ASSISTANT [DO NOT DELETE]",
+            "NoiseFloor": f"{noise_floor:.2f}",
+            "SourceName": source_name,
+            "SampleRate": str(sample_rate),
+            "UpdatedAt": datetime.now().isoformat(timespec="seconds"),
+        }
+
+        self._file_operation.create_file_operation(
+            file_contents=calibration_data,
+            directory_path=self._directory_path,
+            file_type="json",
+            file_name=self._file_name,
+            file_mode="w")
+
+        self._saved_noise_floor = noise_floor
+        self._last_saved_at = monotonic()
+
+    def refresh_noise_floor(self, noise_floor: float, source_name: str,
+                            sample_rate: int) -> None:
+        """Save a refined noise floor, if it is due and has noticeably changed.
+
+        Args:
+            - noise_floor (float): The current noise floor in 16 bit sample RMS units.
+            - source_name (str): The name of the audio source it was measured on.
+            - sample_rate (int): The sample rate the noise floor was measured at.
+
+        Returns:
+            - None.
+        """
+
+        if monotonic() - self._last_saved_at < self._save_interval_seconds:
+            return
+
+        if (self._saved_noise_floor and abs(noise_floor - self._saved_noise_floor)
+                < self._min_relative_change * self._saved_noise_floor):
+            return
+
+        self.save_noise_floor(noise_floor=noise_floor, source_name=source_name,
+                              sample_rate=sample_rate)
@@ -0,0 +1,353 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+plugin_registry.py:
+===================
+This file contains PluginRegistry class, responsible to route queries to the plugins that handle
+them, and to import a plugin's module only the first time one of its intents fires.
+
+Overview:
+=========
+- A Plugin only declares its module path, its intents with their phrases, and the names of its
+handler functions. Registering it compiles the phrases into the IntentRouter, nothing is imported.
+- A handler is called with the query's slots and the text_to_speech_handler. If it returns
+a text, the registry speaks it.
+- Handlers run on the CommandExecutor by their intent's priority, where they can be cancelled.
+The listening loop only waits a moment for them: a quick command's answer is queued before
+Julie's next prompt, a slow one (Gemini) keeps running while she listens, and can be stopped.
+Only the inline intents (such as "stop") run in the listening loop itself.
+- One plugin may be the fallback, it gets every query no intent matched (Gemini AI).
+- The import time of every plugin, and how often and how long its handlers ran, are recorded.
+Only the modules that are flown get loaded onto the rocket.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+from functools import partial
+from importlib import import_module
+from threading import Lock, Thread
+from time import perf_counter
+from types import ModuleType
+
+# Include internal typings.
+from typing import Any, Callable, ClassVar, Dict, Tuple
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.handler._class.command_executor.command_executor import\
+    (CommandExecutor, CommandHandle, )
+from src.app.utility.handler._class.intent_router.intent_router import\
+    (IntentMatch, IntentRouter, )
+from src.app.utility.handler._class.fuzzy_phrase_matcher.fuzzy_phrase_matcher\
+    import FuzzyPhraseMatcher
+
+
+@dataclass(frozen=True)
+class PluginIntent:
+    """An intent of a plugin, its phrases, and the names of its functions in the module."""
+
+    intent_name: str
+    phrases: Tuple[str, ...]
+    handler_name: str
+    slot_validator_name: (str | None) = None
+
+    # A higher priority runs first, and pre-empts the running commands of a lower priority.
+    priority: int = 1
+
+    # Run in the listening loop itself instead of on the CommandExecutor, such as "stop".
+    should_run_inline: bool = False
+
+
+@dataclass(frozen=True)
+class Plugin:
+    """A plugin, the module its functions live in, and its intents."""
+
+    plugin_name: str
+    module_path: str
+    intents: Tuple[PluginIntent, ...] = ()
+
+    # The handler of every query no intent matched, only one plugin may have one.
+    fallback_handler_name: (str | None) = None
+    fallback_priority: int = 0
+
+    # Services the module registers, created when the plugin is warmed up.
+    warm_up_service_names: Tuple[str, ...] = ()
+
+
+@dataclass
+class _PluginModules:
+    """The imported plugin modules, and how long importing and running them took."""
+
+    modules: Dict[str, ModuleType] = field(default_factory=lambda: {})
+    modules_lock: Lock = field(default_factory=Lock)
+
+    # Plugin name => import_seconds, executions and execute_seconds.
+    timings: Dict[str, Dict[str, float]] = field(default_factory=lambda: {})
+
+
+@dataclass
+class PluginRegistry:
+    """Class to route queries to plugins, loading their modules lazily and timing them."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Instantiate IntentRouter.
+    _intent_router: IntentRouter = field(default_factory=IntentRouter)
+
+    # A query a character or two off a fixed phrase is corrected before it is routed.
+    _phrase_matcher: (FuzzyPhraseMatcher | None) = None
+
+    _plugins: Dict[str, Plugin] = field(default_factory=lambda: {})
+    _intent_plugins: Dict[str, Tuple[Plugin, PluginIntent]] = field(default_factory=lambda: {})
+    # The fallback plugin, and the intent its fallback handler runs as.
+    _fallback_plugin_intent: (Tuple[Plugin, PluginIntent] | None) = None
+
+    # Instantiate _PluginModules.
+    _plugin_modules: _PluginModules = field(default_factory=_PluginModules)
+
+    # A command that finishes within this many seconds has its answer spoken before the next
+    # prompt, the speech output plays its texts in order.
+    _answer_grace_seconds: ClassVar[float] = 0.5
+
+    @property
+    def intent_router(self) -> IntentRouter:
+        """The router the intents of every plugin are compiled into."""
+
+        return self._intent_router
+
+    def register_plugin(self, plugin: Plugin) -> None:
+        """Compile the phrases of a plugin's intents, without importing its module.
+
+        Args:
+            - plugin (Plugin): The plugin.
+
+        Returns:
+            - None.
+
+        Raises:
+            - ValueError: if a second plugin declares a fallback handler.
+        """
+
+        if plugin.fallback_handler_name is not None:
+            if self._fallback_plugin_intent is not None:
+                raise ValueError(f"Alert: {self._fallback_plugin_intent[0].plugin_name} "
+                                 "is already the fallback plugin.")
+
+            self._fallback_plugin_intent = (plugin, PluginIntent(
+                intent_name=plugin.plugin_name, phrases=(),
+                handler_name=plugin.fallback_handler_name, # type: ignore
+                priority=plugin.fallback_priority))
+
+        for plugin_intent in plugin.intents:
+            self._intent_router.register_intent(
+                intent_name=plugin_intent.intent_name,
+                phrases=plugin_intent.phrases,
+                slot_validator=(
+                    partial(self._validate_slot, plugin, plugin_intent.slot_validator_name)
+                    if plugin_intent.slot_validator_name else None))
+
+            self._intent_plugins[plugin_intent.intent_name] = (plugin, plugin_intent)
+
+        self._plugins[plugin.plugin_name] = plugin
+        self._plugin_modules.timings[plugin.plugin_name] = {
+            "import_seconds": 0.0, "executions": 0, "execute_seconds": 0.0}
+        self._phrase_matcher = None
+
+    def handle_query(self, query: str, text_to_speech_handler: Any,
+                     should_use_fallback: bool = True) -> bool:
+        """Route a query to the plugin of its intent, or to the fallback plugin, and run it.
+
+        - The plugin's module is imported here, the handler itself is submitted to the
+        CommandExecutor, unless its intent runs inline.
+        - It returns once the handler has finished, or after a short grace at most, so the
+        listening loop is never blocked by a slow command.
+
+        Args:
+            - query (str): The voice query.
+            - text_to_speech_handler (Any): The text_to_speech_handler object to be used for
+            speaking text.
+            - should_use_fallback (bool): False leaves unmatched queries unhandled.
+
+        Returns:
+            - bool: True if a plugin handles the query, False if none does
+            or its module cannot be loaded.
+        """
+
+        intent_match: (IntentMatch | None) = self._intent_router.route(
+            query=self._get_phrase_matcher().correct_query(query=query))
+
+        if intent_match is not None:
+            plugin, plugin_intent = self._intent_plugins[intent_match.intent_name]
+            slots: Dict[str, str] = intent_match.slots
+
+        elif should_use_fallback and self._fallback_plugin_intent is not None:
+            plugin, plugin_intent = self._fallback_plugin_intent
+            slots = {"query": query}
+
+        else:
+            return False
+
+        try:
+            handler: Callable[[Dict[str, str], Any], (str | None)] = self._get_plugin_function(
+                plugin=plugin, function_name=plugin_intent.handler_name)
+
+        except (ImportError, AttributeError) as err:
+            self._log_handler.create_log(
+                log_type="error",
+                log_message=f"Plugin {plugin.plugin_name} could not be loaded. {err}")
+
+            return False
+
+        run_handler: Callable[[], None] = partial(
+            self._run_handler, plugin=plugin, handler_name=plugin_intent.handler_name,
+            handler=handler, slots=slots, text_to_speech_handler=text_to_speech_handler)
+
+        if plugin_intent.should_run_inline:
+            run_handler()
+
+            return True
+
+        command_executor: CommandExecutor = SERVICE_LOADER.get_service("command_executor")
+        command_handle: CommandHandle = command_executor.submit_command(
+            command_name=plugin_intent.intent_name, priority=plugin_intent.priority,
+            command_function=run_handler)
+
+        command_handle.wait(timeout=self._answer_grace_seconds)
+
+        return True
+
+    def warm_up_plugins(self, plugin_names: Tuple[str, ...]) -> Thread:
+        """Import the given plugins and create their services in a background daemon thread.
+
+        Args:
+            - plugin_names (Tuple[str, ...]): The names of the plugins to warm up.
+
+        Returns:
+            - Thread: The started warm up thread.
+        """
+
+        def _warm_up() -> None:
+            for plugin_name in plugin_names:
+                try:
+                    self._load_plugin_module(plugin=self._plugins[plugin_name])
+
+                    SERVICE_LOADER.warm_up_services(
+                        service_names=self._plugins[plugin_name].warm_up_service_names).join()
+
+                # A failing warm up must never take the assistant down,
+                # the error will surface again once the plugin is really used.
+                except Exception as err: # pylint: disable=broad-exception-caught
+                    self._log_handler.create_log(
+                        log_type="warning",
+                        log_message=f"Plugin {plugin_name} could not be warmed up. {err}")
+
+        warm_up_thread: Thread = Thread(target=_warm_up, name="oojda-plugin-warm-up", daemon=True)
+        warm_up_thread.start()
+
+        return warm_up_thread
+
+    def get_plugin_timings(self) -> Dict[str, Dict[str, float]]:
+        """Return a copy of the import and execute timings of every plugin.
+
+        Returns:
+            - Dict[str, Dict[str, float]]: The import_seconds, executions and execute_seconds
+            per plugin. import_seconds stays 0.0 until the plugin is first used.
+        """
+
+        return {plugin_name: dict(timings)
+                for plugin_name, timings in self._plugin_modules.timings.items()}
+
+    def _get_phrase_matcher(self) -> FuzzyPhraseMatcher:
+        """Return the fuzzy matcher over every phrase without a slot, built on first use."""
+
+        if self._phrase_matcher is None:
+            self._phrase_matcher = FuzzyPhraseMatcher(phrases=tuple(
+                phrase for _, plugin_intent in self._intent_plugins.values()
+                for phrase in plugin_intent.phrases if "{" not in phrase))
+
+        return self._phrase_matcher
+
+    def _load_plugin_module(self, plugin: Plugin) -> ModuleType:
+        """Import the module of a plugin on first use, and record how long it took."""
+
+        plugin_modules: _PluginModules = self._plugin_modules
+
+        with plugin_modules.modules_lock:
+            if plugin.plugin_name not in plugin_modules.modules:
+                import_start_time: float = perf_counter()
+                plugin_modules.modules[plugin.plugin_name] = import_module(plugin.module_path)
+
+                import_seconds: float = perf_counter() - import_start_time
+                plugin_modules.timings[plugin.plugin_name]["import_seconds"] = import_seconds
+
+                self._log_handler.create_log(
+                    log_type="info",
+                    log_message=f"Plugin {plugin.plugin_name} loaded in {import_seconds:.3f}s.")
+
+            return plugin_modules.modules[plugin.plugin_name]
+
+    def _get_plugin_function(self, plugin: Plugin, function_name: str) -> Callable[..., Any]:
+        """Return a function of a plugin's module, importing the module on first use."""
+
+        return getattr(self._load_plugin_module(plugin=plugin), function_name)
+
+    def _validate_slot(self, plugin: Plugin, slot_validator_name: str, slot_value: str) -> bool:
+        """Run a plugin's slot validator, a plugin that cannot be loaded accepts no slot."""
+
+        try:
+            return self._get_plugin_function(plugin=plugin,
+                                             function_name=slot_validator_name)(slot_value)
+
+        except (ImportError, AttributeError) as err:
+            self._log_handler.create_log(
+                log_type="error",
+                log_message=f"Plugin {plugin.plugin_name} could not be loaded. {err}")
+
+            return False
+
+    def _run_handler(self, plugin: Plugin, handler_name: str,
+                     handler: Callable[[Dict[str, str], Any], (str | None)],
+                     slots: Dict[str, str], text_to_speech_handler: Any) -> None:
+        """Run a plugin's handler, record its timing, and speak the text it returned."""
+
+        execute_start_time: float = perf_counter()
+        answer: (str | None) = handler(slots, text_to_speech_handler)
+        execute_seconds: float = perf_counter() - execute_start_time
+
+        plugin_timings: Dict[str, float] = self._plugin_modules.timings[plugin.plugin_name]
+        plugin_timings["executions"] += 1
+        plugin_timings["execute_seconds"] += execute_seconds
+
+        self._log_handler.create_log(
+            log_type="info",
+            log_message=(f"Plugin {plugin.plugin_name} ran {handler_name} in "
+                         f"{execute_seconds * 1000:.3f} ms, "
+                         f"{int(plugin_timings['executions'])} runs so far."))
+
+        if answer:
+            text_to_speech_handler.create_text_to_speech(text_to_produce_speech=answer)
@@ -0,0 +1,247 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+recognition_cache.py:
+=====================
+This file contains RecognitionCache class, responsible to remember what short utterances
+were recognized as, so a repeated "hey julie" or "open chrome" is not sent to the recognizer again.
+
+Overview:
+=========
+- Every utterance gets a compact audio fingerprint: the silence is trimmed, and the log mel
+band energies are hashed into 63 bits with a perceptual hash (see compute_perceptual_hash).
+The bits only depend on the coarse shape of the spectrum over time, not on how loud
+the user spoke or on the background noise.
+- Fingerprints that differ in only a few bits (and last about as long) are treated as the same
+utterance. The bit distances to every cached fingerprint are computed at once with NumPy.
+- The cache is bounded, the least recently used result is evicted first.
+Same signal, same answer. No need to phone home twice.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+
+# Include internal typings.
+from typing import ClassVar, Dict, Tuple
+
+# Include external packages and modules.
+import numpy as np
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.helper._module.audio_features.audio_features import\
+    (MelSpectrumSettings, compute_log_mel_energies, compute_perceptual_hash,
+     convert_pcm_to_samples, trim_silence, )
+
+
+@dataclass(frozen=True)
+class AudioFingerprint:
+    """The packed fingerprint bits of an utterance, and how long its speech lasted."""
+
+    fingerprint_bits: bytes
+    duration: float
+
+
+@dataclass
+class RecognitionCache:
+    """Class to cache recognition results by audio fingerprint, with LRU eviction."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # At most this many results are kept, the least recently used one is evicted first.
+    _max_entries: ClassVar[int] = 256
+
+    # Only short utterances (wake words and commands) repeat often enough to be worth caching.
+    _max_utterance_seconds: ClassVar[float] = 3.0
+
+    # The fingerprint covers this many time slices and mel bands, and has hash_size ** 2 - 1 bits.
+    _number_of_time_slices: ClassVar[int] = 16
+    _mel_spectrum_settings: ClassVar[MelSpectrumSettings] = MelSpectrumSettings(
+        number_of_mel_bands=16, max_frequency=4000.0)
+    _hash_size: ClassVar[int] = 8
+
+    # Fingerprints match if at most this share of their bits differ,
+    # and their durations differ by at most this share.
+    _max_bit_error_rate: ClassVar[float] = 0.15
+    _max_duration_difference: ClassVar[float] = 0.15
+
+    # Frames quieter than this (in dB below the loudest frame) are trimmed from both ends.
+    # Tighter than the keyword spotter, so the pre-roll and closing pause do not count.
+    _silence_trim_decibels: ClassVar[float] = 20.0
+
+    # Log the counters every this many lookups.
+    _report_interval: ClassVar[int] = 50
+
+    # Fingerprint bits => (duration, query), the most recently used entry is last.
+    _entries: "OrderedDict[bytes, Tuple[float, str]]" = field(default_factory=OrderedDict)
+    _entries_lock: Lock = field(default_factory=Lock)
+
+    _cache_counts: Dict[str, int] = field(default_factory=lambda: {
+        "hits": 0,
+        "near_hits": 0,
+        "misses": 0,
+        "evictions": 0,
+    })
+
+    def compute_fingerprint(self, frame_data: bytes, sample_rate: int,
+                            sample_width: int) -> (AudioFingerprint | None):
+        """Compute the fingerprint of an utterance.
+
+        Args:
+            - frame_data (bytes): The PCM frames of the utterance.
+            - sample_rate (int): The sample rate of the frames.
+            - sample_width (int): The number of bytes per sample.
+
+        Returns:
+            - AudioFingerprint | None: The fingerprint, None if the utterance is too long
+            or too short to be cached.
+        """
+
+        if len(frame_data) > self._max_utterance_seconds * sample_rate * sample_width:
+            return None
+
+        samples: np.ndarray = trim_silence(
+            samples=convert_pcm_to_samples(frame_data=frame_data, sample_width=sample_width),
+            sample_rate=sample_rate,
+            trim_decibels=self._silence_trim_decibels)
+
+        log_mel_energies: np.ndarray = compute_log_mel_energies(
+            samples=samples, sample_rate=sample_rate,
+            mel_spectrum_settings=self._mel_spectrum_settings)
+
+        fingerprint_bits: np.ndarray = compute_perceptual_hash(
+            log_energies=log_mel_energies,
+            number_of_time_slices=self._number_of_time_slices,
+            hash_size=self._hash_size)
+
+        if fingerprint_bits.size == 0:
+            return None
+
+        return AudioFingerprint(fingerprint_bits=np.packbits(fingerprint_bits).tobytes(),
+                                duration=len(samples) / sample_rate)
+
+    def get_query(self, fingerprint: AudioFingerprint) -> (str | None):
+        """Look up the query of an utterance with the same or a near identical fingerprint.
+
+        Args:
+            - fingerprint (AudioFingerprint): The fingerprint from compute_fingerprint.
+
+        Returns:
+            - str | None: The cached query, None on a miss.
+        """
+
+        with self._entries_lock:
+            if fingerprint.fingerprint_bits in self._entries:
+                duration, query = self._entries[fingerprint.fingerprint_bits]
+
+                if self._is_similar_duration(duration, fingerprint.duration):
+                    self._entries.move_to_end(fingerprint.fingerprint_bits)
+                    self._count_lookup(lookup_result="hits")
+
+                    return query
+
+            nearest_key: (bytes | None) = self._find_nearest_key(fingerprint=fingerprint)
+
+            if nearest_key is None:
+                self._count_lookup(lookup_result="misses")
+
+                return None
+
+            self._entries.move_to_end(nearest_key)
+            self._count_lookup(lookup_result="near_hits")
+
+            return self._entries[nearest_key][1]
+
+    def put_query(self, fingerprint: AudioFingerprint, query: str) -> None:
+        """Cache the query an utterance was recognized as.
+
+        Args:
+            - fingerprint (AudioFingerprint): The fingerprint from compute_fingerprint.
+            - query (str): The recognized query, empty queries are not cached.
+
+        Returns:
+            - None.
+        """
+
+        if not query.strip():
+            return
+
+        with self._entries_lock:
+            self._entries[fingerprint.fingerprint_bits] = (fingerprint.duration, query)
+            self._entries.move_to_end(fingerprint.fingerprint_bits)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._cache_counts["evictions"] += 1
+
+    def get_cache_counts(self) -> Dict[str, int]:
+        """Return a copy of the hit, near hit, miss and eviction counters."""
+
+        return dict(self._cache_counts)
+
+    def _find_nearest_key(self, fingerprint: AudioFingerprint) -> (bytes | None):
+        """Find the cached fingerprint with the fewest differing bits, within the thresholds."""
+
+        if not self._entries:
+            return None
+
+        keys: Tuple[bytes, ...] = tuple(self._entries)
+        cached_bits: np.ndarray = np.frombuffer(b"".join(keys), dtype=np.uint8).reshape(
+            len(keys), -1)
+        query_bits: np.ndarray = np.frombuffer(fingerprint.fingerprint_bits, dtype=np.uint8)
+
+        bit_errors: np.ndarray = np.unpackbits(cached_bits ^ query_bits, axis=1).sum(axis=1)
+        durations: np.ndarray = np.array([self._entries[key][0] for key in keys])
+
+        bit_count: int = self._hash_size ** 2 - 1
+        candidates: np.ndarray = (
+            (bit_errors <= self._max_bit_error_rate * bit_count)
+            & (np.abs(durations - fingerprint.duration)
+               <= self._max_duration_difference * np.maximum(durations, fingerprint.duration)))
+
+        if not candidates.any():
+            return None
+
+        return keys[int(np.argmin(np.where(candidates, bit_errors, bit_count + 1)))]
+
+    def _is_similar_duration(self, first_duration: float, second_duration: float) -> bool:
+        """Check if two durations differ by at most the allowed share."""
+
+        return (abs(first_duration - second_duration)
+                <= self._max_duration_difference * max(first_duration, second_duration))
+
+    def _count_lookup(self, lookup_result: str) -> None:
+        """Count the lookup result and log the counters now and then."""
+
+        self._cache_counts[lookup_result] += 1
+
+        if (sum(self._cache_counts.values()) - self._cache_counts["evictions"]
+                ) % self._report_interval == 0:
+            self._log_handler.create_log(log_type="info",
+                                         log_message=f"Recognition cache: {self._cache_counts}")
@@ -0,0 +1,267 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+recognition_worker_pool.py:
+===========================
+This file contains RecognitionWorkerPool class, responsible to run the audio encoding and the
+speech recognition requests in worker processes instead of in Julie's own process.
+
+Overview:
+=========
+- Encoding an utterance (FLAC), resampling it and waiting for the recognizer's answer all
+hold or fight for the GIL, which stalls the audio capture and the text to speech.
+In a worker process they overlap with both.
+- The PCM frames are handed over through a multiprocessing.shared_memory block,
+only its name and the audio format are pickled. The block is released once the worker is done.
+- Callers only ever get a Future back, and wait on it.
+- If the worker processes cannot be started (or have crashed) the recognition runs in
+this process instead, Julie keeps working, just without the overlap.
+Every satellite gets its own orbit.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from signal import SIGINT, SIG_IGN, signal
+from threading import Lock
+
+# Include internal typings.
+from typing import Any, Callable, ClassVar, Dict
+
+# Include external packages and modules.
+from speech_recognition import AudioData, Recognizer # type: ignore
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# The Recognizer of a worker process, created once by the worker initializer.
+_WORKER_STATE: Dict[str, Any] = {}
+
+
+def _initialize_worker() -> None:
+    """Create the Recognizer of a worker process, so it is not created for every request."""
+
+    # Ctrl + C is handled by Julie's own process, the workers are shut down with it.
+    signal(SIGINT, SIG_IGN)
+    _WORKER_STATE["recognizer"] = Recognizer()
+
+def _recognize_shared_audio(recognize_audio: Callable[[Recognizer, AudioData], Any],
+                            shared_memory_name: str, frame_length: int,
+                            sample_rate: int, sample_width: int) -> Any:
+    """Recognize the PCM frames in a shared memory block, inside a worker process.
+
+    Args:
+        - recognize_audio (Callable[[Recognizer, AudioData], Any]): Module level function
+        that recognizes the audio, such as transcribe_google_audio.
+        - shared_memory_name (str): The name of the shared memory block with the frames.
+        - frame_length (int): The number of bytes of frames in the block.
+        - sample_rate (int): The sample rate of the frames.
+        - sample_width (int): The number of bytes per sample.
+
+    Returns:
+        - Any: Whatever recognize_audio returned, such as the recognized query.
+    """
+
+    shared_memory: SharedMemory = SharedMemory(name=shared_memory_name)
+
+    try:
+        frame_data: bytes = bytes(shared_memory.buf[:frame_length])
+
+    finally:
+        shared_memory.close()
+
+    return recognize_audio(_WORKER_STATE["recognizer"],
+                           AudioData(frame_data, sample_rate, sample_width))
+
+def _warm_up_worker() -> None:
+    """Do nothing, submitting it makes the pool start its worker processes."""
+
+
+@dataclass
+class RecognitionWorkerPool:
+    """Class to run speech recognition in worker processes, fed through shared memory."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Recognition mostly waits on the network, two workers let a hedge or a follow up
+    # request overlap with the one in flight.
+    _max_workers: ClassVar[int] = 2
+
+    _process_pool: (ProcessPoolExecutor | None) = None
+    _process_pool_lock: Lock = field(default_factory=Lock)
+
+    # Set once the worker processes could not be used, recognition then stays in this process.
+    _is_in_process: bool = False
+
+    @property
+    def is_in_process(self) -> bool:
+        """True once recognition has fallen back to this process, a submit then blocks."""
+
+        return self._is_in_process
+
+    def start_workers(self) -> None:
+        """Start the worker processes now, instead of on the first recognition.
+
+        Returns:
+            - None.
+        """
+
+        try:
+            self._get_process_pool().submit(_warm_up_worker)
+
+        except (BrokenProcessPool, OSError, RuntimeError) as err:
+            self._fall_back_to_in_process(err=err)
+
+    def recognize(self, recognize_audio: Callable[[Recognizer, AudioData], Any],
+                  recognizer: Recognizer, audio: AudioData) -> Any:
+        """Recognize the audio in a worker process, and wait for the query.
+
+        Args:
+            - recognize_audio (Callable[[Recognizer, AudioData], Any]): Module level function
+            that recognizes the audio, it must not touch any state of this process.
+            - recognizer (Recognizer): The Recognizer of this process, only used
+            if the worker processes are unavailable.
+            - audio (AudioData): The audio to recognize.
+
+        Returns:
+            - Any: Whatever recognize_audio returned, such as the recognized query.
+
+        Raises:
+            - Exception: whatever recognize_audio raised, such as UnknownValueError.
+        """
+
+        recognition_future: "Future[Any]" = self.submit_recognition(
+            recognize_audio=recognize_audio, recognizer=recognizer, audio=audio)
+
+        try:
+            return recognition_future.result()
+
+        # A worker died while it had the request, such as when it ran out of memory.
+        except BrokenProcessPool as err:
+            self._fall_back_to_in_process(err=err)
+
+            return recognize_audio(recognizer, audio)
+
+    def submit_recognition(self, recognize_audio: Callable[[Recognizer, AudioData], Any],
+                           recognizer: Recognizer, audio: AudioData) -> "Future[Any]":
+        """Submit the audio to a worker process.
+
+        Args:
+            - recognize_audio (Callable[[Recognizer, AudioData], Any]): Module level function
+            that recognizes the audio, it must not touch any state of this process.
+            - recognizer (Recognizer): The Recognizer of this process, only used
+            if the worker processes are unavailable.
+            - audio (AudioData): The audio to recognize.
+
+        Returns:
+            - Future[Any]: The future of the recognize_audio result. Recognition errors
+            (such as UnknownValueError) are raised by its result().
+        """
+
+        if not self._is_in_process:
+            try:
+                return self._submit_shared_audio(recognize_audio=recognize_audio, audio=audio)
+
+            except (BrokenProcessPool, OSError, RuntimeError) as err:
+                self._fall_back_to_in_process(err=err)
+
+        recognition_future: "Future[Any]" = Future()
+
+        try:
+            recognition_future.set_result(recognize_audio(recognizer, audio))
+
+        except Exception as err: # pylint: disable=broad-exception-caught
+            recognition_future.set_exception(err)
+
+        return recognition_future
+
+    def _submit_shared_audio(self, recognize_audio: Callable[[Recognizer, AudioData], Any],
+                             audio: AudioData) -> "Future[Any]":
+        """Copy the frames to a shared memory block and submit them to a worker process."""
+
+        frame_data: bytes = audio.frame_data
+        shared_memory: SharedMemory = SharedMemory(create=True, size=max(1, len(frame_data)))
+        shared_memory.buf[:len(frame_data)] = frame_data
+
+        def _release_shared_memory(_: Future) -> None:
+            shared_memory.close()
+            shared_memory.unlink()
+
+        try:
+            recognition_future: "Future[Any]" = self._get_process_pool().submit(
+                _recognize_shared_audio, recognize_audio, shared_memory.name,
+                len(frame_data), audio.sample_rate, audio.sample_width)
+
+        except BaseException:
+            _release_shared_memory(Future())
+            raise
+
+        recognition_future.add_done_callback(_release_shared_memory)
+
+        return recognition_future
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        """Return the process pool, creating it on first use or after it has crashed."""
+
+        with self._process_pool_lock:
+            # pylint: disable=protected-access
+            if self._process_pool is None or self._process_pool._broken:
+                # Spawned workers do not inherit the capture thread or the audio device.
+                self._process_pool = ProcessPoolExecutor(max_workers=self._max_workers,
+                                                         mp_context=get_context("spawn"),
+                                                         initializer=_initialize_worker)
+
+            return self._process_pool
+
+    def _fall_back_to_in_process(self, err: BaseException) -> None:
+        """Log why the worker processes cannot be used, and recognize in this process."""
+
+        if not self._is_in_process:
+            self._log_handler.create_log(
+                log_type="warning",
+                log_message=("Recognition worker processes are unavailable, "
+                             f"recognizing in process instead. {err}"))
+
+        self._is_in_process = True
+
+
+def _create_recognition_worker_pool() -> RecognitionWorkerPool:
+    """Create the recognition worker pool and start spawning its worker processes."""
+
+    recognition_worker_pool: RecognitionWorkerPool = RecognitionWorkerPool()
+    recognition_worker_pool.start_workers()
+
+    return recognition_worker_pool
+
+
+# The worker processes are only started when the pool is warmed up or first used.
+SERVICE_LOADER.register_service("recognition_worker_pool", _create_recognition_worker_pool)
@@ -0,0 +1,172 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+service_loader.py:
+==================
+This file contains ServiceLoader class, responsible to lazily create heavy services.
+Such as: the text to speech engine, the microphone and the Gemini AI model.
+
+Overview:
+=========
+Heavy engines are registered with a cheap factory and are only created the first time
+they are requested, or warmed up in a background thread once Julie is online.
+No need to fuel every booster before the countdown even starts.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+from threading import Lock, Thread
+from time import perf_counter
+
+# Include internal typings.
+from typing import Any, Callable, Dict, Tuple
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+
+
+@dataclass
+class ServiceLoader:
+    """Class to lazily create heavy services on first use or warm them up in the background."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Registered service factories, keyed by the service name.
+    _service_factories: Dict[str, Callable[[], Any]] = field(default_factory=lambda: {})
+
+    # Services that have already been created, keyed by the service name.
+    _services: Dict[str, Any] = field(default_factory=lambda: {})
+
+    # Time (in seconds) it took to create each service.
+    _service_load_times: Dict[str, float] = field(default_factory=lambda: {})
+
+    # One lock per service, so two slow services can be created at the same time.
+    _service_locks: Dict[str, Lock] = field(default_factory=lambda: {})
+    _registry_lock: Lock = field(default_factory=Lock)
+
+    def register_service(self, service_name: str, service_factory: Callable[[], Any]) -> None:
+        """Register a factory that creates the service the first time it is requested.
+
+        Args:
+            - service_name (str): The name used to request the service.
+            - service_factory (Callable[[], Any]): Function that creates the service.
+
+        Returns:
+            - None.
+        """
+
+        with self._registry_lock:
+            self._service_factories[service_name] = service_factory
+            self._service_locks.setdefault(service_name, Lock())
+
+    def get_service(self, service_name: str) -> Any:
+        """Return the requested service, creating it on first use.
+
+        Args:
+            - service_name (str): The name of a registered service.
+
+        Returns:
+            - Any: The created service.
+
+        Raises:
+            - TypeError: if the service has not been registered.
+        """
+
+        if service_name in self._services:
+            return self._services[service_name]
+
+        if service_name not in self._service_factories:
+            raise TypeError(
+                f"Alert: The service {service_name} is not registered.\n"
+                f"Registered services are {list(self._service_factories)}")
+
+        with self._service_locks[service_name]:
+            # Another thread may have finished creating it while we were waiting.
+            if service_name not in self._services:
+                _started_at: float = perf_counter()
+                self._services[service_name] = self._service_factories[service_name]()
+                self._service_load_times[service_name] = perf_counter() - _started_at
+
+                self._log_handler.create_log(
+                    log_type="info",
+                    log_message=(f"Service {service_name} loaded in "
+                                 f"{self._service_load_times[service_name]:.3f}s."))
+
+        return self._services[service_name]
+
+    def is_service_loaded(self, service_name: str) -> bool:
+        """Check if the service has already been created.
+
+        Args:
+            - service_name (str): The name of a registered service.
+
+        Returns:
+            - bool: True if the service has already been created.
+        """
+
+        return service_name in self._services
+
+    def warm_up_services(self, service_names: Tuple[str, ...]) -> Thread:
+        """Create the given services in a background daemon thread.
+
+        Args:
+            - service_names (Tuple[str, ...]): The names of the services to warm up.
+
+        Returns:
+            - Thread: The started warm up thread.
+        """
+
+        def _warm_up() -> None:
+            for service_name in service_names:
+                try:
+                    self.get_service(service_name)
+
+                # A failing warm up must never take the assistant down,
+                # the error will surface again once the service is really used.
+                except Exception as err: # pylint: disable=broad-exception-caught
+                    self._log_handler.create_log(
+                        log_type="warning",
+                        log_message=f"Service {service_name} could not be warmed up. {err}")
+
+        warm_up_thread: Thread = Thread(target=_warm_up, name="oojda-service-warm-up", daemon=True)
+        warm_up_thread.start()
+
+        return warm_up_thread
+
+    def get_service_load_times(self) -> Dict[str, float]:
+        """Return the time (in seconds) it took to create each loaded service.
+
+        Returns:
+            - Dict[str, float]: The service load times keyed by the service name.
+        """
+
+        return dict(self._service_load_times)
+
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# Shared service loader, so every handler reuses the same heavy engines.
+SERVICE_LOADER: ServiceLoader = ServiceLoader()
@@ -0,0 +1,360 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+speech_audio_cache.py:
+======================
+This file contains SpeechAudioCache class, responsible to keep the rendered audio of the
+texts Julie speaks over and over on disk, so they are played from PCM instead of synthesized.
+
+Overview:
+=========
+- The audio files are keyed by the text, the voice and the speech rate, a new voice or rate
+never plays the old audio.
+- A text is rendered the second time it is spoken (or ahead of time with --warm-tts-cache),
+one-off answers are never written to disk.
+- The cache is bounded in bytes, the least recently played file is evicted first.
+Playing a file touches its modification time, so the order survives a restart.
+- Only the use counts of the most recently spoken texts are kept, in memory.
+Mission control keeps the tapes, the astronaut keeps the breath.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from hashlib import sha1
+from os import listdir, path, remove, replace, utime
+import wave
+
+# Include internal typings.
+from typing import Any, ClassVar, Dict, List, Tuple
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.directory_operation.directory_operation\
+    import DirectoryOperation
+
+
+def render_wav_file(engine: Any, text: str, file_path: str) -> None:
+    """Render a text into a WAV file with the engine, on the thread that owns the engine.
+
+    Args:
+        - engine (Any): The pyttsx3 engine, configured with the voice and the rate.
+        - text (str): The text to render.
+        - file_path (str): The WAV file to write, it should end in .wav.
+
+    Returns:
+        - None.
+
+    Raises:
+        - OSError: if the file could not be written.
+        - wave.Error: if the engine did not write a WAV file with frames (such as AIFF on macOS).
+    """
+
+    engine.save_to_file(text.strip(), file_path)
+    engine.runAndWait()
+
+    try:
+        with wave.open(file_path, "rb") as audio_file:
+            if audio_file.getnframes() == 0:
+                raise wave.Error("no frames were rendered")
+
+    except EOFError as err:
+        raise wave.Error("the rendered file is empty") from err
+
+def remove_file(file_path: str) -> None:
+    """Remove a file, if it is still there.
+
+    Args:
+        - file_path (str): The file to remove.
+
+    Returns:
+        - None.
+    """
+
+    try:
+        remove(file_path)
+
+    except OSError:
+        pass
+
+
+@dataclass
+class SpeechAudioCache:
+    """Class to keep the rendered audio of spoken texts on disk, bounded in bytes."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Instantiate DirectoryOperation.
+    _directory_operation: DirectoryOperation = field(default_factory=DirectoryOperation)
+
+    # The rendered audio default location.
+    _cache_directory_path: ClassVar[str] = "oojda/data/cache/speech_audio"
+
+    # A few hundred prompts at 22 kHz, the least recently played file is evicted above it.
+    _max_cache_bytes: ClassVar[int] = 32 * 1024 * 1024
+
+    # Longer texts are answers (such as Gemini's), they are unlikely to be spoken again.
+    _max_text_length: ClassVar[int] = 160
+
+    # A text is rendered once it has been spoken this many times.
+    _min_uses_to_render: ClassVar[int] = 2
+
+    # The use counts of at most this many texts are kept, the least recently spoken one is
+    # forgotten first, so one-off answers do not pile up.
+    _max_counted_texts: ClassVar[int] = 256
+
+    # Log the counters every this many lookups.
+    _report_interval: ClassVar[int] = 50
+
+    # Set once the engine wrote something that is not a WAV file (such as AIFF on macOS).
+    _is_render_supported: bool = True
+
+    # Cache key => file size, the most recently played file is last.
+    _entries: "OrderedDict[str, int] | None" = None
+
+    # Text => use count, the most recently spoken text is last.
+    _text_use_counts: "OrderedDict[str, int]" = field(default_factory=OrderedDict)
+
+    _cache_counts: Dict[str, int] = field(default_factory=lambda: {
+        "hits": 0,
+        "misses": 0,
+        "renders": 0,
+        "evictions": 0,
+    })
+
+    def get_audio_path(self, text: str, voice_id: str, speech_rate: int) -> (str | None):
+        """Return the rendered audio of a text, and mark it as the most recently played.
+
+        Args:
+            - text (str): The text to speak.
+            - voice_id (str): The id of the engine's voice.
+            - speech_rate (int): The engine's speech rate.
+
+        Returns:
+            - str | None: The path of the WAV file, None if the text has not been rendered.
+        """
+
+        entries: "OrderedDict[str, int]" = self._load_entries()
+        cache_key: str = self._get_cache_key(text=text, voice_id=voice_id,
+                                             speech_rate=speech_rate)
+
+        if cache_key not in entries:
+            self._count_lookup(lookup_result="misses")
+
+            return None
+
+        audio_path: str = self._get_audio_path(cache_key=cache_key)
+
+        try:
+            utime(audio_path)
+
+        except OSError:
+            # Deleted behind Julie's back.
+            del entries[cache_key]
+            self._count_lookup(lookup_result="misses")
+
+            return None
+
+        entries.move_to_end(cache_key)
+        self._count_lookup(lookup_result="hits")
+
+        return audio_path
+
+    def should_render(self, text: str) -> bool:
+        """Count a use of a text that is not cached, and check if it is worth rendering.
+
+        Args:
+            - text (str): The text to speak.
+
+        Returns:
+            - bool: True if the text is short and has been spoken often enough.
+        """
+
+        if not self._is_render_supported or len(text.strip()) > self._max_text_length:
+            return False
+
+        text_use_counts: "OrderedDict[str, int]" = self._text_use_counts
+        text_use_counts[text] = text_use_counts.get(text, 0) + 1
+        text_use_counts.move_to_end(text)
+
+        while len(text_use_counts) > self._max_counted_texts:
+            text_use_counts.popitem(last=False)
+
+        return text_use_counts[text] >= self._min_uses_to_render
+
+    def render_audio(self, engine: Any, text: str, voice_id: str,
+                     speech_rate: int) -> (str | None):
+        """Render a text into a WAV file with the engine, and evict the oldest files if needed.
+
+        Must be called on the thread that owns the engine. A text that is already cached
+        is not rendered again.
+
+        Args:
+            - engine (Any): The pyttsx3 engine, configured with the voice and the rate.
+            - text (str): The text to render.
+            - voice_id (str): The id of the engine's voice.
+            - speech_rate (int): The engine's speech rate.
+
+        Returns:
+            - str | None: The path of the WAV file, None if it could not be rendered.
+        """
+
+        entries: "OrderedDict[str, int]" = self._load_entries()
+        cache_key: str = self._get_cache_key(text=text, voice_id=voice_id,
+                                             speech_rate=speech_rate)
+        audio_path: str = self._get_audio_path(cache_key=cache_key)
+
+        if cache_key in entries and path.exists(audio_path):
+            return audio_path
+
+        # Written aside and renamed, so a half written file is never played.
+        # Some drivers pick the format from the extension, so it stays .wav.
+        partial_audio_path: str = path.join(self._cache_directory_path,
+                                            f"{cache_key}.partial.wav")
+
+        try:
+            self._directory_operation.create_directory(directory_path=self._cache_directory_path)
+
+            render_wav_file(engine=engine, text=text, file_path=partial_audio_path)
+            replace(partial_audio_path, audio_path)
+
+        except (OSError, wave.Error) as err:
+            remove_file(file_path=partial_audio_path)
+
+            if isinstance(err, wave.Error):
+                self.disable_rendering(err=err)
+
+            else:
+                self._log_handler.create_log(
+                    log_type="warning",
+                    log_message=f"Speech audio could not be rendered, speaking it instead. {err}")
+
+            return None
+
+        entries[cache_key] = path.getsize(audio_path)
+        entries.move_to_end(cache_key)
+        self._text_use_counts.pop(text, None)
+        self._cache_counts["renders"] += 1
+        self._evict_audio()
+
+        return audio_path
+
+    @property
+    def is_render_supported(self) -> bool:
+        """False once the engine turned out not to write WAV files."""
+
+        return self._is_render_supported
+
+    def disable_rendering(self, err: Exception) -> None:
+        """Stop rendering texts, the engine cannot write WAV files.
+
+        Args:
+            - err (Exception): Why the rendered file could not be read.
+
+        Returns:
+            - None.
+        """
+
+        if self._is_render_supported:
+            self._log_handler.create_log(
+                log_type="warning",
+                log_message=f"Speech audio cannot be rendered, speaking it instead. {err}")
+
+        self._is_render_supported = False
+
+    def get_cache_counts(self) -> Dict[str, int]:
+        """Return a copy of the hit, miss, render and eviction counters.
+
+        Returns:
+            - Dict[str, int]: The counters.
+        """
+
+        return dict(self._cache_counts)
+
+    def _load_entries(self) -> "OrderedDict[str, int]":
+        """Index the cached files the first time they are needed, least recently played first."""
+
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = OrderedDict()
+
+        try:
+            file_names: List[str] = listdir(self._cache_directory_path)
+
+        except OSError:
+            return self._entries
+
+        file_stats: List[Tuple[float, str, int]] = []
+
+        for file_name in file_names:
+            file_path: str = path.join(self._cache_directory_path, file_name)
+
+            if file_name.endswith(".partial.wav"):
+                remove_file(file_path=file_path)
+
+            elif file_name.endswith(".wav"):
+                file_stats.append((path.getmtime(file_path), file_name[:-len(".wav")],
+                                   path.getsize(file_path)))
+
+        for _, cache_key, file_size in sorted(file_stats):
+            self._entries[cache_key] = file_size
+
+        return self._entries
+
+    def _evict_audio(self) -> None:
+        """Remove the least recently played files until the cache fits in its bound."""
+
+        entries: "OrderedDict[str, int]" = self._load_entries()
+        cache_bytes: int = sum(entries.values())
+
+        # The newest file is always kept, even if it alone is larger than the bound.
+        while cache_bytes > self._max_cache_bytes and len(entries) > 1:
+            cache_key, file_size = entries.popitem(last=False)
+            cache_bytes -= file_size
+            remove_file(file_path=self._get_audio_path(cache_key=cache_key))
+            self._cache_counts["evictions"] += 1
+
+    def _get_cache_key(self, text: str, voice_id: str, speech_rate: int) -> str:
+        """Hash the text, the voice and the rate into a file name."""
+
+        return sha1(f"{voice_id}|{speech_rate}|{text.strip()}".encode("utf-8")).hexdigest()
+
+    def _get_audio_path(self, cache_key: str) -> str:
+        """Return the path of the WAV file of a cache key."""
+
+        return path.join(self._cache_directory_path, f"{cache_key}.wav")
+
+    def _count_lookup(self, lookup_result: str) -> None:
+        """Count the lookup result and log the counters now and then."""
+
+        self._cache_counts[lookup_result] += 1
+
+        if (self._cache_counts["hits"] + self._cache_counts["misses"]
+                ) % self._report_interval == 0:
+            self._log_handler.create_log(log_type="info",
+                                         log_message=f"Speech audio cache: {self._cache_counts}")
@@ -0,0 +1,707 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+speech_output_worker.py:
+========================
+This file contains SpeechOutputWorker class, responsible to own the pyttsx3 engine on a thread
+of its own, and to speak the queued texts one after another.
+
+Overview:
+=========
+- The engine is created and configured (rate and voice) once, on the worker thread.
+Enumerating the voices is slow on some drivers, it used to be paid for every text.
+- speak() only queues the text, it returns a SpeechHandle to wait on or to cancel.
+- A queued text is skipped once its handle, or the command that queued it, is cancelled.
+Cancelling the text being spoken stops the engine.
+- Texts in the SpeechAudioCache are played from their rendered WAV file through PyAudio,
+in small chunks so a cancel stops them too. Synthesis is skipped for them.
+- A text of several sentences (such as a Gemini answer) is pipelined: the worker renders the
+sentences one by one while a playback thread plays the ones before, a few sentences ahead.
+The first sentence plays as soon as it is rendered, however long the text is.
+- interrupt_speech() stops the text being spoken and drops every queued one, it is called by
+the BargeInDetector once the user talks over Julie.
+- The HalfDuplexGate is told when Julie speaks, and gets the PCM she plays as the reference
+of her echo.
+One voice on the radio, and a queue for the mic.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+from os import close
+from queue import Empty, Queue
+from tempfile import mkstemp
+from threading import Event, Lock, Thread
+from time import perf_counter
+import wave
+
+# Include internal typings.
+from typing import Any, Callable, ClassVar, Dict, List, Tuple
+
+# Include external packages and modules.
+import pyttsx3 # type: ignore
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.speech_audio_cache.speech_audio_cache\
+    import SpeechAudioCache, remove_file, render_wav_file
+from src.app.utility.handler._class.half_duplex_gate.half_duplex_gate import HalfDuplexGate
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.handler._class.command_executor.command_executor import\
+    (CancellationToken, get_current_cancellation_token, )
+from src.app.utility.helper._module.sentence_splitter.sentence_splitter\
+    import split_into_sentences
+
+
+@dataclass
+class _SpeechTimes:
+    """When a text was queued, when its first audio was written to the sound card,
+    and when it was done."""
+
+    queued_time: float = field(default_factory=perf_counter)
+    first_audio_time: (float | None) = None
+    done_time: (float | None) = None
+
+
+@dataclass
+class _SpeechState:
+    """If a text is done or cancelled, and who to call back once it is done."""
+
+    done_event: Event = field(default_factory=Event)
+    cancelled_event: Event = field(default_factory=Event)
+
+    done_callbacks: List[Callable[["SpeechHandle"], None]] = field(default_factory=list)
+    done_callbacks_lock: Lock = field(default_factory=Lock)
+
+
+@dataclass
+class SpeechHandle:
+    """A queued text, to wait until it has been spoken or to cancel it."""
+
+    text: str
+
+    # The token of the command that queued the text, cancelling the command cancels the text.
+    cancellation_token: (CancellationToken | None) = None
+
+    # Set by the worker, stops the engine if the text is being spoken.
+    _cancel_speech: (Callable[["SpeechHandle"], None] | None) = None
+
+    # The error the engine raised while speaking the text, if any.
+    error: (Exception | None) = None
+
+    # Only render the text into the speech audio cache, without speaking it.
+    should_render_only: bool = False
+
+    # Instantiate _SpeechTimes.
+    _times: _SpeechTimes = field(default_factory=_SpeechTimes)
+
+    # Instantiate _SpeechState.
+    _state: _SpeechState = field(default_factory=_SpeechState)
+
+    @property
+    def is_done(self) -> bool:
+        """True once the text has been spoken, skipped or has failed."""
+
+        return self._state.done_event.is_set()
+
+    @property
+    def is_cancelled(self) -> bool:
+        """True once the text, or the command that queued it, has been cancelled."""
+
+        return self._state.cancelled_event.is_set() or (
+            self.cancellation_token is not None and self.cancellation_token.is_cancelled)
+
+    @property
+    def first_audio_seconds(self) -> (float | None):
+        """The time to first audio, from queueing the text. None until its audio has started."""
+
+        if self._times.first_audio_time is None:
+            return None
+
+        return self._times.first_audio_time - self._times.queued_time
+
+    @property
+    def done_time(self) -> (float | None):
+        """When the text was done, None until it is."""
+
+        return self._times.done_time
+
+    def mark_first_audio(self) -> None:
+        """Record that the audio of the text has started, the first call wins."""
+
+        if self._times.first_audio_time is None:
+            self._times.first_audio_time = perf_counter()
+
+    def wait(self, timeout: (float | None) = None) -> bool:
+        """Wait until the text has been spoken, skipped or has failed.
+
+        Args:
+            - timeout (float | None): The number of seconds to wait at most, None waits forever.
+
+        Returns:
+            - bool: True if the text is done, False on a timeout.
+        """
+
+        return self._state.done_event.wait(timeout=timeout)
+
+    def cancel(self) -> None:
+        """Skip the text, or stop speaking it if it is being spoken."""
+
+        self._state.cancelled_event.set()
+
+        if self._cancel_speech is not None:
+            self._cancel_speech(self)
+
+    def add_done_callback(self, done_callback: Callable[["SpeechHandle"], None]) -> None:
+        """Call done_callback with the handle once the text is done, right away if it is.
+
+        Args:
+            - done_callback (Callable[[SpeechHandle], None]): Called on the thread that
+            marks the text as done, it must return quickly.
+
+        Returns:
+            - None.
+        """
+
+        with self._state.done_callbacks_lock:
+            if not self.is_done:
+                self._state.done_callbacks.append(done_callback)
+
+                return
+
+        done_callback(self)
+
+    def mark_done(self) -> None:
+        """Mark the text as done, waking up everyone waiting on it."""
+
+        speech_state: _SpeechState = self._state
+
+        with speech_state.done_callbacks_lock:
+            if self.is_done:
+                return
+
+            self._times.done_time = perf_counter()
+            speech_state.done_event.set()
+            done_callbacks: List[Callable[["SpeechHandle"], None]] = speech_state.done_callbacks
+            speech_state.done_callbacks = []
+
+        for done_callback in done_callbacks:
+            done_callback(self)
+
+
+@dataclass
+class _OutputDevices:
+    """The pyttsx3 engine and the PyAudio instance playing the cached audio, both created on
+    the worker thread, or the errors that kept them from being created."""
+
+    engine: Any = None
+    engine_error: (Exception | None) = None
+    voice_id: str = ""
+
+    audio_output: Any = None
+    audio_output_error: (Exception | None) = None
+
+
+@dataclass
+class _WorkerState:
+    """The worker thread, and the handle it speaks."""
+
+    worker_thread: (Thread | None) = None
+
+    current_handle: (SpeechHandle | None) = None
+    current_handle_lock: Lock = field(default_factory=Lock)
+
+    # Set while the engine speaks (rather than renders), its started-utterance is first audio.
+    is_synthesizing: bool = False
+
+
+@dataclass
+class SpeechOutputWorker:
+    """Class to speak queued texts on a worker thread that owns the pyttsx3 engine."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Speed at which the speaker will read the text.
+    _speech_rate: ClassVar[int] = 175
+
+    # * ON WINDOWS: [0] = MALE VOICE, [1] = FEMALE VOICE, BOTH (DEFAULTS).
+    _voice_index: ClassVar[int] = 1
+
+    # Instantiate SpeechAudioCache.
+    _speech_audio_cache: SpeechAudioCache = field(default_factory=SpeechAudioCache)
+
+    # The capture thread shares the gate, it gates the audio captured while Julie speaks.
+    _half_duplex_gate: HalfDuplexGate = field(
+        default_factory=lambda: SERVICE_LOADER.get_service("half_duplex_gate"))
+
+    # The cached audio is written to the sound card this many frames at a time (about 50 ms),
+    # a cancelled text stops after the current chunk.
+    _playback_chunk_frames: ClassVar[int] = 1024
+
+    # A text of several sentences is rendered at most this many sentences ahead of the one playing.
+    _look_ahead_sentences: ClassVar[int] = 2
+
+    # Log the counters every this many texts.
+    _report_interval: ClassVar[int] = 20
+
+    _speech_counts: Dict[str, int] = field(default_factory=lambda: {
+        "cached": 0,
+        "pipelined": 0,
+        "synthesized": 0,
+    })
+
+    _speech_queue: "Queue[SpeechHandle]" = field(default_factory=Queue)
+
+    # Instantiate _OutputDevices.
+    _devices: _OutputDevices = field(default_factory=_OutputDevices)
+
+    # Instantiate _WorkerState.
+    _worker_state: _WorkerState = field(default_factory=_WorkerState)
+
+    def start_worker(self) -> None:
+        """Start the worker thread, it creates and configures the engine.
+
+        Returns:
+            - None.
+        """
+
+        worker_state: _WorkerState = self._worker_state
+
+        if worker_state.worker_thread is None:
+            worker_state.worker_thread = Thread(target=self._run_worker,
+                                                name="oojda-speech-output", daemon=True)
+            worker_state.worker_thread.start()
+
+    def speak(self, text: str) -> SpeechHandle:
+        """Queue a text to be spoken, without waiting for it.
+
+        Args:
+            - text (str): The text to speak.
+
+        Returns:
+            - SpeechHandle: The handle to wait on or to cancel.
+        """
+
+        speech_handle: SpeechHandle = SpeechHandle(
+            text=text,
+            cancellation_token=get_current_cancellation_token(),
+            _cancel_speech=self._cancel_speech)
+
+        self.start_worker()
+        self._speech_queue.put(speech_handle)
+
+        return speech_handle
+
+    def prerender(self, text: str) -> SpeechHandle:
+        """Queue a text to be rendered into the speech audio cache, without speaking it.
+
+        Args:
+            - text (str): The text to render.
+
+        Returns:
+            - SpeechHandle: The handle to wait on, it is done once the text has been rendered.
+        """
+
+        speech_handle: SpeechHandle = SpeechHandle(text=text, should_render_only=True)
+
+        self.start_worker()
+        self._speech_queue.put(speech_handle)
+
+        return speech_handle
+
+    def get_speech_audio_cache(self) -> SpeechAudioCache:
+        """Return the speech audio cache, such as to read its counters.
+
+        Returns:
+            - SpeechAudioCache: The cache of the rendered texts.
+        """
+
+        return self._speech_audio_cache
+
+    @property
+    def is_speaking(self) -> bool:
+        """True while a text is being spoken, or rendered to be spoken."""
+
+        current_handle: (SpeechHandle | None) = self._worker_state.current_handle
+
+        return (current_handle is not None and not current_handle.should_render_only
+                and not current_handle.is_cancelled)
+
+    def interrupt_speech(self) -> List[SpeechHandle]:
+        """Stop the text being spoken, and drop every text queued after it.
+
+        Texts queued only to be rendered (--warm-tts-cache) are kept.
+
+        Returns:
+            - List[SpeechHandle]: The interrupted handles, the one being spoken first.
+        """
+
+        with self._worker_state.current_handle_lock:
+            current_handle: (SpeechHandle | None) = self._worker_state.current_handle
+
+        interrupted_handles: List[SpeechHandle] = []
+
+        if (current_handle is not None and not current_handle.should_render_only
+                and not current_handle.is_done):
+            current_handle.cancel()
+            interrupted_handles.append(current_handle)
+
+        render_only_handles: List[SpeechHandle] = []
+
+        while True:
+            try:
+                speech_handle: SpeechHandle = self._speech_queue.get_nowait()
+
+            except Empty:
+                break
+
+            if speech_handle.should_render_only:
+                render_only_handles.append(speech_handle)
+                continue
+
+            speech_handle.cancel()
+            speech_handle.mark_done()
+            interrupted_handles.append(speech_handle)
+
+        for speech_handle in render_only_handles:
+            self._speech_queue.put(speech_handle)
+
+        return interrupted_handles
+
+    def get_speech_counts(self) -> Dict[str, int]:
+        """Return a copy of how many texts were played cached, pipelined or synthesized.
+
+        Returns:
+            - Dict[str, int]: The counters.
+        """
+
+        return dict(self._speech_counts)
+
+    def _cancel_speech(self, speech_handle: SpeechHandle) -> None:
+        """Stop the engine if the cancelled handle is being spoken."""
+
+        worker_state: _WorkerState = self._worker_state
+
+        with worker_state.current_handle_lock:
+            if worker_state.current_handle is speech_handle and self._devices.engine is not None:
+                self._devices.engine.stop()
+
+    def _create_engine(self) -> None:
+        """Create the engine on the worker thread, and set its rate and voice once."""
+
+        devices: _OutputDevices = self._devices
+        engine_start_time: float = perf_counter()
+
+        try:
+            devices.engine = pyttsx3.init()
+            devices.engine.setProperty('rate', self._speech_rate)
+
+            # Get supported voices. (Device Specific.)
+            voices: Any = devices.engine.getProperty('voices')
+            devices.voice_id = str(voices[min(self._voice_index, len(voices) - 1)].id)
+            devices.engine.setProperty('voice', devices.voice_id)
+
+            # The time to first audio of the synthesized texts.
+            devices.engine.connect('started-utterance', self._mark_current_first_audio)
+
+        except Exception as err: # pylint: disable=broad-exception-caught
+            devices.engine_error = err
+            self._log_handler.create_log(
+                log_type="error",
+                log_message=f"Text to speech engine could not be created. {err}")
+
+            return
+
+        self._log_handler.create_log(
+            log_type="info",
+            log_message=(f"Text to speech engine configured in "
+                         f"{perf_counter() - engine_start_time:.3f}s."))
+
+    def _run_worker(self) -> None:
+        """Speak the queued texts one after another, for as long as Julie runs."""
+
+        self._create_engine()
+        worker_state: _WorkerState = self._worker_state
+
+        while True:
+            speech_handle: SpeechHandle = self._speech_queue.get()
+
+            try:
+                if speech_handle.is_cancelled:
+                    continue
+
+                if self._devices.engine_error is not None:
+                    speech_handle.error = self._devices.engine_error
+                    continue
+
+                with worker_state.current_handle_lock:
+                    worker_state.current_handle = speech_handle
+
+                if not speech_handle.should_render_only:
+                    self._half_duplex_gate.start_playback()
+
+                self._speak_text(speech_handle=speech_handle)
+
+            except Exception as err: # pylint: disable=broad-exception-caught
+                speech_handle.error = err
+
+            finally:
+                with worker_state.current_handle_lock:
+                    if (worker_state.current_handle is not None
+                            and not speech_handle.should_render_only):
+                        self._half_duplex_gate.stop_playback()
+
+                    worker_state.current_handle = None
+
+                speech_handle.mark_done()
+
+    def _mark_current_first_audio(self, **_callback_arguments: Any) -> None:
+        """Engine callback, record that the text being spoken has started."""
+
+        worker_state: _WorkerState = self._worker_state
+
+        with worker_state.current_handle_lock:
+            if worker_state.current_handle is not None and worker_state.is_synthesizing:
+                worker_state.current_handle.mark_first_audio()
+
+    def _speak_text(self, speech_handle: SpeechHandle) -> None:
+        """Play the rendered audio of the text if it is cached, pipeline its sentences if
+        it has several, synthesize it otherwise."""
+
+        if speech_handle.should_render_only:
+            self._speech_audio_cache.render_audio(engine=self._devices.engine,
+                                                  text=speech_handle.text,
+                                                  voice_id=self._devices.voice_id,
+                                                  speech_rate=self._speech_rate)
+
+            return
+
+        audio_path: (str | None) = self._speech_audio_cache.get_audio_path(
+            text=speech_handle.text, voice_id=self._devices.voice_id, speech_rate=self._speech_rate)
+
+        if audio_path is None and self._speech_audio_cache.should_render(
+                text=speech_handle.text):
+            audio_path = self._speech_audio_cache.render_audio(engine=self._devices.engine,
+                                                               text=speech_handle.text,
+                                                               voice_id=self._devices.voice_id,
+                                                               speech_rate=self._speech_rate)
+
+        if audio_path is not None and self._play_audio_file(audio_path=audio_path,
+                                                            speech_handle=speech_handle):
+            self._count_speech(speech_result="cached")
+
+            return
+
+        sentences: List[str] = split_into_sentences(text=speech_handle.text)
+
+        if (len(sentences) > 1 and self._speech_audio_cache.is_render_supported
+                and self._get_audio_output() is not None):
+            self._speak_sentences(speech_handle=speech_handle, sentences=sentences)
+            self._count_speech(speech_result="pipelined")
+
+            return
+
+        self._synthesize(text=speech_handle.text)
+        self._count_speech(speech_result="synthesized")
+
+    def _speak_sentences(self, speech_handle: SpeechHandle, sentences: List[str]) -> None:
+        """Render the sentences on this thread, while a playback thread plays the ones before."""
+
+        # (Sentence index, WAV file) of the rendered sentences, None once all are rendered.
+        rendered_sentences: "Queue[Tuple[int, str] | None]" = Queue(
+            maxsize=self._look_ahead_sentences)
+
+        # The index of the first sentence that could not be rendered or played, if any.
+        unspoken_indexes: List[int] = []
+
+        playback_thread: Thread = Thread(
+            target=self._play_sentences,
+            args=(speech_handle, rendered_sentences, unspoken_indexes),
+            name="oojda-speech-playback", daemon=True)
+        playback_thread.start()
+
+        try:
+            for sentence_index, sentence in enumerate(sentences):
+                if speech_handle.is_cancelled or unspoken_indexes:
+                    break
+
+                audio_path: (str | None) = self._render_sentence(sentence=sentence)
+
+                if audio_path is None:
+                    unspoken_indexes.append(sentence_index)
+                    break
+
+                rendered_sentences.put((sentence_index, audio_path))
+
+        finally:
+            rendered_sentences.put(None)
+            playback_thread.join()
+
+        # Whatever could not be played from PCM is synthesized the old way.
+        if unspoken_indexes and not speech_handle.is_cancelled:
+            self._synthesize(text=" ".join(sentences[min(unspoken_indexes):]))
+
+        self._log_handler.create_log(
+            log_type="info",
+            log_message=(f"Pipelined {len(sentences)} sentences, first audio after "
+                         f"{(speech_handle.first_audio_seconds or 0.0) * 1000:.0f} ms."))
+
+    def _play_sentences(self, speech_handle: SpeechHandle,
+                        rendered_sentences: "Queue[Tuple[int, str] | None]",
+                        unspoken_indexes: List[int]) -> None:
+        """Play the rendered sentences in order, deleting each file once it has been played."""
+
+        while True:
+            rendered_sentence: (Tuple[int, str] | None) = rendered_sentences.get()
+
+            if rendered_sentence is None:
+                return
+
+            sentence_index, audio_path = rendered_sentence
+
+            # After a cancel or a failure the remaining files are only cleaned up.
+            if not speech_handle.is_cancelled and not unspoken_indexes:
+                if not self._play_audio_file(audio_path=audio_path, speech_handle=speech_handle):
+                    unspoken_indexes.append(sentence_index)
+
+            remove_file(file_path=audio_path)
+
+    def _synthesize(self, text: str) -> None:
+        """Speak a text through the engine, and wait until it has been spoken."""
+
+        self._worker_state.is_synthesizing = True
+
+        try:
+            self._devices.engine.say(text=text)
+            self._devices.engine.runAndWait()
+
+        finally:
+            self._worker_state.is_synthesizing = False
+
+    def _render_sentence(self, sentence: str) -> (str | None):
+        """Render a sentence into a temporary WAV file, None if it could not be rendered."""
+
+        file_descriptor, audio_path = mkstemp(prefix="oojda-speech-", suffix=".wav")
+        close(file_descriptor)
+
+        try:
+            render_wav_file(engine=self._devices.engine, text=sentence, file_path=audio_path)
+
+        except (OSError, wave.Error) as err:
+            remove_file(file_path=audio_path)
+
+            if isinstance(err, wave.Error):
+                self._speech_audio_cache.disable_rendering(err=err)
+
+            return None
+
+        return audio_path
+
+    def _count_speech(self, speech_result: str) -> None:
+        """Count how the text was spoken and log the counters now and then."""
+
+        self._speech_counts[speech_result] += 1
+
+        if sum(self._speech_counts.values()) % self._report_interval == 0:
+            self._log_handler.create_log(log_type="info",
+                                         log_message=f"Speech output: {self._speech_counts}")
+
+    def _play_audio_file(self, audio_path: str, speech_handle: SpeechHandle) -> bool:
+        """Play a WAV file in chunks, stopping once the handle is cancelled.
+
+        Returns False if nothing could be played, the text is then synthesized instead.
+        """
+
+        audio_output: Any = self._get_audio_output()
+
+        if audio_output is None:
+            return False
+
+        try:
+            with wave.open(audio_path, "rb") as audio_file:
+                output_stream: Any = audio_output.open(
+                    format=audio_output.get_format_from_width(audio_file.getsampwidth()),
+                    channels=audio_file.getnchannels(),
+                    rate=audio_file.getframerate(),
+                    output=True)
+
+                try:
+                    frame_data: bytes = audio_file.readframes(self._playback_chunk_frames)
+
+                    while frame_data and not speech_handle.is_cancelled:
+                        speech_handle.mark_first_audio()
+                        self._half_duplex_gate.feed_reference(
+                            frame_data=frame_data,
+                            sample_rate=audio_file.getframerate(),
+                            sample_width=audio_file.getsampwidth(),
+                            channels=audio_file.getnchannels())
+                        output_stream.write(frame_data)
+                        frame_data = audio_file.readframes(self._playback_chunk_frames)
+
+                finally:
+                    output_stream.stop_stream()
+                    output_stream.close()
+
+        except (OSError, EOFError, wave.Error) as err:
+            self._log_handler.create_log(
+                log_type="warning",
+                log_message=f"Speech audio could not be played, synthesizing it. {err}")
+
+            return False
+
+        return True
+
+    def _get_audio_output(self) -> Any:
+        """Return the PyAudio instance, creating it on first use. None if PyAudio is missing."""
+
+        devices: _OutputDevices = self._devices
+
+        if devices.audio_output is None and devices.audio_output_error is None:
+            try:
+                import pyaudio # type: ignore # pylint: disable=import-outside-toplevel
+
+                devices.audio_output = pyaudio.PyAudio()
+
+            except (ImportError, OSError) as err:
+                devices.audio_output_error = err
+                self._log_handler.create_log(
+                    log_type="warning",
+                    log_message=f"Speech audio cannot be played, synthesizing it. {err}")
+
+        return devices.audio_output
+
+
+def _create_speech_output_worker() -> SpeechOutputWorker:
+    """Create the speech output worker and start its thread."""
+
+    speech_output_worker: SpeechOutputWorker = SpeechOutputWorker()
+    speech_output_worker.start_worker()
+
+    return speech_output_worker
+
+
+# The worker thread (and with it the engine) is only started the first time Julie speaks.
+SERVICE_LOADER.register_service("speech_output_worker", _create_speech_output_worker)
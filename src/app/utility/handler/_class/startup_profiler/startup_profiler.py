@@ -0,0 +1,398 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+startup_profiler.py:
+====================
+This file contains StartupProfiler class, responsible for the --profile-startup mode.
+It records the wall time and memory allocations of every import under src.app and of
+every constructor called by the launch sequence.
+
+Overview:
+=========
+- An import hook wraps the loader of every src.app module and times its execution.
+- "self" time excludes nested src.app imports, so eager third party imports show up on the
+src.app module that imports them.
+- The results are written as a sorted table and as JSON, which can be compared against the
+JSON of a previous version with --profile-compare.
+- This module only depends on the Python standard library on purpose.
+It has to be imported and started before any other src.app module is imported,
+otherwise those imports would be missing from the flight recorder.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from functools import wraps
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from json import JSONDecodeError, dumps, load
+from os import makedirs, path
+from platform import platform, python_version
+from threading import local
+from time import perf_counter
+from types import ModuleType
+
+# Include internal typings.
+from typing import Any, Callable, ClassVar, Dict, List, Sequence, Tuple
+
+
+@dataclass
+class _ProfileFrame:
+    """Bookkeeping for one import or constructor that is currently running."""
+
+    started_at: float
+    started_with_memory: int
+    child_wall_time: float = 0.0
+    child_allocated: int = 0
+
+
+class _ProfilingLoader:
+    """Loader wrapper that times the execution of a single module."""
+
+    def __init__(self, loader: Any, profiler: "StartupProfiler", module_name: str):
+        self._loader = loader
+        self._profiler = profiler
+        self._module_name = module_name
+
+    def create_module(self, spec: ModuleSpec) -> (ModuleType | None):
+        """Delegate module creation to the wrapped loader."""
+
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: ModuleType) -> None:
+        """Execute the module with the wrapped loader and record how long it took."""
+
+        self._profiler.record_call(record_kind="import",
+                                   record_name=self._module_name,
+                                   func=self._loader.exec_module,
+                                   args=(module,))
+
+    def __getattr__(self, attribute_name: str) -> Any:
+        # Everything else (get_source, is_package, ...) is answered by the wrapped loader.
+        return getattr(self._loader, attribute_name)
+
+
+class _ProfilingFinder(MetaPathFinder):
+    """Meta path finder that wraps the loader of every module under the profiled package."""
+
+    def __init__(self, profiler: "StartupProfiler", package_prefix: str):
+        self._profiler = profiler
+        self._package_prefix = package_prefix
+
+    def find_spec(self, fullname: str, search_path: (Sequence[str] | None),
+                  target: (ModuleType | None) = None) -> (ModuleSpec | None):
+        """Find the real spec with the remaining finders and wrap its loader."""
+
+        if not fullname.startswith(self._package_prefix):
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec: (ModuleSpec | None) = finder.find_spec(fullname, search_path, target)
+
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _ProfilingLoader(loader=spec.loader,
+                                                   profiler=self._profiler,
+                                                   module_name=fullname)
+                return spec
+
+        return None
+
+
+@dataclass
+class StartupProfiler:
+    """Class to profile the startup imports and launch sequence constructors."""
+
+    # Only modules under this package are profiled.
+    _package_prefix: ClassVar[str] = "src.app"
+
+    # The startup profile default location.
+    _profile_directory_path: ClassVar[str] = "oojda/data/profiles"
+    _profile_file_name: ClassVar[str] = "startup_profile"
+
+    _version: str = ""
+
+    _records: List[Dict[str, Any]] = field(default_factory=lambda: [])
+    _finder: (_ProfilingFinder | None) = None
+    _profiling_started_at: float = 0.0
+    _profiling_stopped_at: float = 0.0
+    _thread_state: local = field(default_factory=local)
+
+    def start_profiling(self) -> None:
+        """Install the import hook and start tracing memory allocations.
+
+        Returns:
+            - None.
+        """
+
+        if self._finder is not None:
+            return
+
+        tracemalloc.start()
+        self._profiling_started_at = perf_counter()
+
+        self._finder = _ProfilingFinder(profiler=self, package_prefix=self._package_prefix)
+        sys.meta_path.insert(0, self._finder)
+
+    def stop_profiling(self) -> None:
+        """Remove the import hook and stop tracing memory allocations.
+
+        Returns:
+            - None.
+        """
+
+        if self._finder is None:
+            return
+
+        self._profiling_stopped_at = perf_counter()
+        sys.meta_path.remove(self._finder)
+        self._finder = None
+        tracemalloc.stop()
+
+    def profile_constructors(self, classes: Tuple[type, ...]) -> None:
+        """Wrap the constructor of every given class, so each instantiation is recorded.
+
+        Args:
+            - classes (Tuple[type, ...]): The classes whose constructors should be profiled.
+
+        Returns:
+            - None.
+        """
+
+        for profiled_class in classes:
+            original_init: Callable[..., None] = profiled_class.__init__
+            record_name: str = f"{profiled_class.__module__}.{profiled_class.__qualname__}"
+
+            def _profiled_init(instance: Any, *args: Any,
+                               _original_init: Callable[..., None] = original_init,
+                               _record_name: str = record_name, **kwargs: Any) -> None:
+                self.record_call(record_kind="constructor",
+                                 record_name=_record_name,
+                                 func=_original_init,
+                                 args=(instance, *args),
+                                 kwargs=kwargs)
+
+            profiled_class.__init__ = wraps(original_init)(_profiled_init)
+
+    def record_call(self, record_kind: str, record_name: str, func: Callable[..., Any],
+                    args: Tuple[Any, ...] = (), kwargs: (Dict[str, Any] | None) = None) -> Any:
+        """Call the given function and record its wall time and memory allocations.
+
+        Args:
+            - record_kind (str): Either "import" or "constructor".
+            - record_name (str): The module or class name being recorded.
+            - func (Callable[..., Any]): The function to call.
+            - args (Tuple[Any, ...]): Positional arguments for the function.
+            - kwargs (Dict[str, Any] | None): Keyword arguments for the function.
+
+        Returns:
+            - Any: Whatever the function returned.
+        """
+
+        if self._finder is None:
+            return func(*args, **(kwargs or {}))
+
+        frame_stack: List[_ProfileFrame] = self._get_frame_stack()
+        frame: _ProfileFrame = _ProfileFrame(started_at=perf_counter(),
+                                             started_with_memory=self._get_traced_memory())
+        frame_stack.append(frame)
+
+        try:
+            return func(*args, **(kwargs or {}))
+
+        finally:
+            frame_stack.pop()
+            wall_time: float = perf_counter() - frame.started_at
+            allocated: int = self._get_traced_memory() - frame.started_with_memory
+
+            if frame_stack:
+                frame_stack[-1].child_wall_time += wall_time
+                frame_stack[-1].child_allocated += allocated
+
+            self._records.append({
+                "kind": record_kind,
+                "name": record_name,
+                "wall_ms": round(wall_time * 1000, 3),
+                "self_ms": round((wall_time - frame.child_wall_time) * 1000, 3),
+                "allocated_kib": round(allocated / 1024, 1),
+                "self_allocated_kib": round((allocated - frame.child_allocated) / 1024, 1),
+            })
+
+    def get_sorted_records(self) -> List[Dict[str, Any]]:
+        """Return the recorded imports and constructors, slowest self time first.
+
+        Returns:
+            - List[Dict[str, Any]]: The sorted records.
+        """
+
+        return sorted(self._records, key=lambda record: record["self_ms"], reverse=True)
+
+    def create_profile_table(self) -> str:
+        """Create a table of every record, sorted by self time.
+
+        Returns:
+            - str: The startup profile table.
+        """
+
+        _table_lines: List[str] = [
+            f"{'kind':<12} {'self ms':>10} {'total ms':>10} {'self KiB':>10} "
+            f"{'total KiB':>10}  name",
+            "-" * 100,
+        ]
+
+        for record in self.get_sorted_records():
+            _table_lines.append(
+                f"{record['kind']:<12} {record['self_ms']:>10.1f} {record['wall_ms']:>10.1f} "
+                f"{record['self_allocated_kib']:>10.1f} {record['allocated_kib']:>10.1f}  "
+                f"{record['name']}")
+
+        return "\n".join(_table_lines) + "\n"
+
+    def create_profile_data(self, phase_durations: (Dict[str, float] | None) = None
+                            ) -> Dict[str, Any]:
+        """Create the JSON serializable startup profile.
+
+        Args:
+            - phase_durations (Dict[str, float] | None): Optional startup timer phases.
+
+        Returns:
+            - Dict[str, Any]: The startup profile.
+        """
+
+        _profiled_until: float = self._profiling_stopped_at or perf_counter()
+
+        return {
+            "version": self._version,
+            "python": python_version(),
+            "platform": platform(),
+            "total_ms": round((_profiled_until - self._profiling_started_at) * 1000, 3),
+            "phases_ms": {phase_name: round(phase_duration * 1000, 3)
+                          for phase_name, phase_duration in (phase_durations or {}).items()},
+            "records": self.get_sorted_records(),
+        }
+
+    def create_profile_report(self, phase_durations: (Dict[str, float] | None) = None,
+                              previous_profile_path: str = "") -> str:
+        """Stop profiling, then write the table and JSON files.
+
+        Args:
+            - phase_durations (Dict[str, float] | None): Optional startup timer phases.
+            - previous_profile_path (str): Optional JSON profile of a previous version,
+            to add a comparison to the report.
+
+        Returns:
+            - str: The table (and comparison) that has been written.
+        """
+
+        self.stop_profiling()
+
+        profile_data: Dict[str, Any] = self.create_profile_data(phase_durations=phase_durations)
+        profile_report: str = self.create_profile_table()
+
+        if previous_profile_path:
+            profile_report += "\n" + self.create_comparison_table(
+                profile_data=profile_data, previous_profile_path=previous_profile_path)
+
+        makedirs(name=self._profile_directory_path, exist_ok=True)
+        _file_name_with_path: str = path.join(self._profile_directory_path,
+                                              self._profile_file_name)
+
+        with open(file=f"{_file_name_with_path}.json", mode="w", encoding="UTF-8") as file:
+            file.write(dumps(profile_data, indent=4))
+
+        with open(file=f"{_file_name_with_path}.txt", mode="w", encoding="UTF-8") as file:
+            file.write(profile_report)
+
+        return profile_report
+
+    @staticmethod
+    def create_comparison_table(profile_data: Dict[str, Any], previous_profile_path: str) -> str:
+        """Compare the self time of every record against a previous JSON profile.
+
+        Args:
+            - profile_data (Dict[str, Any]): The current startup profile.
+            - previous_profile_path (str): The JSON profile of a previous version.
+
+        Returns:
+            - str: A table of the self time differences, biggest regression first.
+        """
+
+        try:
+            with open(file=previous_profile_path, mode="r", encoding="UTF-8") as file:
+                previous_profile_data: Dict[str, Any] = load(file)
+
+        except (FileNotFoundError, JSONDecodeError) as err:
+            return f"Previous startup profile could not be read. {err}\n"
+
+        previous_self_times: Dict[Tuple[str, str], float] = {
+            (record["kind"], record["name"]): record["self_ms"]
+            for record in previous_profile_data.get("records", [])}
+        current_self_times: Dict[Tuple[str, str], float] = {
+            (record["kind"], record["name"]): record["self_ms"]
+            for record in profile_data["records"]}
+
+        _differences: List[Tuple[float, float, float, str]] = []
+
+        for record_key in set(previous_self_times) | set(current_self_times):
+            previous_self_time: float = previous_self_times.get(record_key, 0.0)
+            current_self_time: float = current_self_times.get(record_key, 0.0)
+            _differences.append((current_self_time - previous_self_time,
+                                  previous_self_time, current_self_time, record_key[1]))
+
+        _table_lines: List[str] = [
+            f"Compared with {previous_profile_data.get('version', '?')} "
+            f"({previous_profile_path}):",
+            f"{'delta ms':>10} {'before ms':>10} {'after ms':>10}  name",
+            "-" * 100,
+            f"{profile_data['total_ms'] - previous_profile_data.get('total_ms', 0.0):>+10.1f} "
+            f"{previous_profile_data.get('total_ms', 0.0):>10.1f} "
+            f"{profile_data['total_ms']:>10.1f}  total",
+        ]
+
+        for difference, previous_self_time, current_self_time, record_name in sorted(
+                _differences, reverse=True):
+            _table_lines.append(f"{difference:>+10.1f} {previous_self_time:>10.1f} "
+                                f"{current_self_time:>10.1f}  {record_name}")
+
+        return "\n".join(_table_lines) + "\n"
+
+    def _get_frame_stack(self) -> List[_ProfileFrame]:
+        """Return the frame stack of the current thread, imports can nest per thread."""
+
+        if not hasattr(self._thread_state, "frame_stack"):
+            self._thread_state.frame_stack = []
+
+        return self._thread_state.frame_stack
+
+    @staticmethod
+    def _get_traced_memory() -> int:
+        """Return the currently traced memory in bytes."""
+
+        return tracemalloc.get_traced_memory()[0]
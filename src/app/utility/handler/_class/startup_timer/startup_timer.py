@@ -0,0 +1,175 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+startup_timer.py:
+=================
+This file contains StartupTimer class, responsible to time every phase of the launch.
+Such as: module imports, welcome screen, user information and the speech recognition setup.
+
+Overview:
+=========
+Every launch phase is marked when it ends, the duration is measured from the previous mark.
+Once Julie is online the startup report is logged and written to the oojda logs folder.
+T minus zero, and we know exactly where every second went.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass, field
+from time import perf_counter
+
+# Include internal typings.
+from typing import Callable, ClassVar, Dict, List
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.file_operation.file_operation import FileOperation
+
+
+@dataclass
+class StartupTimer:
+    """Class to time every phase of the launch sequence and report it once Julie is online."""
+
+    # Instantiate LogHandler.
+    _log_handler: LogHandler = field(default_factory=LogHandler)
+
+    # Instantiate FileOperation.
+    _file_operation: FileOperation = field(default_factory=FileOperation)
+
+    # The startup report default location.
+    _report_directory_path: ClassVar[str] = "oojda/data/logs"
+    _report_file_name: ClassVar[str] = "startup_report.txt"
+
+    _launch_started_at: float = field(default_factory=perf_counter)
+    _last_mark_at: float = 0.0
+
+    # Duration (in seconds) of every launch phase, in the order they were marked.
+    _phase_durations: Dict[str, float] = field(default_factory=lambda: {})
+
+    _is_ready: bool = False
+
+    # Functions to call once Julie is online. (Such as the startup profiler report.)
+    _ready_callbacks: List[Callable[[], None]] = field(default_factory=lambda: [])
+
+    def __post_init__(self):
+        self._last_mark_at = self._launch_started_at
+
+    def mark_phase(self, phase_name: str) -> None:
+        """Mark the end of a launch phase.
+
+        Args:
+            - phase_name (str): The name of the phase that has just finished.
+            The duration is measured from the previous mark or the launch start.
+
+        Returns:
+            - None.
+        """
+
+        _marked_at: float = perf_counter()
+        self._phase_durations[phase_name] = (
+            self._phase_durations.get(phase_name, 0.0) + _marked_at - self._last_mark_at)
+        self._last_mark_at = _marked_at
+
+    def add_ready_callback(self, ready_callback: Callable[[], None]) -> None:
+        """Register a function to call once Julie is online.
+
+        Args:
+            - ready_callback (Callable[[], None]): The function to call.
+
+        Returns:
+            - None.
+        """
+
+        self._ready_callbacks.append(ready_callback)
+
+    def mark_ready(self) -> None:
+        """Mark Julie as online, log and save the startup report, then call the ready callbacks.
+
+        - Only the first call creates the report, later calls are ignored.
+
+        Returns:
+            - None.
+        """
+
+        if self._is_ready:
+            return
+
+        self._is_ready = True
+        self.mark_phase("online")
+
+        startup_report: str = self.create_startup_report()
+        self._log_handler.create_log(log_type="info", log_message=startup_report)
+
+        try:
+            self._file_operation.create_file_operation(
+                file_contents=startup_report,
+                directory_path=self._report_directory_path,
+                file_type="text",
+                file_name=self._report_file_name,
+                file_mode="w")
+
+        except (ValueError, TypeError) as err:
+            self._log_handler.create_log(
+                log_type="warning",
+                log_message=f"Startup report could not be saved. {err}")
+
+        for ready_callback in self._ready_callbacks:
+            ready_callback()
+
+    def get_phase_durations(self) -> Dict[str, float]:
+        """Return the duration (in seconds) of every marked launch phase.
+
+        Returns:
+            - Dict[str, float]: The phase durations in the order they were marked.
+        """
+
+        return dict(self._phase_durations)
+
+    def get_time_since_launch(self) -> float:
+        """Return the time (in seconds) since the launch started."""
+
+        return perf_counter() - self._launch_started_at
+
+    def create_startup_report(self) -> str:
+        """Create a human readable report of every launch phase.
+
+        Returns:
+            - str: The startup report.
+        """
+
+        _report_lines: List[str] = ["Startup timing report:"]
+
+        for phase_name, phase_duration in self._phase_durations.items():
+            _report_lines.append(f"  {phase_name:<40} {phase_duration * 1000:>10.1f} ms")
+
+        _report_lines.append(
+            f"  {'total':<40} {(self._last_mark_at - self._launch_started_at) * 1000:>10.1f} ms")
+
+        return "\n".join(_report_lines) + "\n"
+
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# Shared startup timer, the clock starts the first time this module is imported.
+STARTUP_TIMER: StartupTimer = StartupTimer()
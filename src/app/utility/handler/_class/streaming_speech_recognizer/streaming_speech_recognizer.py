@@ -0,0 +1,183 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+streaming_speech_recognizer.py:
+===============================
+This file contains the streaming speech recognizers, they guess the words of an utterance
+while it is still being spoken.
+- PrefixStreamingSpeechRecognizer: recognizes the growing utterance again every few hundred
+milliseconds with a batch recognizer (such as Google), in a recognition worker process.
+Without worker processes it streams nothing, the closed utterance is recognized as usual.
+- ScriptedStreamingSpeechRecognizer: a local stand-in that reveals a known transcript at
+speaking speed, to replay and time the early intent dispatch without any network.
+
+Overview:
+=========
+Partial hypotheses let Julie act on "open spot..." before the user has finished saying
+"spotify", instead of waiting for the pause and the full recognition.
+T minus ten, nine... we have lift off before the countdown ends.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+# Include internal typings.
+from typing import Any, Callable, ClassVar, List
+
+# Include external packages and modules.
+from speech_recognition import AudioData, Recognizer # type: ignore
+
+# Include custom packages and modules.
+from src.app.design_pattern.strategy.abstract.blueprint.abstract_streaming_speech_recognizer\
+    .abstract_streaming_speech_recognizer import AbstractStreamingSpeechRecognizer
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.handler._class.recognition_worker_pool.recognition_worker_pool\
+    import RecognitionWorkerPool
+from src.app.utility.helper._module.speech_recognizer.google.google_speech_recognizer\
+    import transcribe_google_audio
+
+
+@dataclass
+class PrefixStreamingSpeechRecognizer(AbstractStreamingSpeechRecognizer):
+    """Class to stream partial hypotheses by recognizing the growing utterance again."""
+
+    # Module level function that recognizes a prefix in a recognition worker process.
+    recognize_audio: Callable[[Recognizer, AudioData], Any] = transcribe_google_audio
+
+    # A prefix is recognized again once this much new audio has been spoken,
+    # and only one prefix is in flight at a time.
+    _update_interval_seconds: ClassVar[float] = 0.4
+
+    # Shorter prefixes cannot hold a word yet.
+    _min_prefix_seconds: ClassVar[float] = 0.3
+
+    _sample_rate: int = 16000
+    _sample_width: int = 2
+
+    _pending_future: (Future[Any] | None) = None
+    _submitted_length: int = 0
+    _partial_query: str = ""
+
+    def start_stream(self, sample_rate: int, sample_width: int) -> None:
+        """Forget the last utterance, and start streaming a new one."""
+
+        self.stop_stream()
+
+        self._sample_rate = sample_rate
+        self._sample_width = sample_width
+
+    def update_stream(self, frame_data: memoryview) -> str:
+        """Submit the grown prefix if it is due, and return the latest partial hypothesis."""
+
+        recognition_worker_pool: RecognitionWorkerPool = SERVICE_LOADER.get_service(
+            "recognition_worker_pool")
+
+        # Recognized in this process a prefix would block the capture loop, the utterance
+        # is recognized once it has been closed instead.
+        if recognition_worker_pool.is_in_process:
+            return ""
+
+        if self._pending_future is not None and self._pending_future.done():
+            # A prefix that could not be recognized just means no new hypothesis.
+            if not self._pending_future.cancelled() and self._pending_future.exception() is None:
+                self._partial_query = self._pending_future.result() or self._partial_query
+
+            self._pending_future = None
+
+        bytes_per_second: int = self._sample_rate * self._sample_width
+
+        if (self._pending_future is None
+                and len(frame_data) >= self._min_prefix_seconds * bytes_per_second
+                and (len(frame_data) - self._submitted_length
+                     >= self._update_interval_seconds * bytes_per_second)):
+            # The view is only valid during this call, the prefix is copied.
+            self._pending_future = recognition_worker_pool.submit_recognition(
+                recognize_audio=self.recognize_audio,
+                recognizer=SERVICE_LOADER.get_service("speech_recognizer_recognizer"),
+                audio=AudioData(bytes(frame_data), self._sample_rate, self._sample_width))
+            self._submitted_length = len(frame_data)
+
+        return self._partial_query
+
+    def stop_stream(self) -> None:
+        """Cancel the prefix in flight, and forget the partial hypothesis."""
+
+        if self._pending_future is not None:
+            self._pending_future.cancel()
+
+        self._pending_future = None
+        self._submitted_length = 0
+        self._partial_query = ""
+
+
+@dataclass
+class ScriptedStreamingSpeechRecognizer(AbstractStreamingSpeechRecognizer):
+    """Class to stream the partial hypotheses of known transcripts, one per utterance.
+
+    Example:
+        - python oojda_main.py --replay commands.wav --stream-transcript commands.txt
+    """
+
+    # The transcripts of the streamed utterances, in the order they are spoken.
+    transcripts: List[str] = field(default_factory=lambda: [])
+
+    # The transcript is revealed at about this speaking speed,
+    # after the delay a real streaming recognizer needs for its first hypothesis.
+    _characters_per_second: ClassVar[float] = 15.0
+    _first_hypothesis_seconds: ClassVar[float] = 0.2
+
+    _sample_rate: int = 16000
+    _sample_width: int = 2
+
+    _transcript_index: int = 0
+    _transcript: str = ""
+
+    def start_stream(self, sample_rate: int, sample_width: int) -> None:
+        """Start revealing the next transcript."""
+
+        self._sample_rate = sample_rate
+        self._sample_width = sample_width
+
+        self._transcript = (self.transcripts[self._transcript_index]
+                            if self._transcript_index < len(self.transcripts) else "")
+        self._transcript_index += 1
+
+    def update_stream(self, frame_data: memoryview) -> str:
+        """Return as much of the transcript as has been spoken so far."""
+
+        spoken_seconds: float = (len(frame_data) / (self._sample_rate * self._sample_width)
+                                 - self._first_hypothesis_seconds)
+
+        if spoken_seconds <= 0:
+            return ""
+
+        return self._transcript[:int(spoken_seconds * self._characters_per_second)].strip()
+
+    def stop_stream(self) -> None:
+        """Stop revealing the transcript."""
+
+        self._transcript = ""
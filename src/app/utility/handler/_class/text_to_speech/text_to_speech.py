@@ -9,6 +9,14 @@ text_to_speech.py:
 ==================
 Class to convert a given text into speech.
 
+Overview:
+=========
+- The texts are spoken by the SpeechOutputWorker, which owns the pyttsx3 engine.
+- speak() returns right away with a SpeechHandle, create_text_to_speech() waits until
+the text has been spoken.
+- prerender_speech() renders texts into the speech audio cache without speaking them.
+Transmission queued, over and out.
+
 Guidelines:
 ===========
 Import Statement Guidelines:
@@ -34,13 +42,15 @@ from dataclasses import dataclass, field
 from logging import disable
 
 # Include internal typings.
-from typing import Any
-
-# Include external packages and modules.
-import pyttsx3 # type: ignore
+from typing import ClassVar, List, Tuple
 
 # Include custom packages and modules.
 from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.handler._class.command_executor.command_executor import\
+    (get_current_cancellation_token, is_current_command_cancelled, )
+from src.app.utility.handler._class.speech_output_worker.speech_output_worker import\
+    (SpeechHandle, SpeechOutputWorker, )
 
 # * DISABLE THE LOGS.
 # ! ALERT: ONLY DISABLE THE LOGS IN PRODUCTION. DO NOT DISABLE ELSE, OTHERWISE,
@@ -53,12 +63,46 @@ disable()
 class TextToSpeech:
     """Class to convert a given text into speech."""
 
-    # Instantiate pyttsx3.
-    _engine: pyttsx3.Engine = pyttsx3.init() # type: ignore
-
     # Instantiate LogHandler.
     _log_handler: LogHandler = field(default_factory=LogHandler)
 
+    # Headless replays (no sound card) print what Julie would say instead.
+    is_headless: ClassVar[bool] = False
+
+    def speak(self, text_to_produce_speech: str) -> SpeechHandle:
+        """Method to queue a text to be spoken, without waiting for it.
+
+        Args:
+            - text_to_produce_speech (str) - The text that needs to be converted into speech.
+
+        Returns:
+            - SpeechHandle: The handle to wait on or to cancel. It is already done if the text
+            was printed (headless) or the command speaking it was cancelled.
+
+        Raises:
+            - ValueError: if text_to_produce_speech is empty.
+        """
+
+        if not text_to_produce_speech.strip():
+            raise ValueError("Error: text_to_produce_speech parameter cannot be empty.")
+
+        # A command that was stopped or pre-empted has nothing left to say.
+        if is_current_command_cancelled() or TextToSpeech.is_headless:
+            speech_handle: SpeechHandle = SpeechHandle(
+                text=text_to_produce_speech,
+                cancellation_token=get_current_cancellation_token())
+            speech_handle.mark_done()
+
+            if not speech_handle.is_cancelled and TextToSpeech.is_headless:
+                print(f"Julie: {text_to_produce_speech.strip()}")
+
+            return speech_handle
+
+        speech_output_worker: SpeechOutputWorker = SERVICE_LOADER.get_service(
+            "speech_output_worker")
+
+        return speech_output_worker.speak(text=text_to_produce_speech)
+
     def create_text_to_speech(self, text_to_produce_speech: str) -> None:
         """Method to convert a given text into speech based on the text_to_produce_speech string.
         
@@ -74,21 +118,11 @@ class TextToSpeech:
         """
 
         try:
-            if not text_to_produce_speech.strip():
-                raise ValueError("Error: text_to_produce_speech parameter cannot be empty.")
-
-            # Set speaker (speaking) rate.
-            # Speed at which the speaker will read the text.
-            self._engine.setProperty('rate', 175) # type: ignore
+            speech_handle: SpeechHandle = self.speak(text_to_produce_speech=text_to_produce_speech)
+            speech_handle.wait()
 
-            # Get supported voices. (Device Specific.)
-            # * ON WINDOWS: [0] = MALE VOICE, [1] = FEMALE VOICE, BOTH (DEFAULTS).
-            voices: Any = self._engine.getProperty('voices') # type: ignore
-            self._engine.setProperty('voice', voices[1].id) # type: ignore
-
-            # Speak text.
-            self._engine.say(text=text_to_produce_speech) # type: ignore
-            self._engine.runAndWait() # type: ignore
+            if speech_handle.error is not None:
+                raise speech_handle.error
 
         except ValueError as err:
             self._log_handler.create_log(
@@ -101,3 +135,31 @@ class TextToSpeech:
 
             # Reraise the exception for higher-level handling.
             raise
+
+    def prerender_speech(self, texts: Tuple[str, ...]) -> int:
+        """Method to render texts into the speech audio cache ahead of time, and wait for it.
+
+        Args:
+            - texts (Tuple[str, ...]) - The texts to render, such as Julie's prompts.
+
+        Returns:
+            - int: The number of texts that failed to render.
+        """
+
+        speech_output_worker: SpeechOutputWorker = SERVICE_LOADER.get_service(
+            "speech_output_worker")
+
+        speech_handles: List[SpeechHandle] = [speech_output_worker.prerender(text=text)
+                                              for text in texts if text.strip()]
+        failed_renders: int = 0
+
+        for speech_handle in speech_handles:
+            speech_handle.wait()
+
+            if speech_handle.error is not None:
+                failed_renders += 1
+                self._log_handler.create_log(
+                    log_type="error",
+                    log_message=f"Error rendering speech audio: {speech_handle.error}")
+
+        return failed_renders
@@ -0,0 +1,363 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+voice_activity_detector.py:
+===========================
+This file contains VoiceActivityDetector class, responsible to find where speech starts and ends
+in a continuous stream of PCM chunks.
+
+Overview:
+=========
+- Every chunk is split into 10 ms frames and the frame energy, zero crossing rate and
+spectral flatness are computed for all frames at once with NumPy.
+- A frame is speech if it is loud enough and either tonal (voiced sounds have a peaky,
+not flat, spectrum) or hissy with many zero crossings (s, f, sh sounds).
+- The noise floor and the noise flatness follow the room continuously, quickly while it is
+quiet and slowly while someone is talking, so a noisy room still ends its utterances.
+- The closing pause (hangover) is learned from the pauses the user makes inside utterances,
+so utterances are closed as early as it is safe, instead of after a fixed second of silence.
+Houston, we have silence.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from collections import deque
+from dataclasses import dataclass, field
+from math import exp
+
+# Include internal typings.
+from typing import ClassVar, Deque, Tuple
+
+# Include external packages and modules.
+import numpy as np
+
+# Include custom packages and modules.
+from src.app.utility.helper._module.audio_features.audio_features import frame_samples
+
+
+@dataclass(frozen=True)
+class SpeechSegment:
+    """A closed utterance, as absolute byte positions in the captured stream."""
+
+    start_position: int
+    end_position: int
+
+    # Seconds between the end of the speech and the moment the utterance was closed.
+    endpoint_latency: float
+
+
+@dataclass
+class _EndpointState:
+    """Where the current utterance started, and how long it has been spoken and paused."""
+
+    utterance_start_position: (int | None) = None
+    last_speech_end_position: int = 0
+    last_endpoint_position: int = 0
+    last_hangover_seconds: float = 0.0
+    speaking_seconds: float = 0.0
+    silence_seconds: float = 0.0
+
+
+@dataclass
+class VoiceActivityDetector:
+    """Class to detect speech in PCM chunks and close utterances with an adaptive pause."""
+
+    sample_rate: int = 16000
+    sample_width: int = 2
+
+    # Frame energy (RMS in 16 bit sample units, the same scale as Recognizer.energy_threshold)
+    # must be this many times above the noise floor to count as speech.
+    _energy_ratio: ClassVar[float] = 2.0
+    _min_energy_threshold: ClassVar[float] = 50.0
+
+    # Speech spectra are less flat than noise. Also counts as speech: many zero crossings.
+    _flatness_ratio: ClassVar[float] = 0.8
+    _fricative_zero_crossing_rate: ClassVar[float] = 0.25
+
+    # A chunk is speech if at least this share of its frames is speech.
+    _speech_frame_share: ClassVar[float] = 0.5
+
+    # How fast (time constants in seconds) the noise estimates follow the room.
+    _noise_time_constant_in_silence: ClassVar[float] = 0.5
+    _noise_time_constant_in_speech: ClassVar[float] = 10.0
+
+    # The closing pause is kept between these bounds, the default is used until enough
+    # pauses inside utterances have been observed.
+    _min_hangover_seconds: ClassVar[float] = 0.25
+    _max_hangover_seconds: ClassVar[float] = 0.8
+    _default_hangover_seconds: ClassVar[float] = 0.5
+    _min_observed_pauses: ClassVar[int] = 5
+
+    # Audio kept before the first and after the last speech chunk, so no syllable is clipped.
+    _pre_roll_seconds: ClassVar[float] = 0.3
+    _post_roll_seconds: ClassVar[float] = 0.15
+
+    # Shorter bursts are clicks, longer utterances are closed anyway.
+    _min_speech_seconds: ClassVar[float] = 0.2
+    _max_utterance_seconds: ClassVar[float] = 15.0
+
+    _noise_floor: float = 100.0
+    _noise_flatness: float = 0.5
+
+    _observed_pauses: Deque[float] = field(default_factory=lambda: deque(maxlen=50))
+    _endpoint_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=100))
+
+    # Endpointing state.
+    _endpoint: _EndpointState = field(default_factory=_EndpointState)
+
+    @property
+    def energy_threshold(self) -> float:
+        """The current frame energy threshold for speech."""
+
+        return max(self._min_energy_threshold, self._noise_floor * self._energy_ratio)
+
+    @property
+    def noise_floor(self) -> float:
+        """The current noise floor estimate."""
+
+        return self._noise_floor
+
+    @property
+    def hangover_seconds(self) -> float:
+        """The current closing pause, learned from the pauses inside utterances."""
+
+        if len(self._observed_pauses) < self._min_observed_pauses:
+            return self._default_hangover_seconds
+
+        return float(np.clip(1.2 * np.percentile(self._observed_pauses, 90),
+                             self._min_hangover_seconds, self._max_hangover_seconds))
+
+    @property
+    def is_in_utterance(self) -> bool:
+        """True while an utterance has started but has not been closed yet."""
+
+        return self._endpoint.utterance_start_position is not None
+
+    @property
+    def utterance_start_position(self) -> (int | None):
+        """The stream position the current utterance started at, None outside an utterance."""
+
+        return self._endpoint.utterance_start_position
+
+    def set_noise_floor(self, noise_floor: float) -> None:
+        """Set the noise floor, for example from a previous calibration.
+
+        Args:
+            - noise_floor (float): The noise floor in 16 bit sample RMS units.
+
+        Returns:
+            - None.
+        """
+
+        self._noise_floor = max(1.0, noise_floor)
+
+    def get_average_endpoint_latency(self) -> float:
+        """Return the average endpoint latency (in seconds) of the recent utterances."""
+
+        if not self._endpoint_latencies:
+            return 0.0
+
+        return float(np.mean(self._endpoint_latencies))
+
+    def calibrate_noise_floor(self, frame_data: bytes) -> float:
+        """Measure the noise floor and noise flatness from audio without speech.
+
+        Args:
+            - frame_data (bytes): The PCM frames of a quiet moment, about a second long.
+
+        Returns:
+            - float: The measured noise floor.
+        """
+
+        frame_energies, _, spectral_flatness = self._compute_frame_features(chunk=frame_data)
+
+        if frame_energies.size:
+            self.set_noise_floor(noise_floor=float(np.median(frame_energies)))
+            self._noise_flatness = float(np.median(spectral_flatness))
+
+        return self._noise_floor
+
+    def is_speech_chunk(self, chunk: bytes) -> bool:
+        """Classify a chunk and let the noise estimates follow the room.
+
+        Args:
+            - chunk (bytes): The PCM frames of the chunk.
+
+        Returns:
+            - bool: True if the chunk contains speech.
+        """
+
+        frame_energies, zero_crossing_rates, spectral_flatness = self._compute_frame_features(
+            chunk=chunk)
+
+        if frame_energies.size == 0:
+            return False
+
+        is_loud: np.ndarray = frame_energies > self.energy_threshold
+        is_tonal: np.ndarray = spectral_flatness < self._noise_flatness * self._flatness_ratio
+        is_fricative: np.ndarray = zero_crossing_rates > self._fricative_zero_crossing_rate
+
+        is_speech: bool = bool(
+            np.mean(is_loud & (is_tonal | is_fricative)) >= self._speech_frame_share)
+
+        chunk_seconds: float = len(chunk) / (self.sample_rate * self.sample_width)
+        time_constant: float = (self._noise_time_constant_in_speech if is_speech
+                                else self._noise_time_constant_in_silence)
+        adaptation: float = 1.0 - exp(-chunk_seconds / time_constant)
+
+        self._noise_floor += adaptation * (float(np.median(frame_energies)) - self._noise_floor)
+        self._noise_floor = max(1.0, self._noise_floor)
+
+        if not is_speech:
+            self._noise_flatness += adaptation * (
+                float(np.median(spectral_flatness)) - self._noise_flatness)
+
+        return is_speech
+
+    def process_chunk(self, chunk: bytes, end_position: int) -> (SpeechSegment | None):
+        """Feed the next chunk of the stream and return an utterance once it is closed.
+
+        Args:
+            - chunk (bytes): The PCM frames of the chunk.
+            - end_position (int): The absolute stream position right after the chunk.
+
+        Returns:
+            - SpeechSegment | None: The closed utterance, or None while none has been closed.
+        """
+
+        bytes_per_second: int = self.sample_rate * self.sample_width
+        chunk_seconds: float = len(chunk) / bytes_per_second
+        is_speech: bool = self.is_speech_chunk(chunk=chunk)
+
+        endpoint: _EndpointState = self._endpoint
+
+        if endpoint.utterance_start_position is None:
+            if is_speech:
+                self._start_utterance(chunk_start_position=end_position - len(chunk),
+                                      end_position=end_position,
+                                      chunk_seconds=chunk_seconds)
+
+            return None
+
+        if is_speech:
+            # A pause that ended in more speech, the user was only catching breath.
+            if endpoint.silence_seconds:
+                self._observed_pauses.append(endpoint.silence_seconds)
+
+            endpoint.speaking_seconds += chunk_seconds
+            endpoint.silence_seconds = 0.0
+            endpoint.last_speech_end_position = end_position
+
+        else:
+            endpoint.silence_seconds += chunk_seconds
+
+        is_too_long: bool = (end_position - endpoint.utterance_start_position
+                             >= self._max_utterance_seconds * bytes_per_second)
+
+        if endpoint.silence_seconds < self.hangover_seconds and not is_too_long:
+            return None
+
+        return self._close_utterance(end_position=end_position)
+
+    def flush_utterance(self, end_position: int) -> (SpeechSegment | None):
+        """Close the current utterance right away, such as when the audio source has ended.
+
+        Args:
+            - end_position (int): The absolute stream position the stream has ended at.
+
+        Returns:
+            - SpeechSegment | None: The closed utterance, or None if there was none.
+        """
+
+        if self._endpoint.utterance_start_position is None:
+            return None
+
+        return self._close_utterance(end_position=end_position)
+
+    def _compute_frame_features(
+            self, chunk: bytes) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Compute the energy, zero crossing rate and spectral flatness of every 10 ms frame."""
+
+        samples: np.ndarray = np.frombuffer(chunk, dtype=f"<i{self.sample_width}")
+        samples = samples.astype(np.float32) * (2 ** 15 / 2 ** (8 * self.sample_width - 1))
+
+        frame_length: int = max(1, self.sample_rate // 100)
+        frames: np.ndarray = frame_samples(samples, frame_length, frame_length)
+
+        frame_energies: np.ndarray = np.sqrt(np.mean(frames ** 2, axis=1))
+        zero_crossing_rates: np.ndarray = np.mean(
+            np.signbit(frames[:, 1:]) != np.signbit(frames[:, :-1]), axis=1)
+
+        power_spectra: np.ndarray = np.abs(np.fft.rfft(frames, axis=1)) ** 2 + 1e-10
+        spectral_flatness: np.ndarray = (
+            np.exp(np.mean(np.log(power_spectra), axis=1)) / np.mean(power_spectra, axis=1))
+
+        return frame_energies, zero_crossing_rates, spectral_flatness
+
+    def _start_utterance(self, chunk_start_position: int, end_position: int,
+                         chunk_seconds: float) -> None:
+        """Open an utterance at the first speech chunk, including the pre-roll."""
+
+        bytes_per_second: int = self.sample_rate * self.sample_width
+        endpoint: _EndpointState = self._endpoint
+
+        # Speech right after an utterance was closed means it was closed too early,
+        # learn the real pause so the next one is not cut.
+        resume_gap_seconds: float = (
+            (chunk_start_position - endpoint.last_endpoint_position) / bytes_per_second)
+
+        if endpoint.last_endpoint_position and resume_gap_seconds < self._max_hangover_seconds:
+            self._observed_pauses.append(endpoint.last_hangover_seconds + resume_gap_seconds)
+
+        pre_roll_length: int = (
+            int(self._pre_roll_seconds * self.sample_rate) * self.sample_width)
+
+        endpoint.utterance_start_position = max(0, chunk_start_position - pre_roll_length)
+        endpoint.last_speech_end_position = end_position
+        endpoint.speaking_seconds = chunk_seconds
+        endpoint.silence_seconds = 0.0
+
+    def _close_utterance(self, end_position: int) -> (SpeechSegment | None):
+        """Close the current utterance, dropping it if it was too short to be speech."""
+
+        endpoint: _EndpointState = self._endpoint
+        start_position: int = endpoint.utterance_start_position or 0
+        post_roll_length: int = (
+            int(self._post_roll_seconds * self.sample_rate) * self.sample_width)
+        endpoint_latency: float = endpoint.silence_seconds
+
+        endpoint.utterance_start_position = None
+        endpoint.last_endpoint_position = end_position
+        endpoint.last_hangover_seconds = endpoint.silence_seconds
+
+        if endpoint.speaking_seconds < self._min_speech_seconds:
+            return None
+
+        self._endpoint_latencies.append(endpoint_latency)
+
+        return SpeechSegment(
+            start_position=start_position,
+            end_position=min(end_position, endpoint.last_speech_end_position + post_roll_length),
+            endpoint_latency=endpoint_latency)
@@ -29,8 +29,11 @@ Some modules may have dependencies on external libraries.
 Refer to the module documentation for details.
 """
 
+# Include built-in packages and modules.
+from functools import lru_cache
+
 # Include internal typings.
-from typing import Any, List
+from typing import Any, Dict, FrozenSet, List
 
 # Include external packages and modules.
 from AppOpener import open as open_app, give_appnames # type: ignore
@@ -39,6 +42,16 @@ from AppOpener import open as open_app, give_appnames # type: ignore
 class AppNotFoundError(Exception):
     """Handle app not found error."""
 
+@lru_cache(maxsize=1)
+def get_installed_application_names() -> FrozenSet[str]:
+    """Return (and cache) the lower case names of the installed applications.
+
+    Returns:
+        - FrozenSet[str]: The application names, as open_application expects them.
+    """
+
+    return frozenset(str(app_name).lower() for app_name in give_appnames(upper=False))
+
 def open_application(query: str, text_to_speech_handler: Any) -> None:
     """Opens an application based on the provided query using AppOpener.
 
@@ -95,3 +108,29 @@ def open_application(query: str, text_to_speech_handler: Any) -> None:
         if "Speech Recognition" not in _queried_application_name:
             text_to_speech_handler.create_text_to_speech(
                                 text_to_produce_speech=_app_not_found_error)
+
+def is_installed_application(application_name: str) -> bool:
+    """Check if an application is installed.
+
+    Args:
+        - application_name (str): The lower case application name.
+
+    Returns:
+        - bool: True if open_application can open it.
+    """
+
+    return application_name in get_installed_application_names()
+
+def open_requested_application(slots: Dict[str, str], text_to_speech_handler: Any) -> None:
+    """Open the application named by the application_name slot of an open command.
+
+    Args:
+        - slots (Dict[str, str]): The slots of the routed query.
+        - text_to_speech_handler (Any): The text-to-speech handler for generating speech output.
+
+    Returns:
+        - None.
+    """
+
+    open_application(query=f"open {slots['application_name']}",
+                     text_to_speech_handler=text_to_speech_handler)
@@ -34,23 +34,41 @@ Refer to the module documentation for details.
 
 
 # Include internal typings.
-from typing import Any
+from typing import Any, Dict
 
-# Include external packages and modules.
-from google import generativeai as genai # type: ignore
-from google.api_core import exceptions
+# Include custom packages and modules.
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.data._module.prompt_phrases import CANNOT_HELP_APOLOGY
 
 # * LINK TO GET AN API KEY: https://aistudio.google.com/app
-genai.configure(api_key="YOUR_API_KEY") # type: ignore
+_API_KEY: str = "YOUR_API_KEY"
 
 # Choose which AI/LLM model to use.
-MODEL = genai.GenerativeModel('gemini-pro')
+_MODEL_NAME: str = "gemini-pro"
 
 
+def _create_gemini_ai_model() -> Any:
+    """Configure Gemini AI and create the chosen model.
+
+    - google.generativeai takes seconds to import, so it is only imported here,
+    the first time the model is needed or when it is warmed up in the background.
+
+    Returns:
+        - Any: The Gemini AI generative model.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    from google import generativeai as genai # type: ignore
+
+    genai.configure(api_key=_API_KEY) # type: ignore
+
+    return genai.GenerativeModel(_MODEL_NAME)
+
+SERVICE_LOADER.register_service("gemini_ai_model", _create_gemini_ai_model)
+
 def _speak_error(text_to_speech_handler: Any):
     text_to_speech_handler.create_text_to_speech(
-        text_to_produce_speech=(
-            "Sorry! I cant help you with this. Please try something else!"))
+        text_to_produce_speech=CANNOT_HELP_APOLOGY)
 
 def initiate_gemini_ai(prompt: str, text_to_speech_handler: Any) -> None:
     """Initiate the Gemini AI model with the given prompt and produce the requested data.
@@ -63,9 +81,12 @@ def initiate_gemini_ai(prompt: str, text_to_speech_handler: Any) -> None:
         - None.
     """
 
+    # pylint: disable=import-outside-toplevel
+    from google.api_core import exceptions
+
     try:
         # Feed the given prompt to the model.
-        response: genai.GenerativeModel = MODEL.generate_content( # type: ignore
+        response: Any = SERVICE_LOADER.get_service("gemini_ai_model").generate_content(
         f"\"{prompt}\"")
 
         # Store the response in a separate variable to return later.
@@ -93,3 +114,16 @@ def initiate_gemini_ai(prompt: str, text_to_speech_handler: Any) -> None:
 
     except exceptions.GoogleAPIError:
         _speak_error(text_to_speech_handler=text_to_speech_handler)
+
+def ask_gemini_ai(slots: Dict[str, str], text_to_speech_handler: Any) -> None:
+    """Answer a query no other plugin handles with Gemini AI.
+
+    Args:
+       - slots (Dict[str, str]): The fallback slots, query is the whole voice query.
+       - text_to_speech_handler (Any): The class to handle text to speech.
+
+    Returns:
+        - None.
+    """
+
+    initiate_gemini_ai(prompt=slots["query"], text_to_speech_handler=text_to_speech_handler)
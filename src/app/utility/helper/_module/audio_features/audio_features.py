@@ -0,0 +1,418 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+audio_features.py:
+==================
+This file contains vectorized NumPy functions to turn PCM audio into features and compare them.
+- Convert PCM frames into float samples.
+- Trim the silence around an utterance.
+- Resample audio with a polyphase windowed sinc filter.
+- Compute log mel band energies and MFCC (mel frequency cepstral coefficients) features.
+- Hash log band energies into a compact, noise tolerant perceptual hash.
+- Compare two feature sequences with DTW (dynamic time warping).
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from dataclasses import dataclass
+from functools import lru_cache
+from math import gcd
+
+# Include internal typings.
+from typing import Tuple
+
+# Include external packages and modules.
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# How many output samples resample_polyphase computes at once.
+_RESAMPLE_BLOCK_LENGTH: int = 4096
+
+
+@dataclass(frozen=True)
+class MelSpectrumSettings:
+    """How the signal is framed and split into mel bands, before features are computed."""
+
+    number_of_mel_bands: int = 26
+
+    # The length of a frame, and the time between the start of two frames, in seconds.
+    frame_seconds: float = 0.025
+    hop_seconds: float = 0.010
+
+    # Highest frequency covered by the mel filters. Capped at 8 kHz by default so features
+    # from 16 kHz and 48 kHz microphones are comparable.
+    max_frequency: float = 8000.0
+
+
+def convert_pcm_to_samples(frame_data: bytes, sample_width: int) -> np.ndarray:
+    """Converts little endian signed PCM frames into float32 samples between -1 and 1.
+
+    Args:
+        - frame_data (bytes): The PCM frames, any bytes-like object (such as a memoryview).
+        - sample_width (int): The number of bytes per sample. (2 for 16 bit audio.)
+
+    Returns:
+        - np.ndarray: The samples as a one dimensional float32 array.
+    """
+
+    samples: np.ndarray = np.frombuffer(frame_data, dtype=f"<i{sample_width}")
+
+    return samples.astype(np.float32) / float(2 ** (8 * sample_width - 1))
+
+def frame_samples(samples: np.ndarray, frame_length: int, hop_length: int) -> np.ndarray:
+    """Splits the samples into overlapping frames, without copying them.
+
+    Args:
+        - samples (np.ndarray): The one dimensional samples.
+        - frame_length (int): The number of samples per frame.
+        - hop_length (int): The number of samples between the start of two frames.
+
+    Returns:
+        - np.ndarray: A read only (frames, frame_length) view, empty if there are too few samples.
+    """
+
+    if len(samples) < frame_length:
+        return np.empty((0, frame_length), dtype=samples.dtype)
+
+    return sliding_window_view(samples, frame_length)[::hop_length]
+
+def find_speech_bounds(samples: np.ndarray, sample_rate: int,
+                       trim_decibels: float) -> Tuple[int, int]:
+    """Finds where the audio is louder than the silence around it, in 10 ms steps.
+
+    Args:
+        - samples (np.ndarray): The samples, either float or integer PCM samples.
+        - sample_rate (int): The sample rate of the samples.
+        - trim_decibels (float): Steps quieter than this (in dB below the loudest step)
+        count as silence.
+
+    Returns:
+        - Tuple[int, int]: The start and end sample index of the audio without the silence.
+    """
+
+    step_length: int = max(1, sample_rate // 100)
+    steps: np.ndarray = frame_samples(samples, step_length, step_length)
+
+    if steps.size == 0:
+        return 0, len(samples)
+
+    # Summed in float64 directly from the samples, integer samples would overflow when squared.
+    step_energies: np.ndarray = 10.0 * np.log10(
+        np.einsum("ij,ij->i", steps, steps, dtype=np.float64) / step_length + 1e-12)
+    loud_steps: np.ndarray = np.flatnonzero(step_energies > step_energies.max() - trim_decibels)
+
+    return int(loud_steps[0] * step_length), int((loud_steps[-1] + 1) * step_length)
+
+def trim_silence(samples: np.ndarray, sample_rate: int, trim_decibels: float) -> np.ndarray:
+    """Trims the leading and trailing silence, in 10 ms steps.
+
+    Args:
+        - samples (np.ndarray): The float samples. (See convert_pcm_to_samples.)
+        - sample_rate (int): The sample rate of the samples.
+        - trim_decibels (float): Steps quieter than this (in dB below the loudest step)
+        are trimmed from both ends.
+
+    Returns:
+        - np.ndarray: A view of the samples without the silence around them.
+    """
+
+    start_index, end_index = find_speech_bounds(samples=samples, sample_rate=sample_rate,
+                                                trim_decibels=trim_decibels)
+
+    return samples[start_index:end_index]
+
+@lru_cache(maxsize=8)
+def _create_polyphase_filter(up_factor: int, down_factor: int,
+                             half_length: int) -> np.ndarray:
+    """Creates (and caches) a Kaiser windowed sinc low pass filter, split into its phases.
+
+    Returns:
+        - np.ndarray: The filter taps shaped (up_factor, taps per phase), row p holds
+        every up_factor-th tap starting at tap p.
+    """
+
+    max_factor: int = max(up_factor, down_factor)
+    number_of_taps: int = 2 * half_length * max_factor + 1
+
+    # The cut off is the lower of the two Nyquist frequencies, at the upsampled rate.
+    tap_positions: np.ndarray = (np.arange(number_of_taps) - number_of_taps // 2) / max_factor
+    filter_taps: np.ndarray = (np.sinc(tap_positions) * np.kaiser(number_of_taps, 5.0)
+                               * up_factor / max_factor)
+
+    taps_per_phase: int = -(-number_of_taps // up_factor)
+    filter_taps = np.pad(filter_taps, (0, taps_per_phase * up_factor - number_of_taps))
+
+    return filter_taps.reshape(taps_per_phase, up_factor).T.astype(np.float32)
+
+def _filter_block(samples: np.ndarray, filter_phases: np.ndarray,
+                  upsampled_positions: np.ndarray) -> np.ndarray:
+    """Computes the output samples at the upsampled positions, one filter phase each."""
+
+    up_factor: int = filter_phases.shape[0]
+    sample_indices: np.ndarray = ((upsampled_positions // up_factor)[:, None]
+                                  - np.arange(filter_phases.shape[1])[None, :])
+
+    # Samples before the start and after the end count as silence.
+    is_inside: np.ndarray = (sample_indices >= 0) & (sample_indices < len(samples))
+    block_samples: np.ndarray = np.where(
+        is_inside, samples[np.clip(sample_indices, 0, len(samples) - 1)], 0)
+
+    return np.einsum("ij,ij->i", block_samples.astype(np.float32),
+                     filter_phases[upsampled_positions % up_factor])
+
+def resample_polyphase(samples: np.ndarray, from_sample_rate: int, to_sample_rate: int,
+                       sample_scale: float = 1.0, half_length: int = 10) -> np.ndarray:
+    """Resamples audio with a polyphase windowed sinc filter, one block of output at a time.
+
+    - Only the output samples are computed, never the zero stuffed upsampled signal.
+    Every output sample is the dot product of the input samples around it with one phase
+    of the filter, a whole block of them is a single vector operation.
+    - The input is only read, integer samples are converted to float per block,
+    so the whole utterance is never copied.
+
+    Args:
+        - samples (np.ndarray): The one dimensional samples, float or integer PCM samples.
+        - from_sample_rate (int): The sample rate of the samples.
+        - to_sample_rate (int): The sample rate to resample to.
+        - sample_scale (float): Every sample is multiplied by this, such as
+        1 / 32768 to turn 16 bit samples into floats between -1 and 1.
+        - half_length (int): The filter length, in zero crossings on each side.
+
+    Returns:
+        - np.ndarray: The resampled float32 samples.
+    """
+
+    common_divisor: int = gcd(from_sample_rate, to_sample_rate)
+    up_factor: int = to_sample_rate // common_divisor
+    down_factor: int = from_sample_rate // common_divisor
+
+    if up_factor == down_factor or samples.size == 0:
+        return samples.astype(np.float32) * np.float32(sample_scale)
+
+    filter_phases: np.ndarray = _create_polyphase_filter(up_factor, down_factor, half_length)
+
+    # Delay of the filter at the upsampled rate, so the output is not shifted in time.
+    filter_delay: int = half_length * max(up_factor, down_factor)
+    output_length: int = -(-len(samples) * up_factor // down_factor)
+    output_samples: np.ndarray = np.empty(output_length, dtype=np.float32)
+
+    for block_start in range(0, output_length, _RESAMPLE_BLOCK_LENGTH):
+        block_end: int = min(block_start + _RESAMPLE_BLOCK_LENGTH, output_length)
+
+        output_samples[block_start:block_end] = _filter_block(
+            samples=samples, filter_phases=filter_phases,
+            upsampled_positions=np.arange(block_start, block_end) * down_factor + filter_delay)
+
+    output_samples *= np.float32(sample_scale)
+
+    return output_samples
+
+@lru_cache(maxsize=8)
+def _create_mel_filter_bank(sample_rate: int, fft_length: int, number_of_mel_bands: int,
+                            max_frequency: float) -> np.ndarray:
+    """Creates (and caches) a triangular mel filter bank of shape (bands, fft_length // 2 + 1)."""
+
+    max_frequency = min(max_frequency, sample_rate / 2)
+
+    def _hertz_to_mel(frequency: np.ndarray) -> np.ndarray:
+        return 2595.0 * np.log10(1.0 + frequency / 700.0)
+
+    def _mel_to_hertz(mel: np.ndarray) -> np.ndarray:
+        return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+    band_edges: np.ndarray = _mel_to_hertz(np.linspace(
+        0.0, _hertz_to_mel(np.array(max_frequency)), number_of_mel_bands + 2))
+    fft_frequencies: np.ndarray = np.linspace(0.0, sample_rate / 2, fft_length // 2 + 1)
+
+    lower_edges: np.ndarray = band_edges[:-2, None]
+    centers: np.ndarray = band_edges[1:-1, None]
+    upper_edges: np.ndarray = band_edges[2:, None]
+
+    rising_slopes: np.ndarray = (fft_frequencies - lower_edges) / (centers - lower_edges)
+    falling_slopes: np.ndarray = (upper_edges - fft_frequencies) / (upper_edges - centers)
+
+    return np.maximum(0.0, np.minimum(rising_slopes, falling_slopes)).astype(np.float32)
+
+@lru_cache(maxsize=8)
+def _create_dct_matrix(number_of_mel_bands: int, number_of_coefficients: int) -> np.ndarray:
+    """Creates (and caches) an orthonormal DCT-II matrix of shape (bands, coefficients)."""
+
+    band_indices: np.ndarray = np.arange(number_of_mel_bands)[:, None]
+    coefficient_indices: np.ndarray = np.arange(number_of_coefficients)[None, :]
+
+    dct_matrix: np.ndarray = np.cos(
+        np.pi / number_of_mel_bands * (band_indices + 0.5) * coefficient_indices)
+    dct_matrix *= np.sqrt(2.0 / number_of_mel_bands)
+    dct_matrix[:, 0] /= np.sqrt(2.0)
+
+    return dct_matrix.astype(np.float32)
+
+def compute_log_mel_energies(
+        samples: np.ndarray, sample_rate: int,
+        mel_spectrum_settings: MelSpectrumSettings = MelSpectrumSettings()) -> np.ndarray:
+    """Computes the log energy of every mel band, for the whole signal at once.
+
+    Args:
+        - samples (np.ndarray): The float samples. (See convert_pcm_to_samples.)
+        - sample_rate (int): The sample rate of the samples.
+        - mel_spectrum_settings (MelSpectrumSettings): The framing and the mel bands.
+
+    Returns:
+        - np.ndarray: The log energies, shaped (frames, number_of_mel_bands).
+    """
+
+    number_of_mel_bands: int = mel_spectrum_settings.number_of_mel_bands
+    frame_length: int = int(round(mel_spectrum_settings.frame_seconds * sample_rate))
+    hop_length: int = int(round(mel_spectrum_settings.hop_seconds * sample_rate))
+    fft_length: int = 1 << (frame_length - 1).bit_length()
+
+    frames: np.ndarray = frame_samples(samples, frame_length, hop_length)
+
+    if frames.size == 0:
+        return np.empty((0, number_of_mel_bands), dtype=np.float32)
+
+    windowed_frames: np.ndarray = frames * np.hamming(frame_length).astype(np.float32)
+    power_spectrum: np.ndarray = np.abs(np.fft.rfft(windowed_frames, n=fft_length)) ** 2
+
+    mel_energies: np.ndarray = power_spectrum @ _create_mel_filter_bank(
+        sample_rate, fft_length, number_of_mel_bands, mel_spectrum_settings.max_frequency).T
+
+    return np.log(mel_energies + 1e-10)
+
+def compute_mfcc(samples: np.ndarray, sample_rate: int, number_of_coefficients: int = 13,
+                 mel_spectrum_settings: MelSpectrumSettings = MelSpectrumSettings()
+                 ) -> np.ndarray:
+    """Computes cepstral mean normalized MFCC features for the whole signal at once.
+
+    Args:
+        - samples (np.ndarray): The float samples. (See convert_pcm_to_samples.)
+        - sample_rate (int): The sample rate of the samples.
+        - number_of_coefficients (int): How many coefficients to keep per frame.
+        The first coefficient (overall loudness) is dropped, it only tells how close the
+        user sat to the microphone.
+        - mel_spectrum_settings (MelSpectrumSettings): The framing and the mel bands.
+
+    Returns:
+        - np.ndarray: The features, shaped (frames, number_of_coefficients - 1).
+    """
+
+    if samples.size == 0:
+        return np.empty((0, number_of_coefficients - 1), dtype=np.float32)
+
+    # Pre-emphasis boosts the high frequencies that carry most of the consonants.
+    emphasized_samples: np.ndarray = np.empty_like(samples)
+    emphasized_samples[0:1] = samples[0:1]
+    np.subtract(samples[1:], 0.97 * samples[:-1], out=emphasized_samples[1:])
+
+    log_mel_energies: np.ndarray = compute_log_mel_energies(
+        samples=emphasized_samples, sample_rate=sample_rate,
+        mel_spectrum_settings=mel_spectrum_settings)
+
+    if log_mel_energies.size == 0:
+        return np.empty((0, number_of_coefficients - 1), dtype=np.float32)
+
+    mfcc: np.ndarray = log_mel_energies @ _create_dct_matrix(
+        mel_spectrum_settings.number_of_mel_bands, number_of_coefficients)
+    mfcc = mfcc[:, 1:]
+
+    # Cepstral mean normalization removes the constant coloring of the microphone and room.
+    return (mfcc - mfcc.mean(axis=0)).astype(np.float32)
+
+def compute_perceptual_hash(log_energies: np.ndarray, number_of_time_slices: int = 16,
+                            hash_size: int = 8) -> np.ndarray:
+    """Hashes a (frames, bands) log energy matrix into hash_size ** 2 - 1 bits.
+
+    - The frames are averaged into a fixed number of time slices, so the speaking rate does not
+    matter, then the low frequency 2D DCT coefficients of that small spectrogram are compared
+    with their median. Noise and loudness mostly change the fine detail and the average,
+    which are both left out, so similar audio gets hashes that differ in only a few bits.
+
+    Args:
+        - log_energies (np.ndarray): The log band energies, shaped (frames, bands).
+        - number_of_time_slices (int): How many time slices the frames are averaged into.
+        - hash_size (int): How many DCT coefficients to keep along each axis.
+
+    Returns:
+        - np.ndarray: The hash bits as a boolean array, empty if there are too few frames.
+    """
+
+    if len(log_energies) < number_of_time_slices:
+        return np.empty(0, dtype=bool)
+
+    slice_edges: np.ndarray = np.linspace(
+        0, len(log_energies), number_of_time_slices + 1).astype(int)
+    slice_energies: np.ndarray = np.add.reduceat(
+        log_energies, slice_edges[:-1], axis=0) / np.diff(slice_edges)[:, None]
+
+    dct_coefficients: np.ndarray = (
+        _create_dct_matrix(number_of_time_slices, hash_size).T
+        @ slice_energies
+        @ _create_dct_matrix(log_energies.shape[1], hash_size)).ravel()[1:]
+
+    # The first coefficient is the overall loudness, it is left out.
+    return dct_coefficients > np.median(dct_coefficients)
+
+def compute_dtw_distance(first_features: np.ndarray, second_features: np.ndarray) -> float:
+    """Computes the dynamic time warping distance between two feature sequences.
+
+    - The recursion is evaluated one anti-diagonal at a time, every cell on an anti-diagonal
+    only depends on the two previous anti-diagonals, so each step is a single vector operation.
+
+    Args:
+        - first_features (np.ndarray): The first sequence, shaped (frames, features).
+        - second_features (np.ndarray): The second sequence, shaped (frames, features).
+
+    Returns:
+        - float: The accumulated distance divided by the combined length of both sequences,
+        so long and short phrases are comparable. Infinite if a sequence is empty.
+    """
+
+    first_length: int = len(first_features)
+    second_length: int = len(second_features)
+
+    if not first_length or not second_length:
+        return float("inf")
+
+    # Pairwise euclidean distances, (a - b)^2 = a^2 + b^2 - 2ab.
+    squared_distances: np.ndarray = (
+        np.sum(first_features ** 2, axis=1)[:, None]
+        + np.sum(second_features ** 2, axis=1)[None, :]
+        - 2.0 * first_features @ second_features.T)
+    local_costs: np.ndarray = np.sqrt(np.maximum(squared_distances, 0.0))
+
+    accumulated_costs: np.ndarray = np.full((first_length + 1, second_length + 1), np.inf)
+    accumulated_costs[0, 0] = 0.0
+
+    for diagonal in range(2, first_length + second_length + 1):
+        rows: np.ndarray = np.arange(max(1, diagonal - second_length),
+                                     min(first_length, diagonal - 1) + 1)
+        columns: np.ndarray = diagonal - rows
+
+        accumulated_costs[rows, columns] = local_costs[rows - 1, columns - 1] + np.minimum(
+            np.minimum(accumulated_costs[rows - 1, columns], accumulated_costs[rows, columns - 1]),
+            accumulated_costs[rows - 1, columns - 1])
+
+    return float(accumulated_costs[first_length, second_length] / (first_length + second_length))
@@ -0,0 +1,133 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+command_grammar.py:
+===================
+This file contains the functions that know Julie's command grammar, and pick the transcript
+that fits it best out of a recognizer's alternatives.
+
+Overview:
+=========
+- The grammar is the wake words, the self describe and exit phrases of wake_words.py,
+and "open <app>" or "go to <app>" for every installed application.
+- Recognizers often hear "hey julie" as their second or third guess, behind "hey julia".
+Picking a lower ranked alternative that is a command saves the user from repeating it.
+Mission control knows the call signs.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include internal typings.
+from typing import FrozenSet, List, Tuple
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.log_handler.log_handler import LogHandler
+from src.app.utility.data._module.wake_words import\
+    (wake_words_to_activate_julie, wake_words_to_exit_program, wake_words_to_self_describe, )
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# The fixed phrases, and the prefixes of the application commands.
+_FIXED_PHRASES: FrozenSet[str] = frozenset(
+    wake_words_to_activate_julie + wake_words_to_self_describe + wake_words_to_exit_program)
+_APPLICATION_COMMAND_PREFIXES: Tuple[str, ...] = ("open ", "go to ")
+
+# Only this many of the best alternatives are considered.
+_MAX_RESCORED_ALTERNATIVES: int = 5
+
+# A top alternative the recognizer is at least this confident about is never replaced.
+_MAX_REPLACED_CONFIDENCE: float = 0.9
+
+
+def normalize_query(query: str) -> str:
+    """Lower case the query, and drop the punctuation recognizers add around it.
+
+    Args:
+        - query (str): The recognized query.
+
+    Returns:
+        - str: The normalized query.
+    """
+
+    return " ".join(query.lower().strip(" .,!?").split())
+
+def is_command_query(query: str) -> bool:
+    """Check if a query is one of the commands of the grammar.
+
+    Args:
+        - query (str): The normalized voice query.
+
+    Returns:
+        - bool: True if the query is a fixed phrase or opens an installed application.
+    """
+
+    if query in _FIXED_PHRASES:
+        return True
+
+    for prefix in _APPLICATION_COMMAND_PREFIXES:
+        if query.startswith(prefix):
+            # AppOpener is only imported once a query could be an application command.
+            # pylint: disable=import-outside-toplevel
+            from src.app.utility.helper._module.app_opener.app_opener import\
+                is_installed_application
+
+            return is_installed_application(application_name=query[len(prefix):])
+
+    return False
+
+def select_transcript(alternatives: List[Tuple[str, float]]) -> str:
+    """Pick the transcript out of the recognizer's alternatives, preferring the commands.
+
+    - The top alternative is kept if it is a command, or if the recognizer is very sure of it.
+    - Otherwise the best ranked alternative that is a command wins.
+    - Otherwise the top alternative is kept, it is an open question for the AI.
+
+    Args:
+        - alternatives (List[Tuple[str, float]]): The transcripts, best first, with their
+        confidence. A confidence of 0.0 means the recognizer did not tell.
+
+    Returns:
+        - str: The selected transcript, empty if there are no alternatives.
+    """
+
+    if not alternatives:
+        return ""
+
+    top_transcript, top_confidence = alternatives[0]
+
+    if (is_command_query(normalize_query(top_transcript))
+            or top_confidence >= _MAX_REPLACED_CONFIDENCE):
+        return top_transcript
+
+    for rank, (transcript, _) in enumerate(alternatives[1:_MAX_RESCORED_ALTERNATIVES], start=2):
+        if is_command_query(normalize_query(transcript)):
+            # Instantiate LogHandler.
+            log_handler: LogHandler = LogHandler()
+            log_handler.create_log(
+                log_type="info",
+                log_message=(f"Alternative {rank} \"{transcript}\" is a command, "
+                             f"it replaces \"{top_transcript}\"."))
+
+            return transcript
+
+    return top_transcript
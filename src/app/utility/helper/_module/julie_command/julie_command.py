@@ -0,0 +1,79 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+julie_command.py:
+=================
+This file contains the functions that handle Julie's own commands: describing herself,
+stopping the running commands and exiting.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+import sys
+
+# Include internal typings.
+from typing import Any, Dict
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.data._module.prompt_phrases import EXIT_ANNOUNCEMENT
+
+
+def describe_julie(_slots: Dict[str, str], _text_to_speech_handler: Any) -> str:
+    """Tell the user who Julie is.
+
+    Returns:
+        - str: Julie's introduction.
+    """
+
+    return ("I'm Julie, a desktop assistant created by Reginald Chand!"
+            "He created me as a personal project.")
+
+def stop_commands(_slots: Dict[str, str], _text_to_speech_handler: Any) -> str:
+    """Cancel every running and pending command, such as Gemini still thinking.
+
+    Returns:
+        - str: What Julie says about it.
+    """
+
+    if SERVICE_LOADER.get_service("command_executor").cancel_commands():
+        return "Okay, stopped."
+
+    return "There is nothing to stop."
+
+def exit_program(_slots: Dict[str, str], text_to_speech_handler: Any) -> None:
+    """Say goodbye and exit.
+
+    Args:
+        - text_to_speech_handler (Any): The text_to_speech_handler object to be used for
+        speaking text.
+
+    Returns:
+        - None.
+    """
+
+    text_to_speech_handler.create_text_to_speech(
+        text_to_produce_speech=EXIT_ANNOUNCEMENT)
+    sys.exit(0)
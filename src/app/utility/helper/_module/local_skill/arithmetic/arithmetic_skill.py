@@ -0,0 +1,210 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+arithmetic_skill.py:
+====================
+This file contains the local skill that calculates, such as "what is 12 times 7".
+
+Overview:
+=========
+- The spoken operators ("times", "divided by", "to the power of") are replaced by Python's,
+and the expression is parsed with ast. Only numbers, + - * / // % ** and parentheses are
+evaluated, anything else (names, calls, attributes) is not an expression this skill answers.
+- Exponents are bounded, so "9 to the power of 9 to the power of 9" cannot hang Julie.
+Rocket science, minus the rocket.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+import ast
+import math
+import operator
+import re
+
+# Include internal typings.
+from typing import Any, Callable, Dict, Tuple
+
+# Include custom packages and modules.
+from src.app.utility.helper._module.local_skill.local_skill import format_number
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# The spoken operators, longest first, and what they are in Python.
+_SPOKEN_OPERATORS: Tuple[Tuple[str, str], ...] = (
+    ("to the power of", "**"), ("multiplied by", "*"), ("divided by", "/"), ("squared", "**2"),
+    ("cubed", "**3"), ("modulo", "%"), ("times", "*"), ("plus", "+"), ("minus", "-"),
+    ("over", "/"), ("mod", "%"), ("x", "*"), ("×", "*"), ("÷", "/"), ("^", "**"),
+)
+
+# The operators that may be evaluated.
+_BINARY_OPERATORS: Dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.FloorDiv: operator.floordiv, ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+_UNARY_OPERATORS: Dict[type, Callable[[Any], Any]] = {
+    ast.UAdd: operator.pos, ast.USub: operator.neg,
+}
+
+# Larger exponents are refused, the result would not be worth speaking anyway.
+# Negative exponents only make the result smaller, they are not limited.
+_MAX_EXPONENT: int = 100
+
+# Powers estimated to have more digits are refused before they are computed,
+# ((9 ** 100) ** 100) ** 100 would otherwise build a bignum of megabytes.
+# This also refuses 0.5 ** -10000, tiny results such as 2 ** -1000 are allowed.
+_MAX_POWER_DIGITS: int = 400
+
+# Larger results are refused too, nobody wants to hear all their digits.
+_MAX_SPOKEN_RESULT: float = 1e15
+
+
+def _convert_spoken_expression(expression: str) -> str:
+    """Replace the spoken operators of an expression with Python's, and drop digit commas."""
+
+    expression = re.sub(r"(?<=\d),(?=\d{3})", "", expression.lower())
+
+    for spoken_operator, python_operator in _SPOKEN_OPERATORS:
+        pattern: str = (rf"(?<![a-z]){re.escape(spoken_operator)}(?![a-z])"
+                        if spoken_operator[0].isalpha() else re.escape(spoken_operator))
+        expression = re.sub(pattern, f" {python_operator} ", expression)
+
+    return expression
+
+def _parse_expression(expression: str) -> (ast.Expression | None):
+    """Parse a spoken expression, None unless it only has numbers and allowed operators."""
+
+    try:
+        expression_tree: ast.Expression = ast.parse(_convert_spoken_expression(expression),
+                                                    mode="eval")
+
+    except (SyntaxError, ValueError):
+        return None
+
+    has_operator: bool = False
+
+    for node in ast.walk(expression_tree.body):
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            has_operator = True
+
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            has_operator = True
+
+        elif not (isinstance(node, ast.Constant) and type(node.value) in (int, float)
+                  or isinstance(node, (ast.operator, ast.unaryop))):
+            return None
+
+    return expression_tree if has_operator else None
+
+def _evaluate_node(node: ast.AST) -> float:
+    """Evaluate a node of a parsed expression, only the allowed node types reach here."""
+
+    if isinstance(node, ast.Constant):
+        return node.value
+
+    if isinstance(node, ast.UnaryOp):
+        return _UNARY_OPERATORS[type(node.op)](_evaluate_node(node.operand))
+
+    left_operand: float = _evaluate_node(node.left) # type: ignore
+    right_operand: float = _evaluate_node(node.right) # type: ignore
+
+    if isinstance(node.op, ast.Pow): # type: ignore
+        if right_operand > _MAX_EXPONENT:
+            raise OverflowError("Alert: The exponent is too large.")
+
+        if (left_operand != 0
+                and math.log10(abs(left_operand)) * right_operand > _MAX_POWER_DIGITS):
+            raise OverflowError("Alert: The power is too large.")
+
+    result: Any = _BINARY_OPERATORS[type(node.op)](left_operand, right_operand) # type: ignore
+
+    # A fractional power of a negative number, such as (-8) ** 0.5, is complex.
+    if isinstance(result, complex):
+        raise ValueError("Alert: The result is not a real number.")
+
+    # Float constants can still overflow to infinity (1e308 times 10), and inf minus inf is nan.
+    if not math.isfinite(result):
+        raise ArithmeticError("Alert: The result is not a finite number.")
+
+    return result
+
+def evaluate_arithmetic(expression: str) -> (float | None):
+    """Evaluate a spoken arithmetic expression safely.
+
+    Args:
+        - expression (str): The expression, such as: 12 times 7 or (3 + 4) / 2.
+
+    Returns:
+        - float | None: The result, None if it is not an arithmetic expression.
+
+    Raises:
+        - ZeroDivisionError: if the expression divides by zero.
+        - OverflowError: if the result or an exponent is too large.
+        - ValueError: if the result is not a real number.
+        - ArithmeticError: if the result is infinite or not a number.
+    """
+
+    expression_tree: (ast.Expression | None) = _parse_expression(expression)
+
+    if expression_tree is None:
+        return None
+
+    return _evaluate_node(expression_tree.body)
+
+def is_arithmetic_expression(expression: str) -> bool:
+    """Check if a spoken expression can be evaluated by evaluate_arithmetic.
+
+    Args:
+        - expression (str): The expression.
+
+    Returns:
+        - bool: True if it only has numbers and allowed operators, and at least one operator.
+    """
+
+    return _parse_expression(expression) is not None
+
+def calculate(slots: Dict[str, str], _text_to_speech_handler: Any) -> str:
+    """Calculate the expression slot, such as: 12 times 7 is 84."""
+
+    expression: str = slots["expression"]
+
+    try:
+        result: (float | None) = evaluate_arithmetic(expression)
+
+        if abs(result) >= _MAX_SPOKEN_RESULT: # type: ignore
+            raise OverflowError("Alert: The result is too large.")
+
+    except ZeroDivisionError:
+        return "Dividing by zero is not defined."
+
+    except OverflowError:
+        return "That number is too big for me to say."
+
+    except ValueError:
+        return "That is not a real number."
+
+    except ArithmeticError:
+        return "I can't calculate that."
+
+    return f"{expression} is {format_number(result)}." # type: ignore
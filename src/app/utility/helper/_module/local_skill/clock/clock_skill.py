@@ -0,0 +1,49 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+clock_skill.py:
+===============
+This file contains the local skills that tell the time and the date.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+from datetime import datetime
+
+# Include internal typings.
+from typing import Any, Dict
+
+
+def tell_time(_slots: Dict[str, str], _text_to_speech_handler: Any) -> str:
+    """Tell the current time, such as: It's 3:05 PM."""
+
+    return f"It's {datetime.now().strftime('%I:%M %p').lstrip('0')}."
+
+def tell_date(_slots: Dict[str, str], _text_to_speech_handler: Any) -> str:
+    """Tell today's date, such as: Today is Saturday, October 17, 2026."""
+
+    today: datetime = datetime.now()
+
+    return f"Today is {today.strftime('%A, %B')} {today.day}, {today.year}."
@@ -0,0 +1,53 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+local_skill.py:
+===============
+This file contains the helpers shared by the local skills.
+
+Overview:
+=========
+- A local skill answers a query on this machine, such as the time or "what is 12 times 7",
+instead of sending it to Gemini. The skills are plugins, their phrases are declared in
+plugin_catalogue.py and their modules are only imported once they are used.
+Why call the mothership for what the onboard computer knows.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+
+def format_number(number: float) -> str:
+    """Format a number the way it is spoken, without trailing zeros.
+
+    Args:
+        - number (float): The number.
+
+    Returns:
+        - str: The number, such as: 84, 2.5 or 0.3333.
+    """
+
+    if float(number).is_integer() and abs(number) < 1e15:
+        return str(int(number))
+
+    return f"{number:.4g}" if abs(number) < 1 else f"{number:,.2f}".rstrip("0").rstrip(".")
@@ -0,0 +1,129 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+timer_skill.py:
+===============
+This file contains the local skill that sets timers, such as "set a timer for 5 minutes".
+
+Overview:
+=========
+- Every timer runs on its own daemon thread, Julie keeps listening while it counts down.
+- When it goes off, a desktop notification is shown and Julie says so.
+T minus five minutes and counting.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+import re
+from threading import Timer
+
+# Include internal typings.
+from typing import Any, Dict
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.notification_handler.notification_handler\
+    import NotificationHandler
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# Unit name => seconds.
+_DURATION_UNITS: Dict[str, float] = {
+    **dict.fromkeys(("second", "seconds", "sec", "secs"), 1.0),
+    **dict.fromkeys(("minute", "minutes", "min", "mins"), 60.0),
+    **dict.fromkeys(("hour", "hours", "hr", "hrs"), 3600.0),
+}
+
+# "5 minutes", "1 hour and 30 minutes", "an hour", "2.5 minutes".
+_DURATION_PART_PATTERN: re.Pattern = re.compile(
+    r"(\d+(?:\.\d+)?|an?|one)\s*(" + "|".join(_DURATION_UNITS) + r")(?![a-z])")
+_DURATION_SEPARATOR_PATTERN: re.Pattern = re.compile(r"^(?:\s|,|and)*$")
+
+# Timers longer than a day are not timers, they are reminders.
+_MAX_TIMER_SECONDS: float = 24 * 3600.0
+
+
+def parse_duration(duration: str) -> (float | None):
+    """Parse a spoken duration.
+
+    Args:
+        - duration (str): The duration, such as: 1 hour and 30 minutes.
+
+    Returns:
+        - float | None: The duration in seconds, None if it is not a duration a timer can run.
+    """
+
+    duration = duration.lower().strip()
+    seconds: float = 0.0
+    parsed_length: int = 0
+
+    for duration_match in _DURATION_PART_PATTERN.finditer(duration):
+        if not _DURATION_SEPARATOR_PATTERN.match(duration[parsed_length:duration_match.start()]):
+            return None
+
+        spoken_value, unit = duration_match.groups()
+        seconds += ((1.0 if spoken_value in ("a", "an", "one") else float(spoken_value))
+                    * _DURATION_UNITS[unit])
+        parsed_length = duration_match.end()
+
+    if not parsed_length or duration[parsed_length:].strip():
+        return None
+
+    return seconds if 0 < seconds <= _MAX_TIMER_SECONDS else None
+
+def is_timer_duration(duration: str) -> bool:
+    """Check if a spoken duration can be parsed by parse_duration.
+
+    Args:
+        - duration (str): The duration.
+
+    Returns:
+        - bool: True if a timer can run for it.
+    """
+
+    return parse_duration(duration) is not None
+
+def _announce_timer_done(duration: str, text_to_speech_handler: Any) -> None:
+    """Notify the user that the timer of the given duration has gone off."""
+
+    NotificationHandler.create_notification(title="Timer",
+                                            message=f"Your {duration} timer is done!",
+                                            app_name="Julie",
+                                            timeout=10)
+
+    text_to_speech_handler.create_text_to_speech(
+        text_to_produce_speech=f"Your {duration} timer is done!")
+
+def set_timer(slots: Dict[str, str], text_to_speech_handler: Any) -> str:
+    """Start a timer for the duration slot, such as: Timer set for 5 minutes."""
+
+    duration: str = slots["duration"]
+    seconds: float = parse_duration(duration) # type: ignore
+
+    timer: Timer = Timer(seconds, _announce_timer_done,
+                         kwargs={"duration": duration,
+                                 "text_to_speech_handler": text_to_speech_handler})
+    timer.daemon = True
+    timer.start()
+
+    return f"Timer set for {duration}."
@@ -0,0 +1,130 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+unit_conversion_skill.py:
+=========================
+This file contains the local skill that converts units, such as "convert 5 miles to kilometers".
+
+Overview:
+=========
+- Every unit is converted to its dimension's base unit as value * scale + offset,
+the offset only matters for the temperatures.
+- Units of different dimensions (miles to kilograms) are not a conversion this skill answers.
+Light years are a distance, not a time. Mind the units before launch.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+import re
+
+# Include internal typings.
+from typing import Any, Dict, Tuple
+
+# Include custom packages and modules.
+from src.app.utility.helper._module.local_skill.local_skill import format_number
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# Unit name => (dimension, scale, offset) to the base unit (meter, kilogram, kelvin, liter).
+_UNITS: Dict[str, Tuple[str, float, float]] = {
+    **dict.fromkeys(("millimeter", "millimeters", "mm"), ("length", 0.001, 0.0)),
+    **dict.fromkeys(("centimeter", "centimeters", "cm"), ("length", 0.01, 0.0)),
+    **dict.fromkeys(("meter", "meters", "metre", "metres", "m"), ("length", 1.0, 0.0)),
+    **dict.fromkeys(("kilometer", "kilometers", "kilometre", "kilometres", "km"),
+                    ("length", 1000.0, 0.0)),
+    **dict.fromkeys(("inch", "inches", "in"), ("length", 0.0254, 0.0)),
+    **dict.fromkeys(("foot", "feet", "ft"), ("length", 0.3048, 0.0)),
+    **dict.fromkeys(("yard", "yards", "yd"), ("length", 0.9144, 0.0)),
+    **dict.fromkeys(("mile", "miles", "mi"), ("length", 1609.344, 0.0)),
+    **dict.fromkeys(("gram", "grams", "g"), ("mass", 0.001, 0.0)),
+    **dict.fromkeys(("kilogram", "kilograms", "kg", "kilo", "kilos"), ("mass", 1.0, 0.0)),
+    **dict.fromkeys(("ounce", "ounces", "oz"), ("mass", 0.028349523125, 0.0)),
+    **dict.fromkeys(("pound", "pounds", "lb", "lbs"), ("mass", 0.45359237, 0.0)),
+    **dict.fromkeys(("milliliter", "milliliters", "ml"), ("volume", 0.001, 0.0)),
+    **dict.fromkeys(("liter", "liters", "litre", "litres", "l"), ("volume", 1.0, 0.0)),
+    **dict.fromkeys(("cup", "cups"), ("volume", 0.2365882365, 0.0)),
+    **dict.fromkeys(("gallon", "gallons"), ("volume", 3.785411784, 0.0)),
+    **dict.fromkeys(("kelvin",), ("temperature", 1.0, 0.0)),
+    **dict.fromkeys(("celsius", "degrees celsius", "centigrade"),
+                    ("temperature", 1.0, 273.15)),
+    **dict.fromkeys(("fahrenheit", "degrees fahrenheit"),
+                    ("temperature", 5.0 / 9.0, 273.15 - 32.0 * 5.0 / 9.0)),
+}
+
+# "5 miles to kilometers", "1.5 kg in pounds", "a mile into meters".
+_CONVERSION_PATTERN: re.Pattern = re.compile(
+    r"^(-?\d[\d,]*(?:\.\d+)?|an?|one)\s+(.+?)\s+(?:to|in|into)\s+(.+?)$")
+
+
+def parse_conversion(conversion: str) -> (Tuple[float, str, str] | None):
+    """Parse a spoken unit conversion.
+
+    Args:
+        - conversion (str): The conversion, such as: 5 miles to kilometers.
+
+    Returns:
+        - Tuple[float, str, str] | None: The value, its unit and the target unit,
+        None if it is not a conversion between known units of the same dimension.
+    """
+
+    conversion_match: (re.Match | None) = _CONVERSION_PATTERN.match(conversion.lower().strip())
+
+    if conversion_match is None:
+        return None
+
+    spoken_value, from_unit, to_unit = conversion_match.groups()
+
+    if from_unit not in _UNITS or to_unit not in _UNITS:
+        return None
+
+    if _UNITS[from_unit][0] != _UNITS[to_unit][0]:
+        return None
+
+    value: float = (1.0 if spoken_value in ("a", "an", "one")
+                    else float(spoken_value.replace(",", "")))
+
+    return value, from_unit, to_unit
+
+def is_unit_conversion(conversion: str) -> bool:
+    """Check if a spoken unit conversion can be parsed by parse_conversion.
+
+    Args:
+        - conversion (str): The conversion.
+
+    Returns:
+        - bool: True if it converts between known units of the same dimension.
+    """
+
+    return parse_conversion(conversion) is not None
+
+def convert_units(slots: Dict[str, str], _text_to_speech_handler: Any) -> str:
+    """Convert the conversion slot, such as: 5 miles is 8.05 kilometers."""
+
+    value, from_unit, to_unit = parse_conversion(slots["conversion"]) # type: ignore
+
+    _, from_scale, from_offset = _UNITS[from_unit]
+    _, to_scale, to_offset = _UNITS[to_unit]
+    converted_value: float = (value * from_scale + from_offset - to_offset) / to_scale
+
+    return f"{format_number(value)} {from_unit} is {format_number(converted_value)} {to_unit}."
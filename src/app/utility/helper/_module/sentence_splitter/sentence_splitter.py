@@ -0,0 +1,98 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+sentence_splitter.py:
+=====================
+This file contains a function that splits a text into the sentences (and clauses) it is spoken in,
+so a long answer can be synthesized one sentence at a time.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include built-in packages and modules.
+import re
+
+# Include internal typings.
+from typing import FrozenSet, List, Pattern
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# A sentence ends at ., ! or ? (and any closing quotes) followed by a space, or at a line break.
+_SENTENCE_END_PATTERN: Pattern[str] = re.compile(
+    r"(?<=[.!?])\s+|(?<=[.!?][\"')\]])\s+|\s*\n+\s*")
+
+# A sentence longer than this is split after its commas, semicolons and colons too.
+_MAX_SENTENCE_CHARACTERS: int = 200
+_CLAUSE_END_PATTERN: Pattern[str] = re.compile(r"(?<=[,;:])\s+")
+
+# Words whose trailing full stop does not end a sentence.
+_ABBREVIATIONS: FrozenSet[str] = frozenset(
+    ("mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "vs.", "etc.", "e.g.", "i.e.", "approx.", "no."))
+
+
+def split_into_sentences(text: str, max_sentence_characters: int = _MAX_SENTENCE_CHARACTERS
+                         ) -> List[str]:
+    """Split a text into the sentences it is spoken in, in order.
+
+    Args:
+        - text (str): The text to split, such as an answer of Gemini.
+        - max_sentence_characters (int): Longer sentences are split into their clauses.
+
+    Returns:
+        - List[str]: The non empty sentences (or clauses), in the order they are spoken.
+    """
+
+    sentences: List[str] = []
+
+    for fragment in _SENTENCE_END_PATTERN.split(text.strip()):
+        if not fragment.strip():
+            continue
+
+        # "Dr. Smith" is one sentence, glue it back to the previous fragment.
+        if sentences and sentences[-1].split()[-1].lower() in _ABBREVIATIONS:
+            sentences[-1] = f"{sentences[-1]} {fragment.strip()}"
+
+        else:
+            sentences.append(fragment.strip())
+
+    spoken_sentences: List[str] = []
+
+    for sentence in sentences:
+        if len(sentence) <= max_sentence_characters:
+            spoken_sentences.append(sentence)
+            continue
+
+        clause: str = ""
+
+        # Clauses are merged back until they are long enough to be worth a render of their own.
+        for fragment in _CLAUSE_END_PATTERN.split(sentence):
+            clause = f"{clause} {fragment}".strip()
+
+            if len(clause) >= max_sentence_characters // 2:
+                spoken_sentences.append(clause)
+                clause = ""
+
+        if clause:
+            spoken_sentences.append(clause)
+
+    return spoken_sentences
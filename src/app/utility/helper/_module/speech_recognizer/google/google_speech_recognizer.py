@@ -30,11 +30,104 @@ Refer to the module documentation for details.
 """
 
 # Include internal typings.
-from typing import Any
+from typing import Any, Callable, List, Tuple
 
 # Include external packages and modules.
 from speech_recognition import AudioData, UnknownValueError, RequestError # type: ignore
 
+# Include custom packages and modules.
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.handler._class.recognition_worker_pool.recognition_worker_pool\
+    import RecognitionWorkerPool
+from src.app.utility.helper._module.command_grammar.command_grammar import select_transcript
+from src.app.utility.data._module.prompt_phrases import\
+    (CONNECTION_APOLOGY, NOT_UNDERSTOOD_APOLOGY, )
+
+
+def transcribe_google_audio(recognizer: Any, audio: AudioData) -> str:
+    """Recognizes speech using Google Speech Recognition, without announcing anything.
+
+    It only touches its arguments, so it can run in a recognition worker process.
+
+    Args:
+        - recognizer (Any): The recognizer object used for speech recognition.
+        - audio (AudioData): The audio input to be recognized.
+
+    Returns:
+        - str: The recognized voice input as a string.
+
+    Raises:
+        - UnknownValueError: if query is empty or not understood.
+        - RequestError: if the user is offline.
+    """
+
+    return recognizer.recognize_google(audio)
+
+def transcribe_google_alternatives(recognizer: Any, audio: AudioData) -> List[Tuple[str, float]]:
+    """Recognizes speech using Google Speech Recognition, keeping every alternative.
+
+    It only touches its arguments, so it can run in a recognition worker process.
+
+    Args:
+        - recognizer (Any): The recognizer object used for speech recognition.
+        - audio (AudioData): The audio input to be recognized.
+
+    Returns:
+        - List[Tuple[str, float]]: The transcripts, best first, with their confidence.
+        Google usually only rates the best one, the others get 0.0. Empty if nothing was heard.
+
+    Raises:
+        - RequestError: if the user is offline.
+    """
+
+    recognition_result: Any = recognizer.recognize_google(audio, show_all=True)
+
+    if not isinstance(recognition_result, dict):
+        return []
+
+    return [(alternative["transcript"], float(alternative.get("confidence", 0.0)))
+            for alternative in recognition_result.get("alternative", [])
+            if alternative.get("transcript", "").strip()]
+
+def recognize_or_apologize(recognize_query: Callable[[], str],
+                           text_to_speech_handler: Any,
+                           should_announce_error_message: bool,
+                           request_error_message: str,
+                           should_always_announce_request_error: bool = False) -> str:
+    """Run a recognition, and apologize to the user if it fails.
+
+    Args:
+        - recognize_query (Callable[[], str]): Recognizes the query, it may raise the
+        UnknownValueError and RequestError of the SpeechRecognition library.
+        - text_to_speech_handler (Any): The handler for converting text to speech.
+        - should_announce_error_message (bool): To control the flow of error messages.
+        - request_error_message (str): The apology for a recognizer that cannot be reached.
+        - should_always_announce_request_error (bool): Apologize for a recognizer that cannot
+        be reached even if the error messages are not announced.
+
+    Returns:
+        - str: The recognized voice input as a string, empty if it failed.
+    """
+
+    _query: str = ""
+
+    try:
+        _query = recognize_query()
+
+        if not _query:
+            raise UnknownValueError()
+
+    except UnknownValueError:
+        if should_announce_error_message:
+            text_to_speech_handler.create_text_to_speech(
+                text_to_produce_speech=NOT_UNDERSTOOD_APOLOGY)
+
+    except RequestError:
+        if should_announce_error_message or should_always_announce_request_error:
+            text_to_speech_handler.create_text_to_speech(
+                text_to_produce_speech=request_error_message)
+
+    return _query
 
 def google_speech_recognizer(recognizer: Any,
                              audio: AudioData,
@@ -58,28 +151,21 @@ def google_speech_recognizer(recognizer: Any,
     Note:
         - The function uses the `recognizer` object to recognize speech from the `audio` input.
         - Audio input comes from the `SpeechRecognition` library.
+        - The FLAC encoding and the request run in a recognition worker process.
+        - Every alternative is requested, a lower ranked one that is a command
+        (such as "hey julie" behind "hey julia") is preferred over asking the user again.
     """
 
-    _unknown_value_error_message: str = (
-        "Sorry, I didn't catch that. Could you please rephrase or clarify your question?\n")
-
-    _request_error_message: str = (
-        "Oops! It seems there's an issue with your connection.\n"
-        "Please check your internet settings and try again for voice "
-        "recognition to work smoothly.\n")
-
-    _query: str = ""
-
-    try:
-        _query = recognizer.recognize_google(audio)
+    def recognize_query() -> str:
+        recognition_worker_pool: RecognitionWorkerPool = SERVICE_LOADER.get_service(
+            "recognition_worker_pool")
 
-    except UnknownValueError:
-        if should_announce_error_message:
-            text_to_speech_handler.create_text_to_speech(
-                text_to_produce_speech=_unknown_value_error_message)
+        return select_transcript(alternatives=recognition_worker_pool.recognize(
+            recognize_audio=transcribe_google_alternatives, recognizer=recognizer, audio=audio))
 
-    except RequestError:
-        text_to_speech_handler.create_text_to_speech(
-            text_to_produce_speech=_request_error_message)
-
-    return _query
+    # The user is always told that they are offline.
+    return recognize_or_apologize(recognize_query=recognize_query,
+                                  text_to_speech_handler=text_to_speech_handler,
+                                  should_announce_error_message=should_announce_error_message,
+                                  request_error_message=CONNECTION_APOLOGY,
+                                  should_always_announce_request_error=True)
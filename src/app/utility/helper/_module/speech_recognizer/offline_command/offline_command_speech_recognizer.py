@@ -0,0 +1,126 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+offline_command_speech_recognizer.py:
+=====================================
+This file contains a function that recognizes the fixed commands offline, in milliseconds,
+and only falls back to Google Speech Recognition for everything else.
+
+Overview:
+=========
+- The fixed commands are the phrases in wake_words.py, plus "open <app>" and "go to <app>"
+for every installed application.
+- Commands are matched with the KeywordSpotter (MFCC features and DTW template matching).
+- Every time Google recognizes one of the fixed commands, the utterance is enrolled as a
+template for it, so Julie learns to recognize the user's own commands offline.
+A command is only answered offline once it has a few templates to compare against,
+and only if it is clearly closer than every other enrolled command.
+- The exit phrases are never answered offline, a near miss must not close Julie.
+Google confirms them.
+- Opt-in, with --offline-commands.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+"""
+
+# Include internal typings.
+from typing import Any, FrozenSet, Tuple
+
+# Include external packages and modules.
+import numpy as np
+from speech_recognition import AudioData # type: ignore
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.keyword_spotter.keyword_spotter import KeywordSpotter
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.helper._module.command_grammar.command_grammar import\
+    (is_command_query, normalize_query, )
+from src.app.utility.data._module.wake_words import wake_words_to_exit_program
+from src.app.utility.helper._module.speech_recognizer.google.google_speech_recognizer\
+    import google_speech_recognizer
+
+# * GLOBAL VARIABLES ! (USE WITH CARE)
+# A command is only answered offline once it has at least this many templates.
+_MIN_TEMPLATES_TO_ANSWER_OFFLINE: int = 4
+
+# Every other command must be at least this many times farther away than the matched one.
+_MIN_MARGIN_RATIO_TO_ANSWER_OFFLINE: float = 1.25
+
+# Commands that are only ever answered by Google.
+_CLOUD_CONFIRMED_COMMANDS: FrozenSet[str] = frozenset(
+    normalize_query(query=phrase) for phrase in wake_words_to_exit_program)
+
+# The command templates are only loaded the first time a command is recognized.
+SERVICE_LOADER.register_service(
+    "offline_command_keyword_spotter",
+    lambda: KeywordSpotter(_templates_file_name="command_templates.npz"))
+
+
+def offline_command_speech_recognizer(recognizer: Any,
+                                      audio: AudioData,
+                                      text_to_speech_handler: Any,
+                                      should_announce_error_message: bool) -> str:
+    """Recognizes the fixed commands offline, and everything else with Google.
+
+    Args:
+        - recognizer (Any): The recognizer object used for speech recognition.
+        - audio (Any): The audio input to be recognized.
+        - text_to_speech_handler (Any): The handler for converting text to speech.
+        - should_announce_error_message (str): To control the flow of error messages.
+
+    Returns:
+        - str: The recognized voice input as a string.
+    """
+
+    keyword_spotter: KeywordSpotter = SERVICE_LOADER.get_service(
+        "offline_command_keyword_spotter")
+
+    features: np.ndarray = keyword_spotter.compute_features(frame_data=audio.frame_data,
+                                                            sample_rate=audio.sample_rate,
+                                                            sample_width=audio.sample_width)
+
+    offline_commands: Tuple[str, ...] = tuple(
+        command for command, template_count in keyword_spotter.get_template_counts().items()
+        if (template_count >= _MIN_TEMPLATES_TO_ANSWER_OFFLINE
+            and command not in _CLOUD_CONFIRMED_COMMANDS))
+
+    if offline_commands:
+        matched_command, _ = keyword_spotter.match_features(
+            features=features,
+            labels=offline_commands,
+            min_margin_ratio=_MIN_MARGIN_RATIO_TO_ANSWER_OFFLINE)
+
+        if matched_command:
+            return matched_command
+
+    query: str = google_speech_recognizer(
+        recognizer=recognizer,
+        audio=audio,
+        text_to_speech_handler=text_to_speech_handler,
+        should_announce_error_message=should_announce_error_message)
+
+    # Learn the command, so the next time it is recognized offline.
+    if is_command_query(query=normalize_query(query=query)):
+        keyword_spotter.enroll_features(label=normalize_query(query=query), features=features)
+
+    return query
@@ -0,0 +1,102 @@
+"""
+Fun Fact:
+=========
+This software is based on a space theme.
+All the functions, variables, and class names used are meaningful and follows a space theme.
+This codebase will consist of comments based on humors at minimum to cheer up other developers.
+
+sphinx_speech_recognizer.py:
+============================
+This file contains a function that recognizes speech offline using CMU Sphinx.
+It is less accurate than Google Speech Recognition, but it never waits on the network,
+which makes it a useful local backend to hedge the cloud recognizer with.
+
+Guidelines:
+===========
+Import Statement Guidelines:
+============================
+Absolute imports are preferred over relative imports for better clarity and consistency.
+Built-in Python modules appear first, followed by internal types with a one-line gap,
+then external modules and external types, and finally custom modules.
+
+Usage Notes:
+============
+Ensure to follow PEP 8 guidelines for import statements.
+Use absolute imports to avoid potential naming conflicts.
+Keep the import section organized for better readability and maintenance.
+
+Dependencies:
+=============
+Some modules may have dependencies on external libraries.
+Refer to the module documentation for details.
+- This recognizer needs the optional pocketsphinx package. (pip install pocketsphinx)
+"""
+
+# Include internal typings.
+from typing import Any
+
+# Include external packages and modules.
+from speech_recognition import AudioData # type: ignore
+
+# Include custom packages and modules.
+from src.app.utility.handler._class.service_loader.service_loader import SERVICE_LOADER
+from src.app.utility.handler._class.recognition_worker_pool.recognition_worker_pool\
+    import RecognitionWorkerPool
+from src.app.utility.helper._module.speech_recognizer.google.google_speech_recognizer\
+    import recognize_or_apologize
+
+
+def transcribe_sphinx_audio(recognizer: Any, audio: AudioData) -> str:
+    """Recognizes speech offline using CMU Sphinx, without announcing anything.
+
+    It only touches its arguments, so it can run in a recognition worker process.
+
+    Args:
+        - recognizer (Any): The recognizer object used for speech recognition.
+        - audio (AudioData): The audio input to be recognized.
+
+    Returns:
+        - str: The recognized voice input as a string.
+
+    Raises:
+        - UnknownValueError: if query is empty or not understood.
+        - RequestError: if pocketsphinx is not installed.
+    """
+
+    return recognizer.recognize_sphinx(audio)
+
+def sphinx_speech_recognizer(recognizer: Any,
+                             audio: AudioData,
+                             text_to_speech_handler: Any,
+                             should_announce_error_message: bool) -> str:
+    """Recognizes speech offline using CMU Sphinx.
+
+    Args:
+        - recognizer (Any): The recognizer object used for speech recognition.
+        - audio (Any): The audio input to be recognized.
+        - text_to_speech_handler (Any): The handler for converting text to speech.
+        - should_announce_error_message (str): To control the flow of error messages.
+
+    Returns:
+        - str: The recognized voice input as a string.
+
+    Raises:
+        - Exception: if query is empty or not understood.
+        - Exception: if pocketsphinx is not installed.
+    """
+
+    _request_error_message: str = (
+        "Offline voice recognition is not available. Please install pocketsphinx.\n")
+
+    def recognize_query() -> str:
+        # The decoding is CPU bound, in a worker process it does not stall the capture.
+        recognition_worker_pool: RecognitionWorkerPool = SERVICE_LOADER.get_service(
+            "recognition_worker_pool")
+
+        return recognition_worker_pool.recognize(
+            recognize_audio=transcribe_sphinx_audio, recognizer=recognizer, audio=audio)
+
+    return recognize_or_apologize(recognize_query=recognize_query,
+                                  text_to_speech_handler=text_to_speech_handler,
+                                  should_announce_error_message=should_announce_error_message,
+                                  request_error_message=_request_error_message)